@@ -11,6 +11,7 @@ import { EventLog } from "../models/EventLog";
 import { Auction } from "../models/Auction";
 import { badRequest, notFound } from "../utils/errors";
 import { isValidObjectId } from "../utils/validation";
+import { getBidQueueStats } from "../services/bidQueue";
 
 const router = Router();
 
@@ -290,4 +291,14 @@ router.get(
   })
 );
 
+// Bid queue depth (used by load tests to detect a growing backlog)
+router.get(
+  "/admin/queue-stats",
+  requireAuth,
+  requireRole("admin"),
+  asyncHandler(async (_req, res) => {
+    res.json(await getBidQueueStats());
+  })
+);
+
 export { router as adminRoutes };
@@ -0,0 +1,18 @@
+"""
+Генератор нагрузки на API ставок.
+
+Открытая модель нагрузки: запросы отправляются по расписанию прибытия
+(фиксированный темп или пуассоновский поток), независимо от того, ответил
+ли сервер на предыдущие. Задержка считается от запланированного момента
+отправки, поэтому очередь перед сервером попадает в замер (без
+coordinated omission).
+"""
+from bidload.histogram import Histogram
+from bidload.schedule import fixed_schedule, poisson_schedule, make_schedule
+
+__all__ = [
+    "Histogram",
+    "fixed_schedule",
+    "poisson_schedule",
+    "make_schedule",
+]
@@ -0,0 +1,382 @@
+"""
+Запуск:
+    python -m bidload run --rate 200 --duration 30
+    python -m bidload run --rate 500 --duration 60 --schedule poisson --auction-id <id>
+    python -m bidload probe --rate 100 --duration 30
+    python -m bidload merge worker-*.json --output total.json --csv total.csv
+    python -m bidload distributed --workers 8 --rate 2000 --duration 60
+    python -m bidload capacity --soak 60 --slo-p99-ms 500 --label "$(git rev-parse --short HEAD)"
+"""
+import os
+import sys
+import json
+import math
+import asyncio
+import argparse
+from datetime import datetime, timezone
+
+import aiohttp
+
+from bidload.capacity import SLO, QueueMonitor, Trial, search
+from bidload.distributed import Coordinator, DistributedError, make_task_factory, parse_address, run_agent
+from bidload.histogram import Histogram
+from bidload.loadgen import AmountSequence, LoadResult, run_load
+from bidload.probe import BroadcastProbe, ProbeResult
+from bidload.provision import ProvisionError, login, create_auction, create_bidders, wait_for_active
+from bidload.schedule import SCHEDULES, make_schedule
+
+
+def add_common_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--api-url", default=os.getenv("API_URL", "http://localhost:3000"),
+                        help="URL бэкенда")
+    parser.add_argument("--admin-username", default=os.getenv("ADMIN_USERNAME", "admin"))
+    parser.add_argument("--admin-password", default=os.getenv("ADMIN_PASSWORD", "admin123"))
+    parser.add_argument("--auction-id", help="Активный аукцион (по умолчанию создаётся новый)")
+    parser.add_argument("--currency", default="TON", choices=["TON", "USDT"])
+    parser.add_argument("--users", type=int, default=0,
+                        help="Участников (по умолчанию - по лимиту одной ставки в --user-interval-ms)")
+    parser.add_argument("--user-interval-ms", type=int, default=int(os.getenv("BID_RATE_LIMIT_MS", "50")),
+                        help="Лимит бэкенда между ставками одного участника (BID_RATE_LIMIT_MS)")
+    parser.add_argument("--schedule", choices=SCHEDULES, default="fixed",
+                        help="fixed - равномерно, poisson - пуассоновский поток")
+    parser.add_argument("--seed", type=int, help="Seed пуассоновского расписания")
+    parser.add_argument("--max-connections", type=int, default=1000)
+    parser.add_argument("--timeout", type=float, default=10, help="Таймаут запроса, с")
+    parser.add_argument("--output", help="Записать результаты в JSON")
+    parser.add_argument("--csv", help="Записать гистограмму задержек в CSV (бакеты и CDF)")
+
+
+def positive_float(value: str) -> float:
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"должно быть больше нуля: {value}")
+    return number
+
+
+def write_csv(path: str, histogram: Histogram) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(histogram.to_csv())
+
+
+def users_needed(rate: float, interval_ms: int) -> int:
+    """Участники по кругу: интервал между ставками одного - вдвое больше лимита."""
+    return max(10, math.ceil(rate * interval_ms / 1000 * 2))
+
+
+async def prepare(args, session: aiohttp.ClientSession, rate: float, planned: int):
+    """Аукцион, участники и суммы ставок для прогона с планом planned запросов."""
+    admin_token = await login(session, args.api_url, args.admin_username, args.admin_password)
+    if args.auction_id:
+        auction = await wait_for_active(session, args.api_url, args.auction_id, timeout=1)
+        auction_id = args.auction_id
+    else:
+        auction_id = await create_auction(session, args.api_url, admin_token, args.currency)
+        auction = await wait_for_active(session, args.api_url, auction_id)
+    amounts = AmountSequence(str(auction.get("currentMinBid") or "1"), str(auction.get("minIncrement") or "0.1"))
+    # Суммы растут на протяжении всего прогона - баланса должно хватить на последнюю ставку
+    funding = {args.currency: str(amounts.amount_after(planned))}
+    count = args.users or users_needed(rate, args.user_interval_ms)
+    users = await create_bidders(session, args.api_url, admin_token, count, funding)
+    return admin_token, auction_id, users, amounts
+
+
+async def command_run(args) -> int:
+    async with aiohttp.ClientSession() as session:
+        try:
+            # Запас на пуассоновское расписание
+            planned = int(args.rate * args.duration * 1.2) + 100
+            _, auction_id, users, amounts = await prepare(args, session, args.rate, planned)
+        except (ProvisionError, aiohttp.ClientError) as e:
+            print(f"✗ Подготовка не удалась: {e}", file=sys.stderr)
+            return 2
+
+    print(f"Аукцион {auction_id}, участников: {len(users)}, "
+          f"{args.schedule} {args.rate} rps x {args.duration}s")
+    result = await run_load(
+        args.api_url, auction_id, users,
+        make_schedule(args.schedule, args.rate, args.duration, args.seed),
+        amounts,
+        max_connections=args.max_connections,
+        timeout=args.timeout
+    )
+    for line in result.format_lines():
+        print(line)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"auction_id": auction_id, **result.to_dict()}, f, indent=2, ensure_ascii=False)
+    if args.csv:
+        write_csv(args.csv, result.latency)
+    return 0
+
+
+async def command_probe(args) -> int:
+    """Нагрузка + WebSocket-слушатель: задержка от POST до bid.updated."""
+    async with aiohttp.ClientSession() as session:
+        try:
+            planned = int(args.rate * args.duration * 1.2) + 100
+            _, auction_id, users, amounts = await prepare(args, session, args.rate, planned)
+            probe = BroadcastProbe(args.api_url, auction_id, users[0]["token"], grace=args.grace)
+            await probe.connect(session)
+        except (ProvisionError, aiohttp.ClientError, ConnectionError, asyncio.TimeoutError) as e:
+            print(f"✗ Подготовка не удалась: {e}", file=sys.stderr)
+            return 2
+
+        print(f"Аукцион {auction_id}, участников: {len(users)}, "
+              f"{args.schedule} {args.rate} rps x {args.duration}s, WebSocket подключён")
+        result = await run_load(
+            args.api_url, auction_id, users,
+            make_schedule(args.schedule, args.rate, args.duration, args.seed),
+            amounts,
+            max_connections=args.max_connections,
+            timeout=args.timeout,
+            on_send=probe.on_send,
+            on_result=probe.on_result
+        )
+        probe_result = await probe.finish()
+
+    for line in result.format_lines() + probe_result.format_lines():
+        print(line)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {"auction_id": auction_id, **result.to_dict(), "broadcast": probe_result.to_dict()},
+                f, indent=2, ensure_ascii=False
+            )
+    if args.csv:
+        write_csv(args.csv, probe_result.latency)
+    return 0
+
+
+async def command_distributed(args) -> int:
+    """Прогон run, разделённый между несколькими процессами-агентами."""
+    agents = args.workers + args.remote_agents
+    if agents < 1:
+        print("✗ Нужен хотя бы один агент (--workers или --remote-agents)", file=sys.stderr)
+        return 2
+    # У каждого агента свои участники: их должно хватать на его долю интенсивности
+    if not args.users:
+        args.users = users_needed(args.rate / agents, args.user_interval_ms) * agents
+    async with aiohttp.ClientSession() as session:
+        try:
+            planned = int(args.rate * args.duration * 1.2) + 100 + agents
+            _, auction_id, users, amounts = await prepare(args, session, args.rate, planned)
+        except (ProvisionError, aiohttp.ClientError) as e:
+            print(f"✗ Подготовка не удалась: {e}", file=sys.stderr)
+            return 2
+
+    print(f"Аукцион {auction_id}, участников: {len(users)}, "
+          f"{args.schedule} {args.rate} rps x {args.duration}s на {agents} агентов")
+    host, port = parse_address(args.listen) if args.listen else ("127.0.0.1", 0)
+    coordinator = Coordinator(
+        local_workers=args.workers,
+        remote_agents=args.remote_agents,
+        host=host,
+        port=port,
+        connect_timeout=args.connect_timeout
+    )
+    try:
+        result = await coordinator.run(make_task_factory(
+            args.api_url, auction_id, users, args.rate, args.duration, args.schedule, amounts,
+            seed=args.seed, max_connections=args.max_connections, timeout=args.timeout
+        ))
+    except (DistributedError, OSError) as e:
+        print(f"✗ Распределённый прогон не удался: {e}", file=sys.stderr)
+        return 2
+
+    for line in result.format_lines():
+        print(line)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"auction_id": auction_id, "agents": agents, **result.to_dict()},
+                      f, indent=2, ensure_ascii=False)
+    if args.csv:
+        write_csv(args.csv, result.latency)
+    return 0
+
+
+async def command_agent(args) -> int:
+    host, port = parse_address(args.connect)
+    try:
+        return await run_agent(host, port)
+    except OSError as e:
+        print(f"✗ Нет связи с координатором {args.connect}: {e}", file=sys.stderr)
+        return 2
+
+
+async def command_capacity(args) -> int:
+    """Бинарный поиск наибольшей интенсивности, устойчивой в течение --soak секунд."""
+    slo = SLO(p99_ms=args.slo_p99_ms, max_queue_growth=args.max_queue_growth,
+              min_accepted_ratio=args.min_accepted_ratio, max_failed_ratio=args.max_failed_ratio,
+              max_missing_ratio=args.max_missing_ratio)
+
+    async with aiohttp.ClientSession() as session:
+        async def trial(rate: float) -> Trial:
+            # Новый аукцион и новые участники на каждую пробу: балансы и лимиты не переносятся
+            planned = int(rate * args.soak * 1.2) + 100
+            admin_token, auction_id, users, amounts = await prepare(args, session, rate, planned)
+            monitor = QueueMonitor(session, args.api_url, admin_token)
+            if not await monitor.drain(args.drain_timeout):
+                print("⚠ Очередь ставок не опустела перед пробой", file=sys.stderr)
+            probe = BroadcastProbe(args.api_url, auction_id, users[0]["token"], grace=args.grace)
+            await probe.connect(session)
+            monitor.start()
+            result = await run_load(
+                args.api_url, auction_id, users,
+                make_schedule(args.schedule, rate, args.soak, args.seed),
+                amounts,
+                max_connections=args.max_connections,
+                timeout=args.timeout,
+                on_send=probe.on_send,
+                on_result=probe.on_result
+            )
+            samples = await monitor.stop()
+            probe_result = await probe.finish()
+            return Trial(rate, result, probe_result, samples).evaluate(slo)
+
+        print(f"Поиск в [{args.min_rate:g}, {args.max_rate:g}] rps, окно {args.soak:g}s, "
+              f"SLO: p99 POST→WS <= {slo.p99_ms:g} мс, очередь <= {slo.max_queue_growth:g} задач/с, без 5xx, "
+              f"принято >= {slo.min_accepted_ratio:.0%}, bid.failed <= {slo.max_failed_ratio:.0%}")
+        try:
+            best, trials = await search(
+                trial, args.min_rate, args.max_rate, args.precision,
+                on_trial=lambda t: print(t.format_line())
+            )
+        except (ProvisionError, aiohttp.ClientError, ConnectionError, asyncio.TimeoutError) as e:
+            print(f"✗ Проба не удалась: {e}", file=sys.stderr)
+            return 2
+
+    print(f"Максимальная устойчивая интенсивность: {best:.1f} rps")
+    record = {
+        "label": args.label,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "max_sustainable_rps": round(best, 1),
+        "soak_s": args.soak,
+        "slo": {
+            "p99_ms": slo.p99_ms,
+            "max_queue_growth": slo.max_queue_growth,
+            "min_accepted_ratio": slo.min_accepted_ratio,
+            "max_failed_ratio": slo.max_failed_ratio,
+            "max_missing_ratio": slo.max_missing_ratio,
+        },
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({**record, "trials": [t.to_dict() for t in trials]}, f, indent=2, ensure_ascii=False)
+    if args.history:
+        with open(args.history, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    if args.csv and best > 0:
+        # Распределение на найденной интенсивности
+        write_csv(args.csv, next(t for t in reversed(trials) if t.passed and t.rate == best).probe.latency)
+    return 0 if best > 0 else 1
+
+
+async def command_merge(args) -> int:
+    """Объединить JSON-результаты нескольких процессов (гистограммы - без потерь)."""
+    result = LoadResult()
+    broadcast = None
+    for path in args.inputs:
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            result.merge(LoadResult.from_dict(data))
+            if data.get("broadcast"):
+                broadcast = (broadcast or ProbeResult()).merge(ProbeResult.from_dict(data["broadcast"]))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"✗ {path}: {e}", file=sys.stderr)
+            return 2
+
+    print(f"Объединено результатов: {len(args.inputs)}")
+    lines = result.format_lines()
+    if broadcast is not None:
+        lines += broadcast.format_lines()
+    for line in lines:
+        print(line)
+    if args.output:
+        data = result.to_dict()
+        if broadcast is not None:
+            data["broadcast"] = broadcast.to_dict()
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    if args.csv:
+        write_csv(args.csv, broadcast.latency if broadcast is not None else result.latency)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m bidload",
+        description="Нагрузка на API ставок с открытой моделью прибытия"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Ставки с заданной интенсивностью")
+    add_common_arguments(run)
+    run.add_argument("--rate", type=float, required=True, help="Запросов в секунду")
+    run.add_argument("--duration", type=float, default=30, help="Длительность, с")
+    run.set_defaults(handler=command_run)
+
+    probe = commands.add_parser("probe", help="Задержка от постановки ставки в очередь до broadcast")
+    add_common_arguments(probe)
+    probe.add_argument("--rate", type=float, default=50, help="Ставок в секунду (каждая сопоставляется с broadcast)")
+    probe.add_argument("--duration", type=float, default=30, help="Длительность, с")
+    probe.add_argument("--grace", type=float, default=10,
+                       help="Сколько ждать broadcast после последней ставки, с")
+    probe.set_defaults(handler=command_probe)
+
+    distributed = commands.add_parser("distributed", help="Прогон run на нескольких процессах и машинах")
+    add_common_arguments(distributed)
+    distributed.add_argument("--rate", type=float, required=True, help="Суммарная интенсивность, запросов в секунду")
+    distributed.add_argument("--duration", type=float, default=30, help="Длительность, с")
+    distributed.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                             help="Локальных процессов-агентов (по умолчанию - по числу ядер)")
+    distributed.add_argument("--remote-agents", type=int, default=0,
+                             help="Сколько ждать агентов с других машин (python -m bidload agent)")
+    distributed.add_argument("--listen", help="Адрес координатора host:port (для удалённых агентов - 0.0.0.0:<port>)")
+    distributed.add_argument("--connect-timeout", type=float, default=30,
+                             help="Сколько ждать подключения всех агентов, с")
+    distributed.set_defaults(handler=command_distributed)
+
+    agent = commands.add_parser("agent", help="Агент распределённого прогона")
+    agent.add_argument("--connect", required=True, help="Адрес координатора host:port")
+    agent.set_defaults(handler=command_agent)
+
+    capacity = commands.add_parser("capacity", help="Максимальная устойчивая интенсивность ставок под SLO")
+    add_common_arguments(capacity)
+    capacity.add_argument("--soak", type=float, default=60, help="Длительность каждой пробы, с")
+    capacity.add_argument("--min-rate", type=float, default=10, help="Нижняя граница поиска, rps")
+    capacity.add_argument("--max-rate", type=float, default=2000, help="Верхняя граница поиска, rps")
+    capacity.add_argument("--precision", type=positive_float, default=5, help="Точность результата, rps")
+    capacity.add_argument("--slo-p99-ms", type=float, default=1000, help="Порог p99 задержки POST→WS, мс")
+    capacity.add_argument("--max-queue-growth", type=float, default=1.0,
+                          help="Допустимый рост очереди BullMQ (waiting), задач/с")
+    capacity.add_argument("--min-accepted-ratio", type=float, default=0.99,
+                          help="Минимальная доля принятых ставок (ok от отправленных)")
+    capacity.add_argument("--max-failed-ratio", type=float, default=0.01,
+                          help="Допустимая доля bid.failed среди поставленных в очередь")
+    capacity.add_argument("--max-missing-ratio", type=float, default=0.0,
+                          help="Допустимая доля ставок без broadcast")
+    capacity.add_argument("--grace", type=float, default=10,
+                          help="Сколько ждать broadcast после последней ставки, с")
+    capacity.add_argument("--drain-timeout", type=float, default=60,
+                          help="Сколько ждать опустошения очереди перед пробой, с")
+    capacity.add_argument("--label", default=os.getenv("BUILD_LABEL", ""),
+                          help="Метка сборки в результате (коммит, версия)")
+    capacity.add_argument("--history", help="Дописать результат строкой JSON (история по релизам)")
+    capacity.set_defaults(handler=command_capacity)
+
+    merge = commands.add_parser("merge", help="Объединить результаты (--output) нескольких процессов")
+    merge.add_argument("inputs", nargs="+", help="JSON-файлы результатов run/probe")
+    merge.add_argument("--output", help="Записать объединённый результат в JSON")
+    merge.add_argument("--csv", help="Записать объединённую гистограмму в CSV")
+    merge.set_defaults(handler=command_merge)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return asyncio.run(args.handler(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+"""
+Поиск предельной устойчивой интенсивности ставок.
+
+`testRPSLimit` и `testConcurrentBiddersLimit` в scripts/auto-test.ts
+поднимают нагрузку ступенями и останавливаются на первой ступени с
+ошибками - это предел на короткой вспышке. Здесь интенсивность ищется
+бинарным поиском, и каждая проба держится soak-окно: интенсивность
+устойчива, если за всё окно выполнены все условия SLO:
+
+    - p99 задержки от POST до bid.updated по WebSocket не выше порога;
+    - очередь ставок BullMQ (waiting) не растёт: наклон линейной
+      регрессии waiting по времени не больше порога, задач/с;
+    - нет ответов 5xx и сетевых ошибок;
+    - доля принятых ставок (ok от отправленных) не ниже порога: отказы 4xx
+      ("Too many bid attempts", нехватка баланса) тоже делают пробу неустойчивой;
+    - доля bid.failed среди поставленных в очередь не выше порога;
+    - доля ставок без broadcast не выше порога.
+
+Сначала интенсивность удваивается от нижней границы до первой неудачи,
+затем отрезок между последней устойчивой и первой неустойчивой делится
+пополам до заданной точности.
+"""
+import asyncio
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+import aiohttp
+
+from bidload.loadgen import LoadResult
+from bidload.probe import ProbeResult
+from bidload.provision import ProvisionError, queue_stats
+
+
+@dataclass
+class SLO:
+    """Условия устойчивости пробы."""
+
+    p99_ms: float = 1000.0
+    max_queue_growth: float = 1.0
+    min_accepted_ratio: float = 0.99
+    max_failed_ratio: float = 0.01
+    max_missing_ratio: float = 0.0
+
+
+def queue_growth(samples: List[Tuple[float, int]]) -> float:
+    """Наклон waiting по времени (задач/с), метод наименьших квадратов."""
+    if len(samples) < 2:
+        return 0.0
+    n = len(samples)
+    mean_t = sum(t for t, _ in samples) / n
+    mean_w = sum(w for _, w in samples) / n
+    spread = sum((t - mean_t) ** 2 for t, _ in samples)
+    if spread == 0:
+        return 0.0
+    return sum((t - mean_t) * (w - mean_w) for t, w in samples) / spread
+
+
+class QueueMonitor:
+    """Опрос /api/admin/queue-stats раз в interval секунд во время пробы."""
+
+    def __init__(self, session: aiohttp.ClientSession, api_url: str, admin_token: str,
+                 interval: float = 1.0):
+        self.session = session
+        self.api_url = api_url
+        self.admin_token = admin_token
+        self.interval = interval
+        self.samples: List[Tuple[float, int]] = []
+        self.errors = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _poll(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                stats = await queue_stats(self.session, self.api_url, self.admin_token)
+                self.samples.append((loop.time(), int(stats["waiting"])))
+            except (ProvisionError, aiohttp.ClientError, asyncio.TimeoutError, KeyError):
+                self.errors += 1
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._poll())
+
+    async def stop(self) -> List[Tuple[float, int]]:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        return self.samples
+
+    async def drain(self, timeout: float = 60) -> bool:
+        """Дождаться пустой очереди (waiting и active) - перед следующей пробой."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
+            try:
+                stats = await queue_stats(self.session, self.api_url, self.admin_token)
+                if not stats["waiting"] and not stats["active"]:
+                    return True
+            except (ProvisionError, aiohttp.ClientError, asyncio.TimeoutError, KeyError):
+                pass
+            await asyncio.sleep(self.interval)
+        return False
+
+
+@dataclass
+class Trial:
+    """Одна проба интенсивности."""
+
+    rate: float
+    result: LoadResult
+    probe: ProbeResult
+    queue_samples: List[Tuple[float, int]] = field(default_factory=list)
+    failures: List[str] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return not self.failures
+
+    @property
+    def queue_growth(self) -> float:
+        # Первая четверть окна - разгон: очередь набирает рабочую глубину
+        return queue_growth(self.queue_samples[len(self.queue_samples) // 4:])
+
+    @property
+    def accepted_ratio(self) -> float:
+        """Доля ставок, принятых в очередь (ok), от отправленных."""
+        return self.result.ok / self.result.sent if self.result.sent else 0.0
+
+    @property
+    def failed_ratio(self) -> float:
+        """Доля bid.failed среди поставленных в очередь."""
+        return self.probe.failed / self.result.ok if self.result.ok else 0.0
+
+    def evaluate(self, slo: SLO) -> "Trial":
+        """Заполнить failures по условиям SLO."""
+        self.failures = []
+        p99 = self.probe.latency.percentile(99) / 1000
+        if self.probe.latency.count == 0:
+            self.failures.append("нет ни одного broadcast")
+        elif p99 > slo.p99_ms:
+            self.failures.append(f"p99 POST→WS {p99:.0f} мс > {slo.p99_ms:g} мс")
+        growth = self.queue_growth
+        if growth > slo.max_queue_growth:
+            self.failures.append(f"очередь растёт на {growth:.1f} задач/с")
+        errors = sum(
+            count for outcome, count in self.result.outcomes.items()
+            if outcome != "ok" and not outcome[:1] == "4"
+        )
+        if errors:
+            self.failures.append(f"{errors} ответов 5xx и сетевых ошибок")
+        if self.accepted_ratio < slo.min_accepted_ratio:
+            self.failures.append(f"принято {self.accepted_ratio:.1%} ставок < {slo.min_accepted_ratio:.1%}")
+        if self.failed_ratio > slo.max_failed_ratio:
+            self.failures.append(f"bid.failed {self.failed_ratio:.1%} > {slo.max_failed_ratio:.1%}")
+        sent = max(self.result.sent, 1)
+        if self.probe.missing / sent > slo.max_missing_ratio:
+            self.failures.append(f"{self.probe.missing} ставок без broadcast")
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            "rate": self.rate,
+            "passed": self.passed,
+            "failures": self.failures,
+            "queue_growth": round(self.queue_growth, 2),
+            "queue_max_waiting": max((w for _, w in self.queue_samples), default=0),
+            "accepted_ratio": round(self.accepted_ratio, 4),
+            "failed_ratio": round(self.failed_ratio, 4),
+            "load": self.result.to_dict(),
+            "broadcast": self.probe.to_dict(),
+        }
+
+    def format_line(self) -> str:
+        p99 = self.probe.latency.percentile(99) / 1000
+        mark = "✓" if self.passed else "✗"
+        line = (f"{mark} {self.rate:8.1f} rps: p99 POST→WS {p99:.0f} мс, "
+                f"очередь {self.queue_growth:+.1f} задач/с, "
+                f"принято {self.accepted_ratio:.1%}, bid.failed {self.failed_ratio:.1%}")
+        if self.failures:
+            line += " - " + "; ".join(self.failures)
+        return line
+
+
+async def search(
+    trial: Callable[[float], Awaitable[Trial]],
+    min_rate: float,
+    max_rate: float,
+    precision: float,
+    on_trial: Optional[Callable[[Trial], None]] = None
+) -> Tuple[float, List[Trial]]:
+    """
+    Наибольшая устойчивая интенсивность в [min_rate, max_rate] с точностью
+    precision rps (больше нуля). Возвращает (интенсивность, пробы); 0, если не устойчива
+    даже min_rate.
+    """
+    if precision <= 0:
+        raise ValueError("precision must be positive")
+    trials: List[Trial] = []
+
+    async def attempt(rate: float) -> bool:
+        result = await trial(rate)
+        trials.append(result)
+        if on_trial is not None:
+            on_trial(result)
+        return result.passed
+
+    if not await attempt(min_rate):
+        return 0.0, trials
+    best, failed = min_rate, None
+    # Удвоение до первой неудачи
+    while failed is None and best < max_rate:
+        rate = min(best * 2, max_rate)
+        if await attempt(rate):
+            best = rate
+        else:
+            failed = rate
+    if failed is None:
+        return best, trials
+    # Деление пополам
+    while failed - best > precision:
+        rate = (best + failed) / 2
+        # Отрезок меньше точности float - делить дальше нечего
+        if rate in (best, failed):
+            break
+        if await attempt(rate):
+            best = rate
+        else:
+            failed = rate
+    return best, trials
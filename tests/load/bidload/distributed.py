@@ -0,0 +1,241 @@
+"""
+Распределённый прогон: координатор и агенты.
+
+Один процесс генератора упирается в CPU (разбор JSON, keep-alive, asyncio)
+раньше, чем бэкенд. Координатор раздаёт нагрузку нескольким агентам -
+локальным процессам, которые он запускает сам, и агентам на других машинах
+(`python -m bidload agent --connect host:port`):
+
+    1. агент подключается и отправляет hello;
+    2. координатор отправляет задачу: свою часть участников, долю
+       интенсивности, начальную сумму и шаг сумм;
+    3. агент готовит расписание и отвечает ready;
+    4. когда готовы все (барьер), координатор рассылает общий момент старта
+       по time.time() - агенты начинают одновременно;
+    5. агент присылает результат (LoadResult.to_dict с гистограммами),
+       координатор объединяет их без потерь.
+
+Протокол - строки JSON по TCP. Для агентов на других машинах часы должны
+быть синхронизированы (NTP): момент старта - абсолютное время.
+"""
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+from pathlib import Path
+from decimal import Decimal
+from typing import Callable, List, Optional, Tuple
+
+from bidload.loadgen import AmountSequence, LoadResult, run_load
+from bidload.schedule import make_schedule
+
+
+# Задача агента несёт токены его участников - до нескольких мегабайт
+MAX_MESSAGE = 64 * 1024 * 1024
+
+
+class DistributedError(Exception):
+    """Агент не подключился, не выполнил задачу или разорвал соединение."""
+
+
+async def send(writer: asyncio.StreamWriter, message: dict) -> None:
+    writer.write(json.dumps(message).encode("utf-8") + b"\n")
+    await writer.drain()
+
+
+async def receive(reader: asyncio.StreamReader, expected: str) -> dict:
+    line = await reader.readline()
+    if not line:
+        raise DistributedError(f"Соединение закрыто, ожидалось {expected}")
+    message = json.loads(line)
+    if message.get("type") == "error":
+        raise DistributedError(message.get("error", "ошибка агента"))
+    if message.get("type") != expected:
+        raise DistributedError(f"Ожидалось {expected}, получено {message.get('type')}")
+    return message
+
+
+def shard_amounts(start: str, step: str, index: int, total: int) -> Tuple[str, str]:
+    """
+    Суммы агента index из total: start + index*step, шаг total*step.
+    Суммы разных агентов чередуются и не совпадают.
+    """
+    step = Decimal(step)
+    return str(Decimal(start) + step * index), str(step * total)
+
+
+class Coordinator:
+    """
+    Координатор прогона.
+
+    Пример:
+        coordinator = Coordinator(local_workers=8)
+        result = await coordinator.run(lambda index, total: {...задача...})
+    """
+
+    def __init__(
+        self,
+        local_workers: int = os.cpu_count() or 1,
+        remote_agents: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        start_delay: float = 1.0,
+        connect_timeout: float = 30
+    ):
+        if local_workers + remote_agents < 1:
+            raise ValueError("At least one agent is required")
+        self.local_workers = local_workers
+        self.remote_agents = remote_agents
+        self.host = host
+        self.port = port
+        self.start_delay = start_delay
+        self.connect_timeout = connect_timeout
+        self.agents: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._connected = asyncio.Event()
+        self._processes: List[asyncio.subprocess.Process] = []
+
+    @property
+    def total(self) -> int:
+        return self.local_workers + self.remote_agents
+
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        if len(self.agents) >= self.total:
+            writer.close()
+            return
+        self.agents.append((reader, writer))
+        if len(self.agents) == self.total:
+            self._connected.set()
+
+    async def _spawn_local(self, port: int) -> None:
+        # python -m bidload из каталога tests/load
+        cwd = Path(__file__).resolve().parent.parent
+        for _ in range(self.local_workers):
+            self._processes.append(await asyncio.create_subprocess_exec(
+                sys.executable, "-m", "bidload", "agent", "--connect", f"127.0.0.1:{port}",
+                cwd=str(cwd)
+            ))
+
+    async def run(self, make_task: Callable[[int, int], dict]) -> LoadResult:
+        """
+        Дождаться агентов, раздать задачи make_task(index, total), запустить
+        всех одновременно и объединить результаты.
+        """
+        server = await asyncio.start_server(self._accept, self.host, self.port, limit=MAX_MESSAGE)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            if self.remote_agents:
+                print(f"Ожидание агентов: python -m bidload agent --connect {socket.gethostname()}:{port}")
+            await self._spawn_local(port)
+            try:
+                await asyncio.wait_for(self._connected.wait(), self.connect_timeout)
+            except asyncio.TimeoutError:
+                raise DistributedError(
+                    f"Подключилось {len(self.agents)} агентов из {self.total} за {self.connect_timeout:g}s"
+                )
+
+            hellos = await asyncio.gather(*(receive(reader, "hello") for reader, _ in self.agents))
+            for index, (_, writer) in enumerate(self.agents):
+                await send(writer, {"type": "task", **make_task(index, self.total)})
+            # Барьер: старт только когда все агенты подготовили расписание
+            await asyncio.gather(*(receive(reader, "ready") for reader, _ in self.agents))
+            start_at = time.time() + self.start_delay
+            for _, writer in self.agents:
+                await send(writer, {"type": "start", "start_at": start_at})
+            print(f"Агентов: {self.total} ({', '.join(sorted({h.get('host', '?') for h in hellos}))}), "
+                  f"старт через {self.start_delay:g}s")
+
+            messages = await asyncio.gather(*(receive(reader, "result") for reader, _ in self.agents))
+            result = LoadResult()
+            for message in messages:
+                result.merge(LoadResult.from_dict(message["result"]))
+            return result
+        finally:
+            for _, writer in self.agents:
+                writer.close()
+            server.close()
+            await server.wait_closed()
+            await self._reap()
+
+    async def _reap(self) -> None:
+        for process in self._processes:
+            try:
+                await asyncio.wait_for(process.wait(), 5)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+
+
+async def run_agent(host: str, port: int) -> int:
+    """Агент: выполнить одну задачу координатора."""
+    reader, writer = await asyncio.open_connection(host, port, limit=MAX_MESSAGE)
+    try:
+        await send(writer, {"type": "hello", "host": socket.gethostname(), "pid": os.getpid()})
+        task = await receive(reader, "task")
+        try:
+            # Сдвиг фазы: равномерные расписания агентов не совпадают по времени
+            schedule = [
+                offset + task["phase"]
+                for offset in make_schedule(task["schedule"], task["rate"], task["duration"], task.get("seed"))
+            ]
+            amounts = AmountSequence(task["amount_start"], task["amount_step"])
+        except (KeyError, ValueError) as e:
+            await send(writer, {"type": "error", "error": f"Неверная задача: {e}"})
+            return 2
+        await send(writer, {"type": "ready"})
+        start = await receive(reader, "start")
+        result = await run_load(
+            task["api_url"], task["auction_id"], task["users"], schedule, amounts,
+            max_connections=task.get("max_connections", 1000),
+            timeout=task.get("timeout", 10),
+            start_at=start["start_at"]
+        )
+        await send(writer, {"type": "result", "result": result.to_dict()})
+        return 0
+    except (DistributedError, ConnectionError) as e:
+        print(f"✗ Агент {os.getpid()}: {e}", file=sys.stderr)
+        return 2
+    finally:
+        writer.close()
+
+
+def parse_address(value: str, default_host: str = "127.0.0.1") -> Tuple[str, int]:
+    """'host:port' или 'port'."""
+    host, _, port = value.rpartition(":")
+    return host or default_host, int(port)
+
+
+def make_task_factory(
+    api_url: str,
+    auction_id: str,
+    users: List[dict],
+    rate: float,
+    duration: float,
+    schedule: str,
+    amounts: AmountSequence,
+    seed: Optional[int] = None,
+    max_connections: int = 1000,
+    timeout: float = 10
+) -> Callable[[int, int], dict]:
+    """Задачи агентов: участники по модулю, равные доли интенсивности и чередующиеся суммы."""
+    base = amounts.current
+
+    def make_task(index: int, total: int) -> dict:
+        amount_start, amount_step = shard_amounts(str(base), str(amounts.step), index, total)
+        return {
+            "api_url": api_url,
+            "auction_id": auction_id,
+            "users": users[index::total],
+            "rate": rate / total,
+            "duration": duration,
+            "schedule": schedule,
+            "seed": None if seed is None else seed + index,
+            "phase": index / rate,
+            "amount_start": amount_start,
+            "amount_step": amount_step,
+            "max_connections": max(1, max_connections // total),
+            "timeout": timeout,
+        }
+
+    return make_task
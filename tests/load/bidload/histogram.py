@@ -0,0 +1,225 @@
+"""
+Гистограмма задержек с логарифмическими бакетами фиксированного размера
+(в духе HdrHistogram).
+
+Значения - целые микросекунды. До 2**SUB_BUCKET_BITS мкс бакет на каждое
+значение, дальше каждая степень двойки делится на 2**(SUB_BUCKET_BITS-1)
+бакетов: относительная ошибка не больше 1/2**(SUB_BUCKET_BITS-1) (< 1.6%
+при 7 битах). Память не зависит от числа замеров: 1728 счётчиков.
+
+Гистограммы разных процессов (воркеров, агентов) объединяются без потерь:
+merge складывает счётчики бакетов. Для передачи между процессами есть
+компактная бинарная форма (to_bytes / from_bytes): только непустые бакеты,
+varint-кодирование - обычно сотни байт.
+"""
+import io
+import csv
+import base64
+from typing import Dict, Iterable, List, Tuple
+
+
+SUB_BUCKET_BITS = 7
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+HALF_SUB_BUCKETS = SUB_BUCKETS >> 1
+
+# Верхняя граница значений: 2**32 мкс (~71 мин), больше - в последний бакет
+MAX_VALUE_BITS = 32
+MAX_VALUE = (1 << MAX_VALUE_BITS) - 1
+
+# Заголовок бинарной формы: сигнатура, версия, параметры бакетов
+MAGIC = b"BLH"
+FORMAT_VERSION = 1
+
+
+def bucket_index(value: int) -> int:
+    """Номер бакета для значения в мкс."""
+    if value < SUB_BUCKETS:
+        return max(value, 0)
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return SUB_BUCKETS + (shift - 1) * HALF_SUB_BUCKETS + ((value >> shift) - HALF_SUB_BUCKETS)
+
+
+def bucket_bounds(index: int) -> Tuple[int, int]:
+    """Границы бакета [low, high) в мкс."""
+    if index < SUB_BUCKETS:
+        return index, index + 1
+    shift = (index - SUB_BUCKETS) // HALF_SUB_BUCKETS + 1
+    sub = (index - SUB_BUCKETS) % HALF_SUB_BUCKETS + HALF_SUB_BUCKETS
+    return sub << shift, (sub + 1) << shift
+
+
+BUCKET_COUNT = bucket_index(MAX_VALUE) + 1
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("Truncated histogram blob")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+class Histogram:
+    """Распределение задержек в мкс."""
+
+    def __init__(self):
+        self.counts: List[int] = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, value_us: int, count: int = 1) -> None:
+        value_us = min(max(int(value_us), 0), MAX_VALUE)
+        self.counts[bucket_index(value_us)] += count
+        if self.count == 0 or value_us < self.min:
+            self.min = value_us
+        self.max = max(self.max, value_us)
+        self.count += count
+        self.total += value_us * count
+
+    def record_seconds(self, seconds: float) -> None:
+        self.record(round(seconds * 1_000_000))
+
+    # Объединение
+    def merge(self, other: "Histogram") -> "Histogram":
+        """Добавить замеры другой гистограммы (без потерь точности)."""
+        if other.count == 0:
+            return self
+        for index, bucket in enumerate(other.counts):
+            if bucket:
+                self.counts[index] += bucket
+        self.min = other.min if self.count == 0 else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+        return self
+
+    @classmethod
+    def merged(cls, histograms: Iterable["Histogram"]) -> "Histogram":
+        result = cls()
+        for histogram in histograms:
+            result.merge(histogram)
+        return result
+
+    # Бинарная форма
+    def to_bytes(self) -> bytes:
+        """
+        Заголовок, count/total/min/max и непустые бакеты парами
+        (разница номеров, счётчик), всё varint.
+        """
+        out = bytearray(MAGIC)
+        out += bytes([FORMAT_VERSION, SUB_BUCKET_BITS, MAX_VALUE_BITS])
+        for value in (self.count, self.total, self.min, self.max):
+            _write_varint(out, value)
+        previous = -1
+        for index, bucket in enumerate(self.counts):
+            if bucket:
+                _write_varint(out, index - previous)
+                _write_varint(out, bucket)
+                previous = index
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Histogram":
+        header = len(MAGIC) + 3
+        if data[:len(MAGIC)] != MAGIC or len(data) < header:
+            raise ValueError("Not a histogram blob")
+        version, sub_bits, max_bits = data[len(MAGIC):header]
+        if (version, sub_bits, max_bits) != (FORMAT_VERSION, SUB_BUCKET_BITS, MAX_VALUE_BITS):
+            raise ValueError(
+                f"Incompatible histogram blob: version {version}, buckets {sub_bits}/{max_bits}"
+            )
+        histogram = cls()
+        pos = header
+        histogram.count, pos = _read_varint(data, pos)
+        histogram.total, pos = _read_varint(data, pos)
+        histogram.min, pos = _read_varint(data, pos)
+        histogram.max, pos = _read_varint(data, pos)
+        index = -1
+        while pos < len(data):
+            gap, pos = _read_varint(data, pos)
+            bucket, pos = _read_varint(data, pos)
+            index += gap
+            histogram.counts[index] = bucket
+        return histogram
+
+    def to_base64(self) -> str:
+        """Бинарная форма для JSON."""
+        return base64.b64encode(self.to_bytes()).decode("ascii")
+
+    @classmethod
+    def from_base64(cls, text: str) -> "Histogram":
+        return cls.from_bytes(base64.b64decode(text))
+
+    # Статистика
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> int:
+        """Значение (мкс), не меньше которого q процентов замеров; середина бакета."""
+        if self.count == 0:
+            return 0
+        rank = max(1, -(-self.count * q // 100))
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= rank:
+                low, high = bucket_bounds(index)
+                return min(max((low + high - 1) // 2, self.min), self.max)
+        return self.max
+
+    def cdf(self) -> List[Tuple[int, float]]:
+        """Функция распределения: [(верхняя граница бакета в мкс, доля замеров <= неё)]."""
+        points = []
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            if bucket:
+                seen += bucket
+                points.append((min(bucket_bounds(index)[1] - 1, self.max), seen / self.count))
+        return points
+
+    def to_csv(self) -> str:
+        """
+        CSV по непустым бакетам: границы в мкс, число замеров, накопленное
+        число и доля (CDF).
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(["low_us", "high_us", "count", "cumulative", "fraction"])
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            if bucket:
+                seen += bucket
+                low, high = bucket_bounds(index)
+                writer.writerow([low, high, bucket, seen, f"{seen / self.count:.6f}"])
+        return buffer.getvalue()
+
+    def summary(self, percentiles=(50, 90, 99, 99.9)) -> Dict[str, float]:
+        """Сводка в миллисекундах."""
+        result = {
+            "count": self.count,
+            "min_ms": self.min / 1000,
+            "mean_ms": round(self.mean / 1000, 3),
+            "max_ms": self.max / 1000,
+        }
+        for q in percentiles:
+            result[f"p{q:g}_ms"] = self.percentile(q) / 1000
+        return result
@@ -0,0 +1,208 @@
+"""
+Открытый генератор ставок: POST /api/auctions/:id/bid по расписанию прибытия.
+
+Для каждого запроса известен запланированный момент отправки (intended
+start). Если генератор или сервер не успевают, запрос уходит позже, но
+задержка всё равно считается от запланированного момента:
+
+    latency  = ответ - запланированная отправка  (исправленная, без coordinated omission)
+    service  = ответ - фактическая отправка      (как в closed-loop скриптах)
+    send_lag = фактическая - запланированная     (отставание самого генератора)
+
+Большой send_lag при малом service - узкое место в генераторе, а не в сервере.
+"""
+import asyncio
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Callable, Iterable, List, Optional
+
+import aiohttp
+
+from bidload.histogram import Histogram
+
+
+class AmountSequence:
+    """
+    Возрастающие суммы ставок: каждая следующая ставка на step выше
+    предыдущей, поэтому всегда проходит минимальный порог и уникальна.
+    """
+
+    def __init__(self, start: str = "1", step: str = "0.1"):
+        self.step = Decimal(step)
+        self.current = Decimal(start)
+
+    def next(self) -> str:
+        self.current += self.step
+        return str(self.current.quantize(self.step))
+
+    def amount_after(self, count: int) -> Decimal:
+        """Сумма после count ставок - нужный баланс участника."""
+        return self.current + self.step * count
+
+
+# Гистограммы LoadResult
+HISTOGRAMS = ("latency", "service", "send_lag")
+
+
+@dataclass
+class LoadResult:
+    """Итоги прогона."""
+
+    latency: Histogram = field(default_factory=Histogram)
+    service: Histogram = field(default_factory=Histogram)
+    send_lag: Histogram = field(default_factory=Histogram)
+    outcomes: Counter = field(default_factory=Counter)
+    planned: int = 0
+    sent: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def completed(self) -> int:
+        return sum(self.outcomes.values())
+
+    @property
+    def ok(self) -> int:
+        return self.outcomes.get("ok", 0)
+
+    @property
+    def server_errors(self) -> int:
+        return sum(n for outcome, n in self.outcomes.items() if outcome.startswith("5"))
+
+    def to_dict(self) -> dict:
+        return {
+            "planned": self.planned,
+            "sent": self.sent,
+            "completed": self.completed,
+            "elapsed_s": round(self.elapsed, 3),
+            "throughput_rps": round(self.completed / self.elapsed, 1) if self.elapsed else 0.0,
+            "outcomes": dict(self.outcomes),
+            "latency": self.latency.summary(),
+            "service": self.service.summary(),
+            "send_lag": self.send_lag.summary(),
+            "histograms": {name: getattr(self, name).to_base64() for name in HISTOGRAMS},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LoadResult":
+        """Результат из to_dict (JSON другого процесса); гистограммы - без потерь."""
+        histograms = data.get("histograms") or {}
+        return cls(
+            **{name: Histogram.from_base64(histograms[name]) for name in HISTOGRAMS if name in histograms},
+            outcomes=Counter(data.get("outcomes") or {}),
+            planned=data.get("planned", 0),
+            sent=data.get("sent", 0),
+            elapsed=data.get("elapsed_s", 0.0),
+        )
+
+    def merge(self, other: "LoadResult") -> "LoadResult":
+        """
+        Добавить результат параллельного процесса: гистограммы и счётчики
+        складываются, длительность - наибольшая из двух.
+        """
+        for name in HISTOGRAMS:
+            getattr(self, name).merge(getattr(other, name))
+        self.outcomes.update(other.outcomes)
+        self.planned += other.planned
+        self.sent += other.sent
+        self.elapsed = max(self.elapsed, other.elapsed)
+        return self
+
+    def format_lines(self) -> List[str]:
+        data = self.to_dict()
+        lines = [
+            f"Запросов: {data['completed']}/{data['planned']} за {data['elapsed_s']}s "
+            f"({data['throughput_rps']} rps)",
+        ]
+        for outcome, count in self.outcomes.most_common():
+            lines.append(f"  {count:8d}  {outcome}")
+        lines.append(f"{'':12}{'p50':>9}{'p90':>9}{'p99':>9}{'p99.9':>9}{'max':>9}  мс")
+        for name, title in (("latency", "исправл."), ("service", "сервис"), ("send_lag", "отставание")):
+            s = data[name]
+            lines.append(
+                f"{title:12}{s['p50_ms']:9.1f}{s['p90_ms']:9.1f}{s['p99_ms']:9.1f}"
+                f"{s['p99.9_ms']:9.1f}{s['max_ms']:9.1f}"
+            )
+        return lines
+
+
+async def _outcome(response: aiohttp.ClientResponse) -> str:
+    if 200 <= response.status < 300:
+        return "ok"
+    try:
+        error = (await response.json()).get("error", "")
+    except (aiohttp.ContentTypeError, ValueError):
+        error = ""
+    return f"{response.status} {error}".strip()
+
+
+async def run_load(
+    api_url: str,
+    auction_id: str,
+    users: List[dict],
+    schedule: Iterable[float],
+    amounts: AmountSequence,
+    max_connections: int = 1000,
+    timeout: float = 10,
+    on_send: Optional[Callable[[dict, str, float], None]] = None,
+    on_result: Optional[Callable[[dict, str, str, float], None]] = None,
+    start_at: Optional[float] = None
+) -> LoadResult:
+    """
+    Отправить ставки по расписанию schedule (смещения в секундах).
+
+    Участники берутся по кругу, так что интервал между ставками одного
+    участника - len(users)/rate (лимит бэкенда - одна ставка в 50 мс).
+
+    on_send(user, amount, sent) вызывается перед отправкой, on_result(user,
+    amount, outcome, done) - после ответа; время - loop.time(). Нужны для
+    сопоставления ставки с её broadcast (probe.py): broadcast может прийти
+    раньше, чем ответ на POST.
+    start_at - момент старта по time.time() (общий старт нескольких процессов).
+    """
+    result = LoadResult()
+    url = f"{api_url}/api/auctions/{auction_id}/bid"
+    connector = aiohttp.TCPConnector(limit=max_connections)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    loop = asyncio.get_running_loop()
+    pending = set()
+
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+        async def fire(user: dict, amount: str, intended: float) -> None:
+            sent = loop.time()
+            result.sent += 1
+            if on_send is not None:
+                on_send(user, amount, sent)
+            try:
+                async with session.post(
+                    url, json={"amount": amount},
+                    headers={"Authorization": f"Bearer {user['token']}"}
+                ) as response:
+                    outcome = await _outcome(response)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                outcome = type(e).__name__
+            done = loop.time()
+            result.latency.record_seconds(done - intended)
+            result.service.record_seconds(done - sent)
+            result.send_lag.record_seconds(sent - intended)
+            result.outcomes[outcome] += 1
+            if on_result is not None:
+                on_result(user, amount, outcome, done)
+
+        # Небольшая фора, чтобы первые запросы не стартовали с опозданием
+        delay = max(0.0, start_at - time.time()) if start_at is not None else 0.2
+        begin = loop.time() + delay
+        for index, offset in enumerate(schedule):
+            intended = begin + offset
+            wait = intended - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            task = asyncio.create_task(fire(users[index % len(users)], amounts.next(), intended))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+            result.planned += 1
+        if pending:
+            await asyncio.wait(pending)
+        result.elapsed = loop.time() - begin
+    return result
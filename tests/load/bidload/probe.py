@@ -0,0 +1,184 @@
+"""
+Задержка ставки от постановки в очередь до broadcast по WebSocket.
+
+POST /api/auctions/:id/bid отвечает {jobId, status: "queued"}; ставка
+применяется позже, когда воркер BullMQ выполнит placeBid, и тогда
+AuctionHub рассылает bid.updated всем подписчикам аукциона.
+
+BroadcastProbe держит WebSocket /ws?auctionId=...&token=... и сопоставляет
+кадры bid.updated со ставками генератора по (userId, amount) - суммы
+генератора уникальны. Задержка: от отправки POST до получения кадра.
+bid.failed несёт только userId и закрывает самую раннюю ожидающую ставку
+этого участника.
+"""
+import json
+import asyncio
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from typing import Deque, Dict, Optional, Tuple
+
+import aiohttp
+
+from bidload.histogram import Histogram
+
+
+def ws_url(api_url: str, auction_id: str, token: str) -> str:
+    base = api_url.replace("https://", "wss://", 1).replace("http://", "ws://", 1)
+    return f"{base}/ws?auctionId={auction_id}&token={token}"
+
+
+def _amount_key(amount) -> Optional[Decimal]:
+    """Сумма без хвостовых нулей: '12.30' и '12.3' - одна ставка."""
+    try:
+        return Decimal(str(amount)).normalize()
+    except (InvalidOperation, ValueError):
+        return None
+
+
+@dataclass
+class ProbeResult:
+    """Итоги сопоставления ставок и broadcast."""
+
+    latency: Histogram = field(default_factory=Histogram)
+    matched: int = 0
+    failed: int = 0
+    missing: int = 0
+    unexpected: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "matched": self.matched,
+            "failed": self.failed,
+            "missing": self.missing,
+            "unexpected": self.unexpected,
+            "enqueue_to_broadcast": self.latency.summary(),
+            "histogram": self.latency.to_base64(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ProbeResult":
+        return cls(
+            latency=Histogram.from_base64(data["histogram"]) if data.get("histogram") else Histogram(),
+            matched=data.get("matched", 0),
+            failed=data.get("failed", 0),
+            missing=data.get("missing", 0),
+            unexpected=data.get("unexpected", 0),
+        )
+
+    def merge(self, other: "ProbeResult") -> "ProbeResult":
+        self.latency.merge(other.latency)
+        self.matched += other.matched
+        self.failed += other.failed
+        self.missing += other.missing
+        self.unexpected += other.unexpected
+        return self
+
+    def format_lines(self) -> list:
+        s = self.latency.summary()
+        return [
+            f"Broadcast: {self.matched} bid.updated, {self.failed} bid.failed, "
+            f"{self.missing} без broadcast, {self.unexpected} чужих",
+            f"{'':12}{'p50':>9}{'p90':>9}{'p99':>9}{'p99.9':>9}{'max':>9}  мс",
+            f"{'POST→WS':12}{s['p50_ms']:9.1f}{s['p90_ms']:9.1f}{s['p99_ms']:9.1f}"
+            f"{s['p99.9_ms']:9.1f}{s['max_ms']:9.1f}",
+        ]
+
+
+class BroadcastProbe:
+    """
+    Слушатель broadcast одного аукциона.
+
+    Пример:
+        probe = BroadcastProbe(api_url, auction_id, token)
+        await probe.connect(session)
+        await run_load(..., on_send=probe.on_send, on_result=probe.on_result)
+        result = await probe.finish()
+    """
+
+    def __init__(self, api_url: str, auction_id: str, token: str, grace: float = 10.0):
+        self.url = ws_url(api_url, auction_id, token)
+        self.grace = grace
+        self.result = ProbeResult()
+        # (userId, сумма) -> время отправки POST
+        self._pending: Dict[Tuple[str, Decimal], float] = {}
+        # Ожидающие ставки участника по порядку отправки - для bid.failed
+        self._by_user: Dict[str, Deque[Decimal]] = defaultdict(deque)
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._drained = asyncio.Event()
+
+    async def connect(self, session: aiohttp.ClientSession, timeout: float = 10) -> None:
+        """Подключиться и дождаться snapshot (подписка на аукцион активна)."""
+        self._ws = await session.ws_connect(self.url, heartbeat=20)
+        while True:
+            message = await asyncio.wait_for(self._ws.receive(), timeout)
+            if message.type != aiohttp.WSMsgType.TEXT:
+                raise ConnectionError(f"WebSocket закрыт: {message.type.name} {message.extra or ''}")
+            if json.loads(message.data).get("type") == "snapshot":
+                break
+        self._reader = asyncio.create_task(self._read())
+
+    def on_send(self, user: dict, amount: str, sent: float) -> None:
+        key = _amount_key(amount)
+        self._pending[(user["id"], key)] = sent
+        self._by_user[user["id"]].append(key)
+        self._drained.clear()
+
+    def on_result(self, user: dict, amount: str, outcome: str, done: float) -> None:
+        # Не поставленная в очередь ставка broadcast не получит
+        if outcome != "ok":
+            self._resolve(user["id"], _amount_key(amount))
+
+    def _resolve(self, user_id: str, key: Decimal) -> Optional[float]:
+        sent = self._pending.pop((user_id, key), None)
+        if sent is not None:
+            try:
+                self._by_user[user_id].remove(key)
+            except ValueError:
+                pass
+        if not self._pending:
+            self._drained.set()
+        return sent
+
+    def _handle(self, frame: dict, received: float) -> None:
+        kind = frame.get("type")
+        data = frame.get("data") or {}
+        if kind == "bid.updated":
+            sent = self._resolve(str(data.get("userId")), _amount_key(data.get("amount")))
+            if sent is None:
+                self.result.unexpected += 1
+                return
+            self.result.matched += 1
+            self.result.latency.record_seconds(received - sent)
+        elif kind == "bid.failed":
+            queue = self._by_user.get(str(data.get("userId")))
+            if queue:
+                self._resolve(str(data.get("userId")), queue[0])
+                self.result.failed += 1
+
+    async def _read(self) -> None:
+        loop = asyncio.get_running_loop()
+        async for message in self._ws:
+            if message.type != aiohttp.WSMsgType.TEXT:
+                continue
+            received = loop.time()
+            try:
+                frame = json.loads(message.data)
+            except ValueError:
+                continue
+            self._handle(frame, received)
+
+    async def finish(self) -> ProbeResult:
+        """Дождаться broadcast оставшихся ставок (не дольше grace) и закрыть сокет."""
+        if self._pending:
+            try:
+                await asyncio.wait_for(self._drained.wait(), self.grace)
+            except asyncio.TimeoutError:
+                pass
+        self.result.missing = len(self._pending)
+        if self._ws is not None:
+            await self._ws.close()
+        if self._reader is not None:
+            await self._reader
+        return self.result
@@ -0,0 +1,109 @@
+"""
+Подготовка прогона через API: токен админа, аукцион, пополненные участники.
+"""
+import asyncio
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import aiohttp
+
+
+class ProvisionError(Exception):
+    """API не смог подготовить данные прогона."""
+
+
+async def _request(session: aiohttp.ClientSession, method: str, url: str,
+                   token: Optional[str] = None, **kwargs) -> dict:
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    async with session.request(method, url, headers=headers, **kwargs) as response:
+        if response.status not in (200, 201):
+            text = await response.text()
+            raise ProvisionError(f"{method} {url}: {response.status} {text[:200]}")
+        return await response.json()
+
+
+async def login(session: aiohttp.ClientSession, api_url: str, username: str, password: str) -> str:
+    data = await _request(session, "POST", f"{api_url}/api/login",
+                          json={"username": username, "password": password})
+    return data["token"]
+
+
+async def create_auction(
+    session: aiohttp.ClientSession,
+    api_url: str,
+    admin_token: str,
+    currency: str = "TON",
+    items_per_round: int = 100,
+    round_duration: int = 3600,
+    timeout: float = 15
+) -> str:
+    """
+    Активный аукцион для прогона: startTime в прошлом, первый раунд идёт
+    round_duration секунд. Ждёт, пока планировщик его запустит.
+    """
+    start = datetime.now(timezone.utc) - timedelta(seconds=1)
+    payload = {
+        "title": f"Load {secrets.token_hex(3)}",
+        "description": "Аукцион для нагрузочного прогона",
+        "currency": currency,
+        "totalItems": items_per_round,
+        "roundsCount": 1,
+        "itemsPerRound": items_per_round,
+        "startTime": start.isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+        "firstRoundDurationSec": round_duration,
+        "roundDurationSec": round_duration,
+        "minIncrement": "0.1",
+        "startingPrice": "1",
+    }
+    auction_id = (await _request(session, "POST", f"{api_url}/api/auctions",
+                                 token=admin_token, json=payload))["id"]
+    await wait_for_active(session, api_url, auction_id, timeout)
+    return auction_id
+
+
+async def wait_for_active(session: aiohttp.ClientSession, api_url: str, auction_id: str,
+                          timeout: float = 15) -> dict:
+    """Опрос /api/auctions/:id с нарастающим интервалом до статуса active."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.05
+    while True:
+        auction = await _request(session, "GET", f"{api_url}/api/auctions/{auction_id}")
+        if auction.get("status") == "active":
+            return auction
+        if loop.time() + delay > deadline:
+            raise ProvisionError(f"Аукцион {auction_id} не активен: {auction.get('status')!r}")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.5)
+
+
+async def create_bidders(
+    session: aiohttp.ClientSession,
+    api_url: str,
+    admin_token: str,
+    count: int,
+    funding: Dict[str, str],
+    concurrency: int = 20
+) -> List[dict]:
+    """Зарегистрировать и пополнить count участников: [{"id", "username", "token"}]."""
+    prefix = f"load_{secrets.token_hex(3)}"
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def create(index: int) -> dict:
+        async with semaphore:
+            username = f"{prefix}_{index}"
+            data = await _request(session, "POST", f"{api_url}/api/register",
+                                  json={"username": username, "password": secrets.token_urlsafe(12)})
+            user = {"id": data["user"]["id"], "username": username, "token": data["token"]}
+            for currency, amount in funding.items():
+                await _request(session, "POST", f"{api_url}/api/admin/users/{user['id']}/balance",
+                               token=admin_token, json={"currency": currency, "amount": amount})
+            return user
+
+    return list(await asyncio.gather(*(create(i) for i in range(count))))
+
+
+async def queue_stats(session: aiohttp.ClientSession, api_url: str, admin_token: str) -> Dict[str, int]:
+    """Очередь ставок BullMQ: {"waiting", "active", "completed", "failed"}."""
+    return await _request(session, "GET", f"{api_url}/api/admin/queue-stats", token=admin_token)
@@ -0,0 +1,38 @@
+"""
+Расписания прибытия запросов: смещения в секундах от начала прогона.
+"""
+import random
+from typing import Iterator, Optional
+
+
+SCHEDULES = ("fixed", "poisson")
+
+
+def fixed_schedule(rate: float, duration: float) -> Iterator[float]:
+    """Равномерный поток: запрос каждые 1/rate секунд."""
+    interval = 1.0 / rate
+    total = int(rate * duration)
+    for i in range(total):
+        yield i * interval
+
+
+def poisson_schedule(rate: float, duration: float, seed: Optional[int] = None) -> Iterator[float]:
+    """
+    Пуассоновский поток с интенсивностью rate: экспоненциальные интервалы.
+    Ближе к реальным пользователям - бывают пачки запросов подряд.
+    """
+    rng = random.Random(seed)
+    offset = rng.expovariate(rate)
+    while offset < duration:
+        yield offset
+        offset += rng.expovariate(rate)
+
+
+def make_schedule(kind: str, rate: float, duration: float, seed: Optional[int] = None) -> Iterator[float]:
+    if rate <= 0 or duration <= 0:
+        raise ValueError("rate and duration must be positive")
+    if kind == "fixed":
+        return fixed_schedule(rate, duration)
+    if kind == "poisson":
+        return poisson_schedule(rate, duration, seed)
+    raise ValueError(f"Unknown schedule: {kind}")
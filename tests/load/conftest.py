@@ -0,0 +1,53 @@
+"""
+Фикстуры тестов генератора нагрузки.
+
+Бэкенд не нужен: bid_server поднимает на localhost минимальный
+POST /api/auctions/:id/bid в том же event loop, что и тест.
+"""
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, List, Optional, Tuple
+
+import pytest
+from aiohttp import web
+
+
+@asynccontextmanager
+async def start_bid_server(
+    reject: Optional[Callable[[str], Optional[Tuple[int, str]]]] = None
+) -> AsyncIterator[Tuple[str, List[dict]]]:
+    """
+    Поднять сервер ставок; отдаёт (api_url, ставки).
+    reject(amount) -> (статус, ошибка) отклоняет ставку, None - принимает.
+    """
+    bids: List[dict] = []
+
+    async def place_bid(request: web.Request) -> web.Response:
+        body = await request.json()
+        bid = {
+            "auction_id": request.match_info["auction_id"],
+            "token": request.headers.get("Authorization", "").removeprefix("Bearer "),
+            "amount": body["amount"],
+        }
+        bids.append(bid)
+        rejected = reject(bid["amount"]) if reject is not None else None
+        if rejected is not None:
+            status, error = rejected
+            return web.json_response({"error": error}, status=status)
+        return web.json_response({"jobId": str(len(bids)), "status": "queued"})
+
+    app = web.Application()
+    app.router.add_post("/api/auctions/{auction_id}/bid", place_bid)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    try:
+        yield f"http://127.0.0.1:{port}", bids
+    finally:
+        await runner.cleanup()
+
+
+@pytest.fixture
+def bid_server():
+    return start_bid_server
@@ -0,0 +1,130 @@
+"""
+Тесты поиска предельной интенсивности: условия SLO пробы и бинарный поиск
+(пробы подменяются функцией с известным пределом).
+
+Запуск:
+    cd tests/load && python -m pytest -q
+"""
+import asyncio
+
+import pytest
+
+from bidload.capacity import SLO, Trial, queue_growth, search
+from bidload.loadgen import LoadResult
+from bidload.probe import ProbeResult
+
+
+def make_trial(outcomes: dict, failed: int = 0, missing: int = 0, latency_ms: int = 10,
+               queue_samples=()) -> Trial:
+    result = LoadResult()
+    result.outcomes.update(outcomes)
+    result.sent = result.planned = result.completed
+    probe = ProbeResult(failed=failed, missing=missing)
+    for _ in range(result.ok - failed - missing):
+        probe.latency.record(latency_ms * 1000)
+    return Trial(100, result, probe, list(queue_samples))
+
+
+class TestEvaluate:
+    """Условия устойчивости пробы."""
+
+    def test_clean_trial_passes(self):
+        trial = make_trial({"ok": 1000}).evaluate(SLO())
+        assert trial.passed, trial.failures
+        assert (trial.accepted_ratio, trial.failed_ratio) == (1.0, 0.0)
+
+    def test_rejected_bids_fail_accepted_ratio(self):
+        trial = make_trial({"ok": 900, "400 Too many bid attempts": 100}).evaluate(SLO())
+        assert trial.accepted_ratio == pytest.approx(0.9)
+        assert len(trial.failures) == 1 and "принято" in trial.failures[0]
+
+    def test_rejected_bids_within_slo(self):
+        trial = make_trial({"ok": 995, "400 Insufficient balance": 5}).evaluate(SLO())
+        assert trial.passed, trial.failures
+
+    def test_bid_failed_ratio(self):
+        trial = make_trial({"ok": 1000}, failed=50).evaluate(SLO())
+        assert trial.failed_ratio == pytest.approx(0.05)
+        assert any("bid.failed" in failure for failure in trial.failures)
+        assert make_trial({"ok": 1000}, failed=50).evaluate(SLO(max_failed_ratio=0.1)).passed
+
+    def test_server_and_network_errors(self):
+        trial = make_trial({"ok": 1000, "503": 1, "ServerDisconnectedError": 1})
+        failures = trial.evaluate(SLO(min_accepted_ratio=0)).failures
+        assert failures == ["2 ответов 5xx и сетевых ошибок"]
+
+    def test_slow_broadcast(self):
+        trial = make_trial({"ok": 100}, latency_ms=2000).evaluate(SLO(p99_ms=1000))
+        assert any("p99" in failure for failure in trial.failures)
+
+    def test_no_broadcast_at_all(self):
+        trial = make_trial({"ok": 100}, missing=100).evaluate(SLO(max_missing_ratio=1))
+        assert trial.failures == ["нет ни одного broadcast"]
+
+    def test_missing_broadcast(self):
+        trial = make_trial({"ok": 100}, missing=1).evaluate(SLO())
+        assert trial.failures == ["1 ставок без broadcast"]
+
+    def test_growing_queue(self):
+        # Первая четверть (разгон) не учитывается
+        warmup = [(t, 100 * t) for t in range(5)]
+        steady = [(t, 500) for t in range(5, 20)]
+        assert make_trial({"ok": 100}, queue_samples=warmup + steady).evaluate(SLO()).passed
+        growing = [(t, 10 * t) for t in range(20)]
+        trial = make_trial({"ok": 100}, queue_samples=growing).evaluate(SLO())
+        assert trial.queue_growth == pytest.approx(10)
+        assert not trial.passed
+
+    def test_to_dict_and_format_line(self):
+        trial = make_trial({"ok": 99, "400 Too many bid attempts": 1}).evaluate(SLO())
+        data = trial.to_dict()
+        assert data["accepted_ratio"] == 0.99 and data["passed"]
+        assert trial.format_line().startswith("✓")
+
+
+class TestQueueGrowth:
+    """Наклон очереди."""
+
+    def test_slope(self):
+        assert queue_growth([(t, 5 * t + 3) for t in range(10)]) == pytest.approx(5)
+        assert queue_growth([(t, 7) for t in range(10)]) == 0
+
+    def test_degenerate_samples(self):
+        assert queue_growth([]) == 0
+        assert queue_growth([(0, 1)]) == 0
+        assert queue_growth([(1, 1), (1, 5)]) == 0
+
+
+class TestSearch:
+    """Поиск предельной интенсивности."""
+
+    @staticmethod
+    def run_search(limit: float, min_rate: float, max_rate: float, precision: float):
+        async def trial(rate: float) -> Trial:
+            result = Trial(rate, LoadResult(), ProbeResult())
+            result.failures = [] if rate <= limit else ["перегрузка"]
+            return result
+        return asyncio.run(asyncio.wait_for(search(trial, min_rate, max_rate, precision), 5))
+
+    def test_finds_limit_within_precision(self):
+        best, trials = self.run_search(137, 10, 2000, 5)
+        assert 132 <= best <= 137
+        assert all(t.passed == (t.rate <= 137) for t in trials)
+
+    def test_terminates_below_float_resolution(self):
+        best, _ = self.run_search(10.05, 10, 10.1, 1e-12)
+        assert 10 <= best <= 10.05
+
+    def test_min_rate_unsustainable(self):
+        best, trials = self.run_search(5, 10, 100, 1)
+        assert best == 0.0 and len(trials) == 1
+
+    def test_max_rate_sustainable(self):
+        best, trials = self.run_search(1000, 10, 100, 1)
+        assert best == 100
+        assert [t.rate for t in trials] == [10, 20, 40, 80, 100]
+
+    @pytest.mark.parametrize("precision", [0, -1])
+    def test_rejects_non_positive_precision(self, precision):
+        with pytest.raises(ValueError):
+            self.run_search(100, 10, 100, precision)
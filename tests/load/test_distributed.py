@@ -0,0 +1,101 @@
+"""
+Тесты распределённого прогона: разбиение задачи между агентами, протокол
+и прогон с локальными агентами против сервера ставок (conftest.bid_server).
+
+Запуск:
+    cd tests/load && python -m pytest -q
+"""
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from bidload.distributed import (
+    Coordinator, DistributedError, make_task_factory, parse_address, receive, shard_amounts
+)
+from bidload.loadgen import AmountSequence
+
+
+USERS = [{"id": f"u{i}", "token": f"token-{i}"} for i in range(10)]
+
+
+class TestSharding:
+    """Задачи агентов."""
+
+    def test_shards_do_not_overlap(self):
+        seen = set()
+        for index in range(4):
+            start, step = shard_amounts("1", "0.1", index, 4)
+            amounts = AmountSequence(start, step)
+            seen.update(amounts.next() for _ in range(50))
+        assert len(seen) == 200
+
+    def test_shards_interleave(self):
+        firsts = [AmountSequence(*shard_amounts("1", "0.1", index, 3)).next() for index in range(3)]
+        assert firsts == ["1.3", "1.4", "1.5"]
+
+    def test_task_factory_splits_users_and_rate(self):
+        make_task = make_task_factory(
+            "http://api", "a1", USERS, rate=300, duration=5, schedule="poisson",
+            amounts=AmountSequence("2", "0.5"), seed=10, max_connections=100
+        )
+        tasks = [make_task(index, 3) for index in range(3)]
+        assert sorted(user["id"] for task in tasks for user in task["users"]) == sorted(u["id"] for u in USERS)
+        assert sum(task["rate"] for task in tasks) == pytest.approx(300)
+        assert [task["seed"] for task in tasks] == [10, 11, 12]
+        assert len({task["phase"] for task in tasks}) == 3
+        assert {task["amount_step"] for task in tasks} == {"1.5"}
+        assert [Decimal(task["amount_start"]) for task in tasks] == [2, Decimal("2.5"), 3]
+        assert {task["max_connections"] for task in tasks} == {33}
+
+
+class TestProtocol:
+    """Сообщения координатора и агентов."""
+
+    @pytest.mark.parametrize("value, expected", [
+        ("9000", ("127.0.0.1", 9000)),
+        ("loadgen-1:9000", ("loadgen-1", 9000)),
+    ])
+    def test_parse_address(self, value, expected):
+        assert parse_address(value) == expected
+
+    @staticmethod
+    def receive_line(line: bytes, expected: str) -> dict:
+        async def scenario():
+            reader = asyncio.StreamReader()
+            reader.feed_data(line)
+            reader.feed_eof()
+            return await receive(reader, expected)
+        return asyncio.run(scenario())
+
+    def test_receive(self):
+        assert self.receive_line(b'{"type": "ready"}\n', "ready") == {"type": "ready"}
+
+    @pytest.mark.parametrize("line", [b"", b'{"type": "hello"}\n', b'{"type": "error", "error": "x"}\n'])
+    def test_receive_errors(self, line):
+        with pytest.raises(DistributedError):
+            self.receive_line(line, "ready")
+
+    def test_requires_agents(self):
+        with pytest.raises(ValueError):
+            Coordinator(local_workers=0)
+
+
+class TestCoordinator:
+    """Прогон с локальными агентами."""
+
+    def test_local_agents_merge_results(self, bid_server):
+        async def scenario():
+            async with bid_server() as (api_url, bids):
+                coordinator = Coordinator(local_workers=2, start_delay=0.5)
+                make_task = make_task_factory(
+                    api_url, "a1", USERS, rate=100, duration=0.5, schedule="fixed",
+                    amounts=AmountSequence("1", "0.1")
+                )
+                return await asyncio.wait_for(coordinator.run(make_task), 60), bids
+
+        result, bids = asyncio.run(scenario())
+        assert (result.planned, result.sent, result.ok) == (50, 50, 50)
+        assert result.latency.count == 50
+        assert len({bid["amount"] for bid in bids}) == 50
+        assert {bid["token"] for bid in bids} == {user["token"] for user in USERS}
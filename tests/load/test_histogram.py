@@ -0,0 +1,134 @@
+"""
+Тесты гистограммы задержек: бинарный формат, объединение, точность.
+
+Запуск:
+    cd tests/load && python -m pytest -q
+"""
+import math
+import random
+
+import pytest
+
+from bidload.histogram import (
+    BUCKET_COUNT, FORMAT_VERSION, MAGIC, MAX_VALUE, SUB_BUCKET_BITS, SUB_BUCKETS,
+    Histogram, bucket_bounds, bucket_index,
+)
+from bidload.loadgen import LoadResult
+from bidload.probe import ProbeResult
+
+
+def random_histograms(count: int, samples: int, seed: int = 1):
+    rng = random.Random(seed)
+    values = [int(rng.lognormvariate(9, 1.5)) for _ in range(samples)]
+    parts = [Histogram() for _ in range(count)]
+    for index, value in enumerate(values):
+        parts[index % count].record(value)
+    return values, parts
+
+
+class TestHistogram:
+    """Гистограмма задержек."""
+
+    def test_bytes_round_trip(self):
+        values, (histogram,) = random_histograms(1, 10000)
+        restored = Histogram.from_bytes(histogram.to_bytes())
+        assert restored.counts == histogram.counts
+        assert (restored.count, restored.total, restored.min, restored.max) == \
+            (histogram.count, histogram.total, histogram.min, histogram.max)
+        assert Histogram.from_base64(histogram.to_base64()).counts == histogram.counts
+
+    def test_empty_round_trip(self):
+        restored = Histogram.from_bytes(Histogram().to_bytes())
+        assert restored.count == 0
+        assert restored.counts == [0] * BUCKET_COUNT
+        assert restored.percentile(99) == 0
+
+    def test_merge_equals_single_histogram(self):
+        values, parts = random_histograms(4, 20000)
+        single = Histogram()
+        for value in values:
+            single.record(value)
+        merged = Histogram.merged(Histogram.from_bytes(part.to_bytes()) for part in parts)
+        assert merged.counts == single.counts
+        assert merged.summary() == single.summary()
+
+    def test_merge_into_empty_keeps_min(self):
+        other = Histogram()
+        other.record(500)
+        merged = Histogram().merge(other)
+        assert (merged.min, merged.max) == (500, 500)
+
+    @pytest.mark.parametrize("bits", range(SUB_BUCKET_BITS, 32))
+    def test_bucket_bounds_at_power_of_two(self, bits):
+        edge = 1 << bits
+        below, at = bucket_index(edge - 1), bucket_index(edge)
+        assert at == below + 1
+        assert bucket_bounds(below)[1] == edge
+        assert bucket_bounds(at)[0] == edge
+
+    def test_exact_below_sub_buckets(self):
+        for value in range(SUB_BUCKETS):
+            assert bucket_bounds(bucket_index(value)) == (value, value + 1)
+
+    def test_max_value_fits(self):
+        low, high = bucket_bounds(bucket_index(MAX_VALUE))
+        assert low <= MAX_VALUE < high
+        assert bucket_index(MAX_VALUE) == BUCKET_COUNT - 1
+
+    def test_percentile_error_within_resolution(self):
+        values, (histogram,) = random_histograms(1, 50000)
+        values.sort()
+        for q in (1, 10, 50, 90, 99, 99.9, 100):
+            exact = values[max(1, math.ceil(len(values) * q / 100)) - 1]
+            tolerance = max(1, exact / (1 << (SUB_BUCKET_BITS - 1)))
+            assert abs(histogram.percentile(q) - exact) <= tolerance, q
+
+    def test_cdf_and_csv(self):
+        histogram = Histogram()
+        for value in (10, 10, 20, 5000):
+            histogram.record(value)
+        assert histogram.cdf()[-1][1] == 1.0
+        rows = histogram.to_csv().splitlines()
+        assert rows[0] == "low_us,high_us,count,cumulative,fraction"
+        assert rows[1] == "10,11,2,2,0.500000"
+        assert len(rows) == 4
+
+    def test_rejects_other_version(self):
+        blob = bytearray(Histogram().to_bytes())
+        blob[len(MAGIC)] = FORMAT_VERSION + 1
+        with pytest.raises(ValueError):
+            Histogram.from_bytes(bytes(blob))
+
+    def test_rejects_garbage_and_truncated(self):
+        with pytest.raises(ValueError):
+            Histogram.from_bytes(b"not a histogram")
+        histogram = Histogram()
+        histogram.record(1 << 20)
+        with pytest.raises(ValueError):
+            Histogram.from_bytes(histogram.to_bytes()[:-1])
+
+
+class TestMergeResults:
+    """Результаты прогона и broadcast из разных процессов."""
+
+    def test_dict_round_trip_and_merge(self):
+        _, parts = random_histograms(2, 1000)
+        results = []
+        for index, part in enumerate(parts):
+            result = LoadResult(latency=part, planned=10, sent=10, elapsed=index + 1.0)
+            result.outcomes.update({"ok": 9, "503": 1})
+            results.append(LoadResult.from_dict(result.to_dict()))
+        merged = results[0].merge(results[1])
+        assert merged.latency.counts == Histogram.merged(parts).counts
+        assert merged.outcomes == {"ok": 18, "503": 2}
+        assert (merged.planned, merged.sent, merged.elapsed) == (20, 20, 2.0)
+
+    def test_probe_result_round_trip_and_merge(self):
+        _, parts = random_histograms(2, 500)
+        results = [
+            ProbeResult.from_dict(ProbeResult(latency=part, matched=part.count, failed=1, missing=2).to_dict())
+            for part in parts
+        ]
+        merged = results[0].merge(results[1])
+        assert merged.latency.counts == Histogram.merged(parts).counts
+        assert (merged.matched, merged.failed, merged.missing) == (500, 2, 4)
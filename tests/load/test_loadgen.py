@@ -0,0 +1,113 @@
+"""
+Тесты открытого генератора ставок: суммы, расписания, прогон против
+локального сервера (conftest.bid_server).
+
+Запуск:
+    cd tests/load && python -m pytest -q
+"""
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from bidload.loadgen import AmountSequence, LoadResult, run_load
+from bidload.schedule import make_schedule
+
+
+USERS = [{"id": f"u{i}", "token": f"token-{i}"} for i in range(3)]
+
+
+class TestAmounts:
+    """Суммы ставок."""
+
+    def test_sequence_increases_by_step(self):
+        amounts = AmountSequence("1", "0.1")
+        assert [amounts.next() for _ in range(3)] == ["1.1", "1.2", "1.3"]
+        assert amounts.amount_after(10) == Decimal("2.3")
+
+    def test_amounts_are_unique(self):
+        amounts = AmountSequence("5", "0.01")
+        assert len({amounts.next() for _ in range(1000)}) == 1000
+
+
+class TestSchedule:
+    """Расписания прибытия."""
+
+    def test_fixed_schedule_is_uniform(self):
+        assert list(make_schedule("fixed", 4, 1)) == [0, 0.25, 0.5, 0.75]
+
+    def test_poisson_schedule_is_reproducible(self):
+        first = list(make_schedule("poisson", 100, 2, seed=7))
+        assert first == list(make_schedule("poisson", 100, 2, seed=7))
+        assert all(0 <= offset < 2 for offset in first)
+        assert first == sorted(first)
+
+    @pytest.mark.parametrize("kind, rate, duration", [("fixed", 0, 1), ("fixed", 1, 0), ("burst", 1, 1)])
+    def test_rejects_bad_arguments(self, kind, rate, duration):
+        with pytest.raises(ValueError):
+            make_schedule(kind, rate, duration)
+
+
+class TestRunLoad:
+    """Прогон против локального сервера ставок."""
+
+    def test_sends_schedule_round_robin(self, bid_server):
+        async def scenario():
+            async with bid_server() as (api_url, bids):
+                result = await run_load(
+                    api_url, "a1", USERS, make_schedule("fixed", 200, 0.1), AmountSequence("1", "0.1")
+                )
+                return result, bids
+
+        result, bids = asyncio.run(scenario())
+        assert (result.planned, result.sent, result.ok) == (20, 20, 20)
+        assert result.latency.count == result.service.count == result.send_lag.count == 20
+        assert {bid["auction_id"] for bid in bids} == {"a1"}
+        assert sorted(bid["amount"] for bid in bids) == [str(Decimal("1.1") + Decimal("0.1") * i) for i in range(20)]
+        tokens = [bid["token"] for bid in bids]
+        assert {tokens.count(user["token"]) for user in USERS} == {6, 7}
+
+    def test_counts_outcomes_and_callbacks(self, bid_server):
+        sent, done = [], []
+
+        async def scenario():
+            async with bid_server(lambda amount: (400, "Too many bid attempts") if amount.endswith("5") else None) \
+                    as (api_url, _):
+                return await run_load(
+                    api_url, "a1", USERS, make_schedule("fixed", 100, 0.1), AmountSequence("1", "0.1"),
+                    on_send=lambda user, amount, at: sent.append(amount),
+                    on_result=lambda user, amount, outcome, at: done.append((amount, outcome))
+                )
+
+        result = asyncio.run(scenario())
+        assert result.outcomes == {"ok": 9, "400 Too many bid attempts": 1}
+        assert result.server_errors == 0
+        assert sorted(sent) == sorted(amount for amount, _ in done)
+        assert ("1.5", "400 Too many bid attempts") in done
+
+    def test_connection_errors_are_outcomes(self):
+        async def scenario():
+            # Порт 9 (discard) на localhost закрыт
+            return await run_load(
+                "http://127.0.0.1:9", "a1", USERS, [0, 0], AmountSequence(), timeout=2
+            )
+
+        result = asyncio.run(scenario())
+        assert result.sent == 2 and result.ok == 0
+        assert result.completed == 2
+        assert all(outcome.startswith("Client") for outcome in result.outcomes)
+
+
+class TestLoadResult:
+    """Итоги прогона."""
+
+    def test_counters_and_dict(self):
+        result = LoadResult(planned=4, sent=4, elapsed=2.0)
+        result.outcomes.update({"ok": 2, "500 Internal": 1, "503": 1})
+        for ms in (1, 2, 3, 4):
+            result.latency.record(ms * 1000)
+        data = result.to_dict()
+        assert (result.completed, result.ok, result.server_errors) == (4, 2, 2)
+        assert data["throughput_rps"] == 2.0
+        assert data["latency"]["count"] == 4
+        assert len(result.format_lines()) == 1 + len(result.outcomes) + 4
@@ -0,0 +1,107 @@
+"""
+Тесты сопоставления ставок с broadcast (без WebSocket: кадры подаются
+в BroadcastProbe._handle напрямую).
+
+Запуск:
+    cd tests/load && python -m pytest -q
+"""
+import asyncio
+
+import pytest
+
+from bidload.probe import BroadcastProbe, _amount_key, ws_url
+
+
+ALICE = {"id": "alice", "token": "t1"}
+BOB = {"id": "bob", "token": "t2"}
+
+
+def updated(user: dict, amount) -> dict:
+    return {"type": "bid.updated", "data": {"userId": user["id"], "amount": amount}}
+
+
+def failed(user: dict) -> dict:
+    return {"type": "bid.failed", "data": {"userId": user["id"]}}
+
+
+@pytest.fixture
+def probe():
+    return BroadcastProbe("http://localhost:3000", "a1", "token", grace=0.05)
+
+
+class TestAmountKey:
+    """Нормализация сумм."""
+
+    def test_trailing_zeros_are_ignored(self):
+        assert _amount_key("12.30") == _amount_key("12.3") == _amount_key(12.3)
+
+    def test_garbage_is_none(self):
+        assert _amount_key("abc") is None
+        assert _amount_key(None) is None
+
+    def test_ws_url(self):
+        assert ws_url("https://api.example", "a1", "t") == "wss://api.example/ws?auctionId=a1&token=t"
+        assert ws_url("http://localhost:3000", "a1", "t") == "ws://localhost:3000/ws?auctionId=a1&token=t"
+
+
+class TestMatching:
+    """Сопоставление кадров со ставками генератора."""
+
+    def test_updated_matches_by_user_and_amount(self, probe):
+        probe.on_send(ALICE, "1.10", 10.0)
+        probe.on_send(BOB, "1.20", 10.5)
+        probe._handle(updated(BOB, 1.2), 10.75)
+        probe._handle(updated(ALICE, "1.1"), 11.0)
+        assert probe.result.matched == 2
+        assert probe.result.latency.min == 250_000
+        assert probe.result.latency.max == 1_000_000
+        assert not probe._pending
+
+    def test_foreign_bids_are_unexpected(self, probe):
+        probe.on_send(ALICE, "1.1", 0.0)
+        probe._handle(updated(BOB, "1.1"), 1.0)
+        probe._handle(updated(ALICE, "9.9"), 1.0)
+        assert (probe.result.matched, probe.result.unexpected) == (0, 2)
+        assert len(probe._pending) == 1
+
+    def test_failed_resolves_oldest_bid_of_user(self, probe):
+        probe.on_send(ALICE, "1.1", 0.0)
+        probe.on_send(ALICE, "1.2", 0.1)
+        probe._handle(failed(ALICE), 0.5)
+        probe._handle(updated(ALICE, "1.2"), 0.6)
+        assert (probe.result.failed, probe.result.matched) == (1, 1)
+        assert not probe._pending
+
+    def test_failed_without_pending_is_ignored(self, probe):
+        probe._handle(failed(ALICE), 0.0)
+        assert probe.result.failed == 0
+
+    def test_rejected_bid_expects_no_broadcast(self, probe):
+        probe.on_send(ALICE, "1.1", 0.0)
+        probe.on_send(ALICE, "1.2", 0.0)
+        probe.on_result(ALICE, "1.1", "400 Too many bid attempts", 0.1)
+        probe.on_result(ALICE, "1.2", "ok", 0.1)
+        assert list(probe._pending) == [("alice", _amount_key("1.2"))]
+        # bid.failed теперь относится ко второй ставке
+        probe._handle(failed(ALICE), 0.2)
+        assert probe.result.failed == 1 and not probe._pending
+
+    def test_broadcast_before_post_response(self, probe):
+        probe.on_send(ALICE, "1.1", 0.0)
+        probe._handle(updated(ALICE, "1.1"), 0.05)
+        probe.on_result(ALICE, "1.1", "ok", 0.1)
+        assert probe.result.matched == 1 and not probe._pending
+
+
+class TestFinish:
+    """Итоги после прогона."""
+
+    def test_missing_after_grace(self, probe):
+        async def scenario():
+            probe.on_send(ALICE, "1.1", 0.0)
+            probe.on_send(BOB, "1.2", 0.0)
+            probe._handle(updated(ALICE, "1.1"), 0.1)
+            return await probe.finish()
+
+        result = asyncio.run(scenario())
+        assert (result.matched, result.missing) == (1, 1)
@@ -6,6 +6,8 @@
 """
 import os
 import pytest
+import statistics
+from pathlib import Path
 import logging
 from datetime import datetime
 from selenium import webdriver
@@ -18,11 +20,35 @@ from selenium.webdriver.edge.service import Service as EdgeService
 from dotenv import load_dotenv
 from faker import Faker
 
+try:
+    from pytest_html import extras as html_extras
+except ImportError:
+    html_extras = None
+
 # Добавляем путь к utils
 import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from utils.environment import EnvironmentManager, get_environment_manager
+from utils.stack_profile import STACK_PROFILES, DEFAULT_STACK_PROFILE
+from utils.isolated_stacks import IsolatedStacks
+from utils.session_auth import SessionAuth
+from utils.identities import IdentityPool
+from utils.data_factory import DataFactory, DataFactoryError
+from utils.driver_pool import DriverPool
+from utils.driver_resolver import get_driver_resolver
+from utils.network_tracker import install_network_tracker
+from utils.perf import PerfRecorder, attach_perf_recorder, DEFAULT_ARTIFACTS_DIR
+from utils.perf_baseline import (
+    PerfBaseline,
+    parse_tolerance,
+    collect_values,
+    format_rows_html,
+    format_regression
+)
+from utils import tracing
+from utils.wait_stats import enable_wait_stats, get_wait_stats, DEFAULT_STATS_PATH
+from pages.base_page import BasePage
 
 # Загрузка переменных окружения
 load_dotenv()
@@ -38,6 +64,9 @@ fake = Faker('ru_RU')
 _env_manager = None
 _environment_ready = False
 
+# Изолированные стеки воркеров (--isolated-stacks, только в главном процессе)
+_isolated_stacks = None
+
 
 def pytest_addoption(parser):
     """Добавление CLI опций для pytest."""
@@ -72,6 +101,20 @@ def pytest_addoption(parser):
         default=0,
         help="Slow down browser actions by specified milliseconds"
     )
+    parser.addoption(
+        "--wait-timeout",
+        action="store",
+        type=float,
+        default=10,
+        help="Default explicit wait budget in seconds for page objects"
+    )
+    parser.addoption(
+        "--poll-interval",
+        action="store",
+        type=float,
+        default=0.1,
+        help="Polling interval in seconds for explicit waits"
+    )
     parser.addoption(
         "--no-auto-setup",
         action="store_true",
@@ -90,6 +133,19 @@ def pytest_addoption(parser):
         default=False,
         help="Disable automatic test user creation"
     )
+    parser.addoption(
+        "--stack-profile",
+        action="store",
+        default=os.getenv("STACK_PROFILE", DEFAULT_STACK_PROFILE),
+        choices=STACK_PROFILES,
+        help="Docker stack profile: prod-like (disk, AOF) or fast (tmpfs, no persistence)"
+    )
+    parser.addoption(
+        "--isolated-stacks",
+        action="store_true",
+        default=False,
+        help="Start a separate docker compose stack (own ports and database) per xdist worker"
+    )
     parser.addoption(
         "--keep-containers",
         action="store_true",
@@ -100,7 +156,87 @@ def pytest_addoption(parser):
         "--reuse-browser",
         action="store_true",
         default=False,
-        help="Reuse same browser instance for all tests (faster but less isolated)"
+        help="Reuse pooled browsers between tests (state is reset between leases)"
+    )
+    parser.addoption(
+        "--browser-max-uses",
+        action="store",
+        type=int,
+        default=50,
+        help="With --reuse-browser: restart browser after this many tests"
+    )
+    parser.addoption(
+        "--no-prewarm",
+        action="store_true",
+        default=False,
+        help="Don't start the next browser in background while a test runs"
+    )
+    parser.addoption(
+        "--perf-capture",
+        action="store_true",
+        default=False,
+        help="Record page performance (Navigation Timing, paint, LCP, long tasks, CDP metrics) for every opened page"
+    )
+    parser.addoption(
+        "--perf-dir",
+        action="store",
+        default=str(DEFAULT_ARTIFACTS_DIR),
+        help="Directory for per-test performance JSON artifacts"
+    )
+    parser.addoption(
+        "--perf-baseline",
+        action="store",
+        default=None,
+        help="Performance baseline JSON: compare page timings with the median of recent runs (implies --perf-capture)"
+    )
+    parser.addoption(
+        "--perf-tolerance",
+        action="store",
+        default="15%",
+        help="Allowed slowdown against the baseline, e.g. 15%% or 0.15"
+    )
+    parser.addoption(
+        "--perf-gate",
+        action="store",
+        choices=["fail", "warn"],
+        default="fail",
+        help="What to do on a performance regression: fail the test or only report it"
+    )
+    parser.addoption(
+        "--perf-update-baseline",
+        action="store_true",
+        default=False,
+        help="Append this run's timings to the baseline (keeps the last runs per route)"
+    )
+    parser.addoption(
+        "--trace-actions",
+        action="store_true",
+        default=False,
+        help="Trace page-object calls, waits, sleeps, WebDriver commands and API requests per test"
+    )
+    parser.addoption(
+        "--trace-dir",
+        action="store",
+        default=str(tracing.DEFAULT_TRACES_DIR),
+        help="Directory for Chrome trace JSON files and the collapsed-stack flamegraph file"
+    )
+    parser.addoption(
+        "--wait-stats",
+        action="store_true",
+        default=False,
+        help="Record every explicit wait and print the most expensive locators/waits"
+    )
+    parser.addoption(
+        "--duration-sharding",
+        action="store_true",
+        default=False,
+        help="With -n: hand out test classes longest-first using durations from previous runs"
+    )
+    parser.addoption(
+        "--isolated-users",
+        action="store_true",
+        default=False,
+        help="Give each worker its own funded test users (always on under xdist)"
     )
 
 
@@ -111,17 +247,59 @@ def pytest_configure(config):
     """
     global _env_manager, _environment_ready
     
+    # Бюджеты ожиданий Page Object
+    BasePage.DEFAULT_TIMEOUT = config.getoption("--wait-timeout")
+    BasePage.POLL_INTERVAL = config.getoption("--poll-interval")
+    
+    # База производительности (--perf-baseline)
+    _configure_perf_baseline(config)
+    
+    # Статистика ожиданий (--wait-stats)
+    if config.getoption("--wait-stats"):
+        enable_wait_stats()
+        if not hasattr(config, "workerinput"):
+            for stale in DEFAULT_STATS_PATH.parent.glob("wait-stats-*.json"):
+                stale.unlink()
+    
+    # Длительности тестов для распределения по воркерам (--duration-sharding)
+    _configure_duration_sharding(config)
+    
+    # Трассировка действий (--trace-actions)
+    if config.getoption("--trace-actions"):
+        _configure_tracing(config)
+    
+    # Путь к драйверу определяем заранее в главном процессе,
+    # воркеры xdist возьмут его из файлового кэша
+    if not hasattr(config, "workerinput") and not config.option.collectonly:
+        _resolve_driver_paths(config.getoption("--browser").lower())
+    
     # Пропускаем автоматическую настройку если указан флаг
     if config.getoption("--no-auto-setup"):
         print("\n⚠ Автоматическая настройка окружения отключена (--no-auto-setup)")
         _environment_ready = True
         return
     
+    # Изолированные стеки (--isolated-stacks): воркер получает URL своего стека
+    # от главного процесса (pytest_configure_node), сам ничего не запускает
+    workerinput = getattr(config, "workerinput", {})
+    if "stack_base_url" in workerinput:
+        config.option.base_url = workerinput["stack_base_url"]
+        config.option.api_url = workerinput["stack_api_url"]
+        _environment_ready = True
+        return
+    if config.getoption("--isolated-stacks") and not hasattr(config, "workerinput"):
+        _environment_ready = _start_isolated_stacks(config)
+        return
+    
     base_url = config.getoption("--base-url")
     api_url = config.getoption("--api-url")
     
     # Создаём менеджер окружения
-    _env_manager = EnvironmentManager(base_url=base_url, api_url=api_url)
+    _env_manager = EnvironmentManager(
+        base_url=base_url,
+        api_url=api_url,
+        stack_profile=config.getoption("--stack-profile")
+    )
     
     # Если --keep-containers, не останавливаем контейнеры после тестов
     if config.getoption("--keep-containers"):
@@ -138,14 +316,63 @@ def pytest_configure(config):
     )
 
 
+def _start_isolated_stacks(config) -> bool:
+    """Запустить по стеку на воркер (utils/isolated_stacks.py)."""
+    global _isolated_stacks
+    
+    workers = getattr(config.option, "numprocesses", None)
+    count = workers if isinstance(workers, int) and workers > 0 else 1
+    _isolated_stacks = IsolatedStacks(
+        EnvironmentManager().project_root,
+        count,
+        stack_profile=config.getoption("--stack-profile")
+    )
+    ready = _isolated_stacks.start(create_users=not config.getoption("--no-auto-users"))
+    
+    # Если --keep-containers, не останавливаем стеки после тестов
+    if config.getoption("--keep-containers"):
+        for manager in _isolated_stacks.managers:
+            manager._compose_started_by_us = False
+    
+    # Без xdist тесты идут в главном процессе - на первом стеке
+    stack = _isolated_stacks.stack_for(None)
+    if stack is not None:
+        config.option.base_url = stack.base_url
+        config.option.api_url = stack.api_url
+    return ready
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Передать воркеру xdist URL его изолированного стека."""
+    if _isolated_stacks is None:
+        return
+    stack = _isolated_stacks.stack_for(node.workerinput["workerid"])
+    if stack is not None:
+        node.workerinput["stack_base_url"] = stack.base_url
+        node.workerinput["stack_api_url"] = stack.api_url
+
+
+def _resolve_driver_paths(browser: str):
+    """Определить путь к драйверу браузера (один раз на сессию)."""
+    try:
+        paths = get_driver_resolver().resolve(browser)
+        print(f"\n✓ Драйвер {browser}: {paths['driver_path']}")
+    except Exception as e:
+        # Ошибка повторится при создании браузера с полным traceback
+        print(f"\n⚠ Не удалось определить драйвер {browser}: {e}")
+
+
 def pytest_unconfigure(config):
     """
     Очистка после завершения всех тестов.
     """
-    global _env_manager
+    global _env_manager, _isolated_stacks
     
     if _env_manager is not None:
         _env_manager.cleanup()
+    if _isolated_stacks is not None:
+        _isolated_stacks.stop()
 
 
 @pytest.fixture(scope="session")
@@ -166,8 +393,57 @@ def api_url(request):
     return request.config.getoption("--api-url")
 
 
-# Глобальный браузер для режима --reuse-browser
-_shared_driver = None
+# Пул браузеров текущего процесса (у каждого воркера xdist свой)
+_driver_pool = None
+
+# База производительности, допуск и собранные результаты (см. utils/perf_baseline.py)
+_perf_baseline = None
+_perf_tolerance = 0.15
+_perf_values = []
+_perf_regressions = []
+_perf_recorder_key = pytest.StashKey()
+
+
+def _configure_perf_baseline(config) -> None:
+    """Загрузить базу производительности, если указан --perf-baseline."""
+    global _perf_baseline, _perf_tolerance
+    path = config.getoption("--perf-baseline")
+    if not path:
+        return
+    try:
+        _perf_tolerance = parse_tolerance(config.getoption("--perf-tolerance"))
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    _perf_baseline = PerfBaseline(path)
+
+
+def _configure_duration_sharding(config) -> None:
+    """
+    Главный процесс запоминает длительности тестов в кэше pytest;
+    с --duration-sharding и xdist раздаёт группы тестов по ним.
+    """
+    if hasattr(config, "workerinput") or getattr(config, "cache", None) is None:
+        return
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    from utils.duration_sharding import TestDurations, DurationShardingPlugin
+    
+    durations = TestDurations(config)
+    config.pluginmanager.register(durations, "test-durations")
+    if config.getoption("--duration-sharding"):
+        config.pluginmanager.register(DurationShardingPlugin(durations), "duration-sharding")
+
+
+def _configure_tracing(config) -> None:
+    """Инструментировать Page Object и очистить collapsed stacks прошлого запуска."""
+    # Подклассы BasePage должны быть импортированы до инструментирования
+    import pages  # noqa: F401
+    tracing.install_tracing(BasePage)
+    
+    if not hasattr(config, "workerinput"):
+        trace_dir = Path(config.getoption("--trace-dir"))
+        for stale in trace_dir.glob("collapsed-*.txt"):
+            stale.unlink()
 
 
 def _is_browser_alive(driver) -> bool:
@@ -182,186 +458,340 @@ def _is_browser_alive(driver) -> bool:
         return False
 
 
-@pytest.fixture(scope="function")
-def driver(request, base_url):
+def _get_driver_pool(config) -> DriverPool:
     """
-    Fixture для создания WebDriver.
-    Использует встроенный Selenium Manager (Selenium 4.6+) - драйвер качается автоматически.
-    С --reuse-browser использует один браузер для всех тестов.
+    Получить пул браузеров воркера (создаётся при первом обращении).
+    Без --reuse-browser каждый тест получает свежий браузер (max_uses=1),
+    но запущенный заранее, пока шёл предыдущий тест.
     """
-    global _shared_driver
+    global _driver_pool
     
-    browser = request.config.getoption("--browser").lower()
-    headless = request.config.getoption("--headless")
-    reuse = request.config.getoption("--reuse-browser")
-    
-    if reuse:
-        # Режим переиспользования браузера
-        need_new_driver = _shared_driver is None or not _is_browser_alive(_shared_driver)
-        
-        if need_new_driver:
-            # Закрываем старый если есть
-            if _shared_driver is not None:
-                try:
-                    _shared_driver.quit()
-                except Exception:
-                    pass
-            _shared_driver = _create_driver(browser, headless)
-            _shared_driver.get(base_url)
-        
-        driver = _shared_driver
+    if _driver_pool is None:
+        browser = config.getoption("--browser").lower()
+        headless = config.getoption("--headless")
+        base_url = config.getoption("--base-url")
+        max_uses = config.getoption("--browser-max-uses") if config.getoption("--reuse-browser") else 1
         
-        # Очищаем состояние между тестами
-        try:
-            driver.delete_all_cookies()
-            driver.execute_script("window.localStorage.clear();")
-            driver.execute_script("window.sessionStorage.clear();")
+        def factory():
+            driver = _create_driver(browser, headless)
             driver.get(base_url)
-        except Exception:
-            # Если браузер закрылся - создаём новый
-            try:
-                _shared_driver.quit()
-            except Exception:
-                pass
-            _shared_driver = _create_driver(browser, headless)
-            _shared_driver.get(base_url)
-            driver = _shared_driver
+            return driver
         
-        yield driver
-        # Не закрываем браузер в этом режиме
-    else:
-        # Обычный режим - новый браузер на каждый тест
-        driver = _create_driver(browser, headless)
+        _driver_pool = DriverPool(
+            factory=factory,
+            health_check=_is_browser_alive,
+            max_uses=max_uses,
+            prewarm=not config.getoption("--no-prewarm"),
+            origins=[base_url]
+        )
+    
+    return _driver_pool
+
+
+@pytest.fixture(scope="function")
+def driver(request, base_url):
+    """
+    Fixture для WebDriver.
+    Браузер берётся из пула воркера: проверен health-check, состояние сброшено.
+    С --reuse-browser один браузер обслуживает до --browser-max-uses тестов.
+    """
+    pool = _get_driver_pool(request.config)
+    driver = pool.acquire()
+    
+    # Прогретый браузер уже на base_url, переиспользованный - на about:blank
+    if not driver.current_url.startswith(base_url):
         driver.get(base_url)
-        yield driver
-        try:
-            driver.quit()
-        except Exception:
-            pass
+    
+    yield driver
+    
+    pool.release(driver)
+
+
+@pytest.fixture(scope="function")
+def perf_recorder(request, driver):
+    """
+    Замеры производительности страниц теста (utils/perf.py).
+    Пока рекордер привязан к драйверу, BasePage.open снимает замер
+    каждой открытой страницы; тест может вызвать capture() и сам.
+    Артефакт пишется в --perf-dir после теста.
+    """
+    recorder = PerfRecorder(driver, request.node.nodeid)
+    recorder.install()
+    attach_perf_recorder(driver, recorder)
+    request.node.stash[_perf_recorder_key] = recorder
+    
+    yield recorder
+    
+    attach_perf_recorder(driver, None)
+    try:
+        path = recorder.write(request.config.getoption("--perf-dir"))
+        if path:
+            logging.getLogger(__name__).info("Замеры производительности: %s", path)
+    except OSError as e:
+        print(f"\n⚠️ Не удалось сохранить замеры производительности: {e}")
+
+
+@pytest.fixture(autouse=True)
+def _trace_actions(request):
+    """
+    С --trace-actions записывает trace теста (utils/tracing.py):
+    artifacts/traces/<test>.json и собственное время стеков для flamegraph.
+    """
+    if not request.config.getoption("--trace-actions"):
+        yield
+        return
+    
+    tracing.start_trace(request.node.nodeid)
+    if "driver" in request.fixturenames:
+        tracing.instrument_driver(request.getfixturevalue("driver"))
+    
+    yield
+    
+    tracer = tracing.stop_trace()
+    trace_dir = Path(request.config.getoption("--trace-dir"))
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    try:
+        tracer.write(trace_dir)
+        tracing.append_collapsed(tracer, trace_dir / f"collapsed-{worker}.txt")
+    except OSError as e:
+        print(f"\n⚠️ Не удалось сохранить trace теста: {e}")
+
+
+@pytest.fixture(autouse=True)
+def _perf_capture(request):
+    """С --perf-capture или --perf-baseline включает perf_recorder для всех тестов с браузером."""
+    capture = request.config.getoption("--perf-capture") or request.config.getoption("--perf-baseline")
+    if capture and "driver" in request.fixturenames:
+        request.getfixturevalue("perf_recorder")
 
 
 def pytest_sessionfinish(session, exitstatus):
-    """Закрыть shared driver в конце сессии."""
-    global _shared_driver
-    if _shared_driver is not None:
+    """Закрыть браузеры пула в конце сессии и обновить базу производительности."""
+    global _driver_pool
+    if _driver_pool is not None:
+        _driver_pool.close()
+        _driver_pool = None
+    
+    config = session.config
+    
+    # Воркер сохраняет статистику ожиданий, главный процесс сведёт её в сводке
+    stats = get_wait_stats()
+    if stats is not None and hasattr(config, "workerinput"):
+        worker = config.workerinput["workerid"]
+        stats.write(DEFAULT_STATS_PATH.with_name(f"wait-stats-{worker}.json"))
+    
+    # Collapsed stacks воркеров сливаются в один файл после их завершения
+    if config.getoption("--trace-actions") and not hasattr(config, "workerinput"):
+        collapsed = tracing.merge_collapsed(Path(config.getoption("--trace-dir")))
+        if collapsed:
+            print(f"\n✓ Collapsed stacks для flamegraph: {collapsed}")
+    
+    # Базу пишет только главный процесс: значения воркеров приходят в отчётах
+    if (_perf_baseline is not None and config.getoption("--perf-update-baseline")
+            and not hasattr(config, "workerinput") and _perf_values):
+        # Один запуск - одно значение на маршрут: медиана по всем тестам запуска
+        merged = {}
+        for values in _perf_values:
+            for key, metrics in values.items():
+                for metric, value in metrics.items():
+                    merged.setdefault(key, {}).setdefault(metric, []).append(value)
+        for key, metrics in merged.items():
+            _perf_baseline.record(key, {m: statistics.median(v) for m, v in metrics.items()})
         try:
-            if _is_browser_alive(_shared_driver):
-                _shared_driver.quit()
-        except Exception:
-            pass
-        finally:
-            _shared_driver = None
+            _perf_baseline.save()
+            print(f"\n✓ База производительности обновлена: {_perf_baseline.path}")
+        except OSError as e:
+            print(f"\n⚠️ Не удалось сохранить базу производительности: {e}")
 
 
 def _create_driver(browser: str, headless: bool):
     """
     Создать экземпляр WebDriver.
-    Selenium Manager автоматически скачивает нужный драйвер (Selenium 4.6+).
-    Явно используем Service для игнорирования устаревших драйверов в PATH.
+    Путь к драйверу определяется Selenium Manager один раз (utils/driver_resolver.py)
+    и передаётся в Service явно - устаревшие драйверы в PATH не используются,
+    а создание драйвера сводится к запуску процесса.
     """
-    # Временно удаляем chromedriver из PATH для Chrome, чтобы Selenium Manager
-    # использовал автоматически скачанный драйвер вместо устаревшего в PATH
-    original_path = None
-    if browser == "chrome":
-        original_path = os.environ.get("PATH", "")
-        # Удаляем C:\chromedriver_win32 из PATH если он там есть
-        path_dirs = original_path.split(os.pathsep)
-        path_dirs = [d for d in path_dirs if "chromedriver" not in d.lower()]
-        os.environ["PATH"] = os.pathsep.join(path_dirs)
+    paths = get_driver_resolver().resolve(browser)
     
-    try:
-        if browser == "chrome":
-            options = ChromeOptions()
-            if headless:
-                options.add_argument("--headless=new")
-            options.add_argument("--window-size=1920,1080")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-extensions")
-            options.add_argument("--disable-popup-blocking")
-            options.add_argument("--disable-infobars")
-            options.add_argument("--no-first-run")
-            options.add_argument("--no-default-browser-check")
-            options.add_argument("--disable-notifications")
-            options.add_argument("--disable-save-password-bubble")
-            
-            # Отключаем проверку паролей и предупреждения безопасности
-            prefs = {
-                "credentials_enable_service": False,
-                "profile.password_manager_enabled": False,
-                "profile.password_manager_leak_detection": False,
-                "safebrowsing.enabled": False,
-                "autofill.profile_enabled": False,
-            }
-            options.add_experimental_option("prefs", prefs)
-            options.add_experimental_option("excludeSwitches", ["enable-logging", "enable-automation"])
-            options.add_experimental_option("useAutomationExtension", False)
-
-            # Используем Service без указания пути - Selenium Manager автоматически скачает нужный драйвер
-            # Это игнорирует устаревшие драйверы в PATH
-            service = ChromeService()
-            driver = webdriver.Chrome(service=service, options=options)
-            
-        elif browser == "firefox":
-            options = FirefoxOptions()
-            if headless:
-                options.add_argument("--headless")
-            options.add_argument("--width=1920")
-            options.add_argument("--height=1080")
-            
-            # Используем Service для Firefox
-            service = FirefoxService()
-            driver = webdriver.Firefox(service=service, options=options)
-            
-        elif browser == "edge":
-            options = EdgeOptions()
-            if headless:
-                options.add_argument("--headless=new")
-            options.add_argument("--window-size=1920,1080")
-            
-            # Используем Service для Edge
-            service = EdgeService()
-            driver = webdriver.Edge(service=service, options=options)
-            
-        else:
-            raise ValueError(f"Unsupported browser: {browser}")
+    if browser == "chrome":
+        options = ChromeOptions()
+        # Alert не закрывается автоматически: его обрабатывают тесты и ожидания
+        options.unhandled_prompt_behavior = "ignore"
+        if headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-popup-blocking")
+        options.add_argument("--disable-infobars")
+        options.add_argument("--no-first-run")
+        options.add_argument("--no-default-browser-check")
+        options.add_argument("--disable-notifications")
+        options.add_argument("--disable-save-password-bubble")
+        
+        # Отключаем проверку паролей и предупреждения безопасности
+        prefs = {
+            "credentials_enable_service": False,
+            "profile.password_manager_enabled": False,
+            "profile.password_manager_leak_detection": False,
+            "safebrowsing.enabled": False,
+            "autofill.profile_enabled": False,
+        }
+        options.add_experimental_option("prefs", prefs)
+        options.add_experimental_option("excludeSwitches", ["enable-logging", "enable-automation"])
+        options.add_experimental_option("useAutomationExtension", False)
+        if paths["browser_path"]:
+            options.binary_location = paths["browser_path"]
+        
+        service = ChromeService(executable_path=paths["driver_path"])
+        driver = webdriver.Chrome(service=service, options=options)
+        
+    elif browser == "firefox":
+        options = FirefoxOptions()
+        # Alert не закрывается автоматически: его обрабатывают тесты и ожидания
+        options.unhandled_prompt_behavior = "ignore"
+        if headless:
+            options.add_argument("--headless")
+        options.add_argument("--width=1920")
+        options.add_argument("--height=1080")
+        if paths["browser_path"]:
+            options.binary_location = paths["browser_path"]
+        
+        service = FirefoxService(executable_path=paths["driver_path"])
+        driver = webdriver.Firefox(service=service, options=options)
+        
+    elif browser == "edge":
+        options = EdgeOptions()
+        # Alert не закрывается автоматически: его обрабатывают тесты и ожидания
+        options.unhandled_prompt_behavior = "ignore"
+        if headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+        if paths["browser_path"]:
+            options.binary_location = paths["browser_path"]
         
-        driver.implicitly_wait(10)
-        driver.set_page_load_timeout(30)
+        service = EdgeService(executable_path=paths["driver_path"])
+        driver = webdriver.Edge(service=service, options=options)
         
-        return driver
-    finally:
-        # Восстанавливаем оригинальный PATH
-        if original_path is not None:
-            os.environ["PATH"] = original_path
+    else:
+        raise ValueError(f"Unsupported browser: {browser}")
+    
+    # Implicit wait не используется: ожидания явные, с бюджетом на вызов (BasePage)
+    driver.implicitly_wait(0)
+    driver.set_page_load_timeout(30)
+    
+    # Трекер сети до скриптов приложения (в Chromium - для каждого документа)
+    install_network_tracker(driver)
+    
+    return driver
+
+
+@pytest.fixture(scope="session")
+def session_auth(api_url):
+    """
+    Кэш API-токенов: один логин через /api/login на пользователя в рамках воркера.
+    """
+    return SessionAuth(api_url)
 
 
 @pytest.fixture(scope="function")
-def logged_in_driver(driver, base_url, test_user):
+def logged_in_driver(driver, base_url, test_user, session_auth):
     """
     Fixture для WebDriver с выполненным входом в систему.
+    Токен кладётся в localStorage напрямую, без UI логина.
     """
-    from pages.login_page import LoginPage
-    
-    login_page = LoginPage(driver, base_url)
-    login_page.open()
-    login_page.login(test_user["username"], test_user["password"])
+    if session_auth.login(driver, base_url, test_user) is None:
+        pytest.skip("Тестовый пользователь не существует")
     
     yield driver
 
 
 @pytest.fixture(scope="session")
-def test_user():
+def identity_pool(request, api_url, admin_user, session_auth):
+    """
+    Пул собственных пользователей воркера (utils/identities.py).
+    Включается под xdist или с --isolated-users; None - если выключен
+    или админ недоступен (тогда тесты работают под общим testuser).
+    """
+    worker = getattr(request.config, "workerinput", {}).get("workerid")
+    if worker is None and not request.config.getoption("--isolated-users"):
+        return None
+    admin = session_auth.get_session(admin_user["username"], admin_user["password"])
+    if admin is None:
+        print("\n⚠️ Админ недоступен, изолированные пользователи не созданы")
+        return None
+    return IdentityPool(api_url, admin["token"], worker_id=worker or "main")
+
+
+@pytest.fixture(scope="function")
+def test_user(identity_pool):
     """
     Данные тестового пользователя.
+    При параллельном запуске - пользователь из пула воркера с пополненным
+    балансом, иначе общий TEST_USERNAME.
     """
-    return {
+    if identity_pool is not None:
+        with identity_pool.lease() as identity:
+            if identity is not None:
+                yield identity
+                return
+    
+    yield {
         "username": os.getenv("TEST_USERNAME", "testuser"),
         "password": os.getenv("TEST_PASSWORD", "testpass123")
     }
 
 
+@pytest.fixture(scope="session")
+def data_factory(api_url, admin_user, session_auth):
+    """
+    Фабрика тестовых данных через API (utils/data_factory.py), одна на воркер.
+    """
+    admin = session_auth.get_session(admin_user["username"], admin_user["password"])
+    if admin is None:
+        pytest.skip("Админ недоступен, тестовые данные не подготовить")
+    factory = DataFactory(api_url, admin["token"])
+    yield factory
+    factory.close()
+
+
+@pytest.fixture(scope="session")
+def active_auction(data_factory):
+    """
+    ID активного аукциона воркера: создаётся через POST /api/auctions со
+    startTime в прошлом, планировщик запускает его на ближайшем тике.
+    Первый раунд идёт час - аукцион остаётся активным до конца сессии.
+    """
+    try:
+        return data_factory.create_auction("active")
+    except DataFactoryError as e:
+        pytest.fail(f"Не удалось создать активный аукцион: {e}")
+
+
+@pytest.fixture(scope="function")
+def seed(request):
+    """
+    Данные, объявленные маркером теста:
+        @pytest.mark.needs(active_auction=1, bids=20)
+    Без маркера - пустой Seed.
+    """
+    marker = request.node.get_closest_marker("needs")
+    factory = request.getfixturevalue("data_factory")
+    try:
+        return factory.build(marker.kwargs if marker else {})
+    except DataFactoryError as e:
+        pytest.fail(f"Не удалось подготовить тестовые данные: {e}")
+
+
+@pytest.fixture(autouse=True)
+def _needs(request):
+    """Готовит данные маркера needs, даже если тест не запрашивает seed."""
+    if request.node.get_closest_marker("needs") is not None:
+        request.getfixturevalue("seed")
+
+
 @pytest.fixture(scope="session")
 def admin_user():
     """
@@ -386,15 +816,16 @@ def unique_user():
 
 
 @pytest.fixture(scope="function")
-def admin_logged_in_driver(driver, base_url, admin_user):
+def admin_logged_in_driver(driver, base_url, admin_user, session_auth):
     """
     Fixture для WebDriver с выполненным входом под админом.
+    Токен кладётся в localStorage напрямую, без UI логина.
     """
-    from pages.login_page import LoginPage
-    
-    login_page = LoginPage(driver, base_url)
-    login_page.open()
-    login_page.login(admin_user["username"], admin_user["password"])
+    user = session_auth.login(driver, base_url, admin_user)
+    if user is None:
+        pytest.skip("Админ пользователь не существует")
+    if user.get("role") != "admin":
+        pytest.skip("Пользователь не имеет прав администратора")
     
     yield driver
 
@@ -404,10 +835,14 @@ def admin_logged_in_driver(driver, base_url, admin_user):
 def pytest_runtest_makereport(item, call):
     """
     Создание скриншота при падении теста.
+    Сравнение замеров производительности с базой (--perf-baseline).
     """
     outcome = yield
     report = outcome.get_result()
     
+    if report.when == "call":
+        _check_perf_baseline(item, report)
+    
     if report.when == "call" and report.failed:
         driver = item.funcargs.get("driver")
         if driver:
@@ -429,3 +864,80 @@ def pytest_runtest_makereport(item, call):
                 print(f"\n📸 Скриншот сохранён: {screenshot_path}")
             except Exception as e:
                 print(f"\n⚠️ Не удалось сохранить скриншот: {e}")
+
+
+def _check_perf_baseline(item, report) -> None:
+    """
+    Сравнить замеры теста с базой: таблица - в pytest-html, регрессии -
+    в отчёт теста (с --perf-gate=fail тест падает). Значения для обновления
+    базы передаются в user_properties, чтобы дойти от воркеров xdist.
+    """
+    recorder = item.stash.get(_perf_recorder_key, None)
+    if _perf_baseline is None or recorder is None or not recorder.samples:
+        return
+    
+    if report.passed:
+        report.user_properties.append(("perf_values", collect_values(recorder.samples)))
+    
+    rows = _perf_baseline.compare(recorder.samples, _perf_tolerance)
+    if not rows:
+        return
+    
+    if html_extras is not None:
+        report.extras = getattr(report, "extras", []) + [html_extras.html(format_rows_html(rows))]
+    
+    regressions = [format_regression(row) for row in rows if row["regression"]]
+    if not regressions:
+        return
+    report.user_properties.append(("perf_regressions", regressions))
+    
+    text = f"Регрессия производительности (допуск {_perf_tolerance:.0%}):\n" + "\n".join(regressions)
+    if item.config.getoption("--perf-gate") == "fail" and report.passed:
+        report.outcome = "failed"
+        report.longrepr = text
+    else:
+        report.sections.append(("Производительность", text))
+
+
+def pytest_runtest_logreport(report):
+    """Собрать значения и регрессии производительности (в т.ч. от воркеров xdist)."""
+    for name, value in report.user_properties:
+        if name == "perf_values":
+            _perf_values.append(value)
+        elif name == "perf_regressions":
+            _perf_regressions.append((report.nodeid, value))
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Сводка регрессий производительности и самых дорогих ожиданий."""
+    if _perf_regressions:
+        terminalreporter.section("Регрессии производительности")
+        for nodeid, regressions in _perf_regressions:
+            terminalreporter.write_line(nodeid)
+            for line in regressions:
+                terminalreporter.write_line(f"    {line}")
+    
+    stats = get_wait_stats()
+    if stats is not None:
+        _report_wait_stats(terminalreporter, stats)
+
+
+def _report_wait_stats(terminalreporter, stats) -> None:
+    """Свести статистику ожиданий воркеров и вывести top-50."""
+    for part in sorted(DEFAULT_STATS_PATH.parent.glob("wait-stats-*.json")):
+        try:
+            stats.load(part)
+            part.unlink()
+        except (OSError, ValueError) as e:
+            terminalreporter.write_line(f"⚠️ Не удалось прочитать {part}: {e}")
+    if not stats.entries:
+        return
+    
+    terminalreporter.section("Самые дорогие ожидания (top 50)")
+    for line in stats.format_lines():
+        terminalreporter.write_line(line)
+    try:
+        stats.write(DEFAULT_STATS_PATH)
+        terminalreporter.write_line(f"\nПолная статистика: {DEFAULT_STATS_PATH}")
+    except OSError as e:
+        terminalreporter.write_line(f"⚠️ Не удалось сохранить статистику ожиданий: {e}")
@@ -1,7 +1,6 @@
 """
 Page Object для админ панели.
 """
-import time
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 from typing import List, Dict
@@ -85,7 +84,7 @@ class AdminPage(BasePage):
     # Методы работы с табами
     def get_tabs(self) -> List[str]:
         """Получить список табов."""
-        tabs = self.find_elements(self.TABS)
+        tabs = self.find_elements(self.TABS, timeout=self.DEFAULT_TIMEOUT)
         return [tab.text for tab in tabs]
     
     def get_active_tab(self) -> str:
@@ -94,13 +93,13 @@ class AdminPage(BasePage):
     
     def click_stats_tab(self) -> None:
         """Переключиться на таб статистики."""
-        tabs = self.find_elements(self.TABS)
+        tabs = self.find_elements(self.TABS, timeout=self.DEFAULT_TIMEOUT)
         if tabs:
             tabs[0].click()
     
     def _click_tab(self, index: int) -> None:
         """Кликнуть по табу с индексом, используя JavaScript для избежания перекрытия."""
-        tabs = self.find_elements(self.TABS)
+        tabs = self.find_elements(self.TABS, timeout=self.DEFAULT_TIMEOUT)
         if len(tabs) > index:
             # Скролл к элементу и клик через JS для избежания ElementClickInterceptedException
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tabs[index])
@@ -145,39 +144,22 @@ class AdminPage(BasePage):
     
     def get_volume_info(self) -> List[Dict]:
         """Получить информацию о объёмах."""
-        volumes = []
-        try:
-            cards = self.find_elements(self.VOLUME_CARDS)
-            for card in cards:
-                volume = {
-                    "currency": card.find_element(By.CSS_SELECTOR, ".currency-badge").text,
-                    "amount": card.find_element(By.CSS_SELECTOR, ".volume-amount").text
-                }
-                volumes.append(volume)
-        except:
-            pass
-        return volumes
+        return self.extract_table({
+            "rows": self.VOLUME_CARDS,
+            "fields": {"currency": ".currency-badge", "amount": ".volume-amount"}
+        })
     
     # Методы работы с аукционами
+    # Пустая таблица - строка td.empty: она тоже подходит под локатор строк,
+    # поэтому wait_for=True дожидается самой таблицы
     def get_auctions_list(self) -> List[Dict]:
         """Получить список аукционов из таблицы."""
-        auctions = []
-        try:
-            rows = self.find_elements(self.AUCTION_ROWS)
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if len(cells) >= 5:
-                    auction = {
-                        "title": cells[0].text,
-                        "status": cells[1].text,
-                        "round": cells[2].text,
-                        "items": cells[3].text,
-                        "currency": cells[4].text
-                    }
-                    auctions.append(auction)
-        except:
-            pass
-        return auctions
+        return self.extract_table({
+            "rows": self.AUCTION_ROWS,
+            "wait_for": True,
+            "min_cells": 5,
+            "fields": {"title": 0, "status": 1, "round": 2, "items": 3, "currency": 4}
+        })
     
     def click_refresh_auctions(self) -> None:
         """Нажать кнопку обновления списка аукционов."""
@@ -215,7 +197,7 @@ class AdminPage(BasePage):
         """
         # Ждём появления формы
         self.wait_for_element_visible(self.CREATE_FORM, timeout=10)
-        time.sleep(1)  # Даём форме полностью отрендериться
+        self.wait_for_dom_stable()  # Даём форме полностью отрендериться
         
         # Заполняем название через JavaScript для надёжности
         self.driver.execute_script("""
@@ -311,49 +293,26 @@ class AdminPage(BasePage):
         self.click_create_auction()
         
         # Ждём ответа сервера
-        time.sleep(3)
+        self.wait_for_network_idle()
 
         return self.is_create_success_displayed()
     
     # Методы работы с транзакциями
     def get_transactions_list(self) -> List[Dict]:
         """Получить список транзакций из таблицы."""
-        transactions = []
-        try:
-            rows = self.find_elements(self.TRANSACTION_ROWS)
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if len(cells) >= 6:
-                    tx = {
-                        "id": cells[0].text,
-                        "type": cells[1].text,
-                        "amount": cells[2].text,
-                        "status": cells[3].text,
-                        "provider": cells[4].text,
-                        "date": cells[5].text
-                    }
-                    transactions.append(tx)
-        except:
-            pass
-        return transactions
+        return self.extract_table({
+            "rows": self.TRANSACTION_ROWS,
+            "wait_for": True,
+            "min_cells": 6,
+            "fields": {"id": 0, "type": 1, "amount": 2, "status": 3, "provider": 4, "date": 5}
+        })
     
     # Методы работы с событиями
     def get_events_list(self) -> List[Dict]:
         """Получить список событий из таблицы."""
-        events = []
-        try:
-            rows = self.find_elements(self.EVENT_ROWS)
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if len(cells) >= 5:
-                    event = {
-                        "type": cells[0].text,
-                        "user_id": cells[1].text,
-                        "auction_id": cells[2].text,
-                        "payload": cells[3].text,
-                        "date": cells[4].text
-                    }
-                    events.append(event)
-        except:
-            pass
-        return events
+        return self.extract_table({
+            "rows": self.EVENT_ROWS,
+            "wait_for": True,
+            "min_cells": 5,
+            "fields": {"type": 0, "user_id": 1, "auction_id": 2, "payload": 3, "date": 4}
+        })
@@ -55,9 +55,9 @@ class AuctionDetailPage(BasePage):
         self.path = "/auctions"
     
     def open(self, auction_id: str) -> "AuctionDetailPage":
-        """Открыть страницу конкретного аукциона."""
+        """Открыть страницу аукциона и дождаться топа ставок (или его пустого состояния)."""
         super().open(f"{self.path}/{auction_id}")
-        self.wait_for_spinner_disappear()
+        self.wait_for_list(self.BID_ROWS, self.EMPTY_BIDS, self.ERROR_STATE)
         return self
     
     def is_loading(self) -> bool:
@@ -167,36 +167,25 @@ class AuctionDetailPage(BasePage):
         Ожидание результата ставки.
         Возвращает 'success', 'error' или 'timeout'.
         """
-        import time
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            if self.is_bid_success_displayed():
-                return "success"
-            if self.is_bid_error_displayed():
-                return "error"
-            time.sleep(0.5)
-        
-        return "timeout"
+        outcome = self.wait_for_any({
+            "success": self.BID_SUCCESS,
+            "error": self.BID_ERROR
+        }, timeout)
+        return outcome or "timeout"
     
     def get_top_bids(self) -> List[dict]:
         """
         Получить список топ ставок.
         """
-        bids = []
-        try:
-            rows = self.find_elements(self.BID_ROWS)
-            for row in rows:
-                bid = {
-                    "rank": row.find_element(By.CSS_SELECTOR, ".bid-rank").text,
-                    "user": row.find_element(By.CSS_SELECTOR, ".bid-user").text,
-                    "amount": row.find_element(By.CSS_SELECTOR, ".bid-amount").text,
-                    "winning": "winning" in row.get_attribute("class")
-                }
-                bids.append(bid)
-        except:
-            pass
-        return bids
+        return self.extract_table({
+            "rows": self.BID_ROWS,
+            "fields": {
+                "rank": ".bid-rank",
+                "user": ".bid-user",
+                "amount": ".bid-amount",
+                "winning": {"has_class": "winning"}
+            }
+        })
     
     def get_top_bids_count(self) -> int:
         """Получить количество топ ставок."""
@@ -20,6 +20,7 @@ class AuctionsPage(BasePage):
     LOADING_STATE = (By.CSS_SELECTOR, ".loading-state")
     EMPTY_STATE = (By.CSS_SELECTOR, ".empty-state")
     EMPTY_ICON = (By.CSS_SELECTOR, ".empty-icon")
+    ERROR_STATE = (By.CSS_SELECTOR, ".alert-error")
     
     # Сетка аукционов
     AUCTIONS_GRID = (By.CSS_SELECTOR, ".auctions-grid")
@@ -38,9 +39,9 @@ class AuctionsPage(BasePage):
         self.path = "/auctions"
     
     def open(self) -> "AuctionsPage":
-        """Открыть страницу аукционов."""
+        """Открыть страницу аукционов и дождаться карточек или пустого списка."""
         super().open(self.path)
-        self.wait_for_spinner_disappear()
+        self.wait_for_list(self.AUCTION_CARDS, self.EMPTY_STATE, self.ERROR_STATE)
         return self
     
     def get_page_title(self) -> str:
@@ -79,29 +80,18 @@ class AuctionsPage(BasePage):
         """
         Получить информацию о всех карточках аукционов.
         """
-        cards = self.find_elements(self.AUCTION_CARDS)
-        auctions = []
-        
-        for card in cards:
-            try:
-                auction = {
-                    "title": card.find_element(By.CSS_SELECTOR, ".auction-title").text,
-                    "description": card.find_element(By.CSS_SELECTOR, ".auction-description").text,
-                    "status": card.find_element(By.CSS_SELECTOR, ".badge").text,
-                    "currency": card.find_element(By.CSS_SELECTOR, ".currency-badge").text,
-                }
-                
-                # Получаем статистику раундов и лотов
-                stats = card.find_elements(By.CSS_SELECTOR, ".stat-value")
-                if len(stats) >= 2:
-                    auction["round"] = stats[0].text
-                    auction["items"] = stats[1].text
-                
-                auctions.append(auction)
-            except Exception as e:
-                continue
-        
-        return auctions
+        return self.extract_table({
+            "rows": self.AUCTION_CARDS,
+            "fields": {
+                "title": ".auction-title",
+                "description": ".auction-description",
+                "status": ".badge",
+                "currency": ".currency-badge",
+                # Статистика раундов и лотов
+                "round": {"selector": ".stat-value", "index": 0, "optional": True},
+                "items": {"selector": ".stat-value", "index": 1, "optional": True}
+            }
+        })
     
     def get_auction_by_title(self, title: str) -> Optional[dict]:
         """Найти аукцион по названию."""
@@ -111,79 +101,52 @@ class AuctionsPage(BasePage):
                 return auction
         return None
     
+    def _get_card_headers(self) -> List[dict]:
+        """Название и статус каждой карточки (порядок совпадает с AUCTION_CARDS)."""
+        return self.extract_table({
+            "rows": self.AUCTION_CARDS,
+            "fields": {
+                "title": {"selector": ".auction-title", "optional": True},
+                "status": {"selector": ".badge", "optional": True}
+            }
+        })
+    
+    def _click_card_details(self, index: int) -> bool:
+        """Клик по кнопке 'Подробнее' карточки с индексом index."""
+        try:
+            cards = self.find_elements(self.AUCTION_CARDS)
+            cards[index].find_element(By.CSS_SELECTOR, ".btn-primary").click()
+            return True
+        except:
+            return False
+    
     def click_auction_by_title(self, title: str) -> bool:
         """Клик по кнопке 'Подробнее' для аукциона с указанным названием."""
-        cards = self.find_elements(self.AUCTION_CARDS)
-        
-        for card in cards:
-            try:
-                card_title = card.find_element(By.CSS_SELECTOR, ".auction-title").text
-                if title.lower() in card_title.lower():
-                    detail_btn = card.find_element(By.CSS_SELECTOR, ".btn-primary")
-                    detail_btn.click()
-                    return True
-            except:
-                continue
+        for index, card in enumerate(self._get_card_headers()):
+            if title.lower() in card.get("title", "").lower():
+                return self._click_card_details(index)
         
         return False
     
     def click_first_auction(self) -> bool:
         """Клик по первому аукциону в списке."""
-        try:
-            cards = self.find_elements(self.AUCTION_CARDS)
-            if cards:
-                detail_btn = cards[0].find_element(By.CSS_SELECTOR, ".btn-primary")
-                detail_btn.click()
-                return True
-        except:
-            pass
-        return False
+        return self._click_card_details(0)
     
     def click_first_active_auction(self) -> bool:
         """Клик по первому активному аукциону."""
-        cards = self.find_elements(self.AUCTION_CARDS)
-        
-        for card in cards:
-            try:
-                status = card.find_element(By.CSS_SELECTOR, ".badge").text
-                if "Активен" in status:
-                    detail_btn = card.find_element(By.CSS_SELECTOR, ".btn-primary")
-                    detail_btn.click()
-                    return True
-            except:
-                continue
+        for index, card in enumerate(self._get_card_headers()):
+            if "Активен" in card.get("status", ""):
+                return self._click_card_details(index)
         
         return False
     
     def get_active_auctions_count(self) -> int:
         """Получить количество активных аукционов."""
-        count = 0
-        cards = self.find_elements(self.AUCTION_CARDS)
-        
-        for card in cards:
-            try:
-                status = card.find_element(By.CSS_SELECTOR, ".badge").text
-                if "Активен" in status:
-                    count += 1
-            except:
-                continue
-        
-        return count
+        return sum(1 for card in self._get_card_headers() if "Активен" in card.get("status", ""))
     
     def get_scheduled_auctions_count(self) -> int:
         """Получить количество запланированных аукционов."""
-        count = 0
-        cards = self.find_elements(self.AUCTION_CARDS)
-        
-        for card in cards:
-            try:
-                status = card.find_element(By.CSS_SELECTOR, ".badge").text
-                if "Запланирован" in status:
-                    count += 1
-            except:
-                continue
-        
-        return count
+        return sum(1 for card in self._get_card_headers() if "Запланирован" in card.get("status", ""))
     
     def wait_for_auctions_loaded(self, timeout: int = 10) -> bool:
         """Ожидание загрузки аукционов."""
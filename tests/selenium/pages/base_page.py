@@ -8,8 +8,58 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from typing import List, Optional
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    JavascriptException,
+    StaleElementReferenceException,
+    UnexpectedAlertPresentException
+)
+from typing import Callable, Dict, List, Optional, Union
+from utils import waits
+from utils.perf import get_perf_recorder
+from utils.wait_stats import RecordedWait
+
+
+# Чтение списка строк за один execute_script (см. BasePage.extract_table)
+EXTRACT_TABLE_JS = """
+const spec = arguments[0];
+const text = el => (el.innerText || el.textContent || '').trim();
+let rows;
+if (spec.rows.xpath) {
+    const snapshot = document.evaluate(spec.rows.xpath, document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    rows = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) rows.push(snapshot.snapshotItem(i));
+} else {
+    rows = Array.from(document.querySelectorAll(spec.rows.css));
+}
+const result = [];
+for (const row of rows) {
+    const cells = row.querySelectorAll(':scope > td');
+    if (cells.length < spec.minCells) continue;
+    const item = {};
+    let complete = true;
+    for (const [name, field] of Object.entries(spec.fields)) {
+        let target = row;
+        if (field.cell !== undefined) {
+            target = cells[field.cell];
+        } else if (field.selector) {
+            target = row.querySelectorAll(field.selector)[field.index || 0];
+        }
+        if (!target) {
+            if (field.optional) continue;
+            complete = false;
+            break;
+        }
+        if (field.has_class) item[name] = target.classList.contains(field.has_class);
+        else if (field.attr) item[name] = target.getAttribute(field.attr);
+        else item[name] = text(target);
+    }
+    if (complete) result.push(item);
+}
+return result;
+"""
 
 
 class BasePage:
@@ -33,16 +83,40 @@ class BasePage:
     ALERT_ERROR = (By.CSS_SELECTOR, ".alert-error")
     ALERT_SUCCESS = (By.CSS_SELECTOR, ".alert-success")
     
+    # Бюджет ожидания по умолчанию и интервал опроса (--wait-timeout, --poll-interval).
+    # Implicit wait у драйвера всегда 0: все ожидания явные и укладываются в бюджет вызова.
+    DEFAULT_TIMEOUT = 10
+    POLL_INTERVAL = 0.1
+    
     def __init__(self, driver: WebDriver, base_url: str):
         self.driver = driver
         self.base_url = base_url
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = self._wait()
         self.actions = ActionChains(driver)
     
+    def _budget(self, timeout: Optional[float]) -> float:
+        """Бюджет вызова: timeout или DEFAULT_TIMEOUT."""
+        return self.DEFAULT_TIMEOUT if timeout is None else timeout
+    
+    def _wait(self, timeout: Optional[float] = None, locator: Optional[tuple] = None) -> WebDriverWait:
+        """
+        WebDriverWait с бюджетом timeout (по умолчанию DEFAULT_TIMEOUT).
+        locator попадает в статистику ожиданий (--wait-stats).
+        """
+        return RecordedWait(self.driver, self._budget(timeout), self.POLL_INTERVAL, locator)
+    
     def open(self, path: str = "") -> "BasePage":
-        """Открыть страницу по заданному пути."""
+        """
+        Открыть страницу по заданному пути.
+        С --perf-capture дожидается загрузки страницы и снимает замер производительности.
+        """
         url = f"{self.base_url}{path}"
         self.driver.get(url)
+        waits.install_network_tracker(self.driver)
+        recorder = get_perf_recorder(self.driver)
+        if recorder is not None:
+            self.wait_for_page_settled()
+            recorder.capture(route=path or "/", page=type(self).__name__)
         return self
     
     def get_current_url(self) -> str:
@@ -54,41 +128,91 @@ class BasePage:
         return self.driver.title
     
     # Методы ожидания
-    def wait_for_element(self, locator: tuple, timeout: int = 10) -> WebElement:
+    def wait_for_element(self, locator: tuple, timeout: Optional[float] = None) -> WebElement:
         """Ожидание появления элемента."""
-        wait = WebDriverWait(self.driver, timeout)
+        wait = self._wait(timeout, locator)
         return wait.until(EC.presence_of_element_located(locator))
     
-    def wait_for_element_visible(self, locator: tuple, timeout: int = 10) -> WebElement:
+    def wait_for_element_visible(self, locator: tuple, timeout: Optional[float] = None) -> WebElement:
         """Ожидание видимости элемента."""
-        wait = WebDriverWait(self.driver, timeout)
+        wait = self._wait(timeout, locator)
         return wait.until(EC.visibility_of_element_located(locator))
     
-    def wait_for_element_clickable(self, locator: tuple, timeout: int = 10) -> WebElement:
+    def wait_for_element_clickable(self, locator: tuple, timeout: Optional[float] = None) -> WebElement:
         """Ожидание кликабельности элемента."""
-        wait = WebDriverWait(self.driver, timeout)
+        wait = self._wait(timeout, locator)
         return wait.until(EC.element_to_be_clickable(locator))
     
-    def wait_for_elements(self, locator: tuple, timeout: int = 10) -> List[WebElement]:
+    def wait_for_elements(self, locator: tuple, timeout: Optional[float] = None) -> List[WebElement]:
         """Ожидание появления нескольких элементов."""
-        wait = WebDriverWait(self.driver, timeout)
+        wait = self._wait(timeout, locator)
         return wait.until(EC.presence_of_all_elements_located(locator))
     
-    def wait_for_element_invisible(self, locator: tuple, timeout: int = 10) -> bool:
+    def wait_for_element_invisible(self, locator: tuple, timeout: Optional[float] = None) -> bool:
         """Ожидание исчезновения элемента."""
-        wait = WebDriverWait(self.driver, timeout)
+        wait = self._wait(timeout, locator)
         return wait.until(EC.invisibility_of_element_located(locator))
     
-    def wait_for_url_contains(self, text: str, timeout: int = 10) -> bool:
+    def wait_for_url_contains(self, text: str, timeout: Optional[float] = None) -> bool:
         """Ожидание изменения URL."""
-        wait = WebDriverWait(self.driver, timeout)
+        wait = self._wait(timeout, ("url contains", text))
         return wait.until(EC.url_contains(text))
     
-    def wait_for_text_in_element(self, locator: tuple, text: str, timeout: int = 10) -> bool:
+    def wait_for_text_in_element(self, locator: tuple, text: str, timeout: Optional[float] = None) -> bool:
         """Ожидание текста в элементе."""
-        wait = WebDriverWait(self.driver, timeout)
+        wait = self._wait(timeout, locator)
         return wait.until(EC.text_to_be_present_in_element(locator, text))
     
+    def wait_for_any(
+        self,
+        outcomes: Dict[str, Union[tuple, Callable]],
+        timeout: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Ожидание первого из нескольких исходов действия.
+        
+        Args:
+            outcomes: {имя: локатор видимого элемента или условие вида EC.*}
+                      например {"success": self.SUCCESS, "alert": EC.alert_is_present()}
+            timeout: общий бюджет ожидания
+        
+        Returns:
+            имя первого наступившего исхода или None по таймауту
+        """
+        def first_reached(driver):
+            for name, outcome in outcomes.items():
+                try:
+                    if isinstance(outcome, tuple):
+                        reached = any(el.is_displayed() for el in driver.find_elements(*outcome))
+                    else:
+                        reached = outcome(driver)
+                except (StaleElementReferenceException, UnexpectedAlertPresentException):
+                    # Элемент перерисовался или открыт alert - проверяем остальные исходы
+                    reached = False
+                if reached:
+                    return name
+            return False
+        
+        try:
+            return self._wait(timeout, ("any", "|".join(outcomes))).until(first_reached)
+        except TimeoutException:
+            return None
+    
+    def wait_for_list(self, rows: tuple, *empty: tuple, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Ожидание списка: строк или пустого состояния (ошибки).
+        Представления загружаются лениво - сразу после open() компонента
+        может ещё не быть, и список прочитался бы пустым.
+        
+        Returns:
+            "rows", "empty" или None по таймауту
+        """
+        outcomes = {"rows": rows}
+        for index, locator in enumerate(empty):
+            outcomes["empty" if index == 0 else f"empty{index}"] = locator
+        outcome = self.wait_for_any(outcomes, timeout)
+        return "empty" if outcome and outcome.startswith("empty") else outcome
+    
     def wait_for_spinner_disappear(self, timeout: int = 30) -> bool:
         """Ожидание исчезновения спиннера загрузки."""
         try:
@@ -96,13 +220,53 @@ class BasePage:
         except TimeoutException:
             return True
     
+    # Ожидание состояний страницы (вместо time.sleep)
+    def wait_for_network_idle(self, quiet_ms: int = 300, timeout: Optional[float] = None) -> bool:
+        """Ожидание завершения всех fetch/XHR запросов и подключений WebSocket."""
+        return waits.wait_for_network_idle(self.driver, quiet_ms, self._budget(timeout))
+    
+    def wait_for_render(self) -> bool:
+        """Ожидание отрисовки изменений Vue (два кадра)."""
+        return waits.wait_for_render(self.driver)
+    
+    def wait_for_dom_stable(self, quiet_ms: int = 200, timeout: Optional[float] = None) -> bool:
+        """Ожидание, пока DOM перестанет меняться."""
+        return waits.wait_for_dom_stable(self.driver, quiet_ms, self._budget(timeout))
+    
+    def wait_for_page_settled(self, timeout: Optional[float] = None) -> bool:
+        """
+        Ожидание, пока страница отреагирует на действие:
+        сеть простаивает, DOM не меняется, кадр отрисован.
+        Открытый alert тоже завершает ожидание.
+        """
+        return waits.wait_for_page_settled(self.driver, self._budget(timeout))
+    
+    def is_alert_present(self) -> bool:
+        """Проверка наличия alert (не закрывая его)."""
+        return waits.is_alert_present(self.driver)
+    
     # Методы взаимодействия
-    def find_element(self, locator: tuple) -> WebElement:
-        """Найти элемент по локатору."""
-        return self.driver.find_element(*locator)
+    def find_element(self, locator: tuple, timeout: Optional[float] = None) -> WebElement:
+        """
+        Найти элемент по локатору, ожидая его появления не дольше timeout.
+        При отсутствии бросает NoSuchElementException, как driver.find_element.
+        """
+        try:
+            return self.wait_for_element(locator, timeout)
+        except TimeoutException:
+            raise NoSuchElementException(f"Элемент не найден за {self._budget(timeout)} с: {locator}")
     
-    def find_elements(self, locator: tuple) -> List[WebElement]:
-        """Найти элементы по локатору."""
+    def find_elements(self, locator: tuple, timeout: float = 0) -> List[WebElement]:
+        """
+        Найти элементы по локатору.
+        По умолчанию - одна проверка без ожидания (пустой список сразу).
+        С timeout - ждать появления хотя бы одного элемента.
+        """
+        if timeout:
+            try:
+                return self.wait_for_elements(locator, timeout)
+            except TimeoutException:
+                return []
         return self.driver.find_elements(*locator)
     
     def click(self, locator: tuple) -> None:
@@ -140,22 +304,88 @@ class BasePage:
         return element.get_attribute(attribute)
     
     def is_element_present(self, locator: tuple) -> bool:
-        """Проверка наличия элемента."""
-        try:
-            self.driver.find_element(*locator)
-            return True
-        except NoSuchElementException:
-            return False
+        """Проверка наличия элемента (одна проверка, без ожидания)."""
+        return len(self.driver.find_elements(*locator)) > 0
+    
+    def assert_absent(self, locator: tuple, message: Optional[str] = None, settle: bool = True) -> None:
+        """
+        Проверить, что видимого элемента нет.
+        Ждёт, пока страница успокоится (сеть, DOM), и проверяет один раз,
+        вместо ожидания полного таймаута на отсутствующий элемент.
+        """
+        if settle:
+            self.wait_for_page_settled()
+        visible = self.execute_script(
+            "return Array.from(arguments[0]).some(el => el.getClientRects().length > 0);",
+            self.driver.find_elements(*locator)
+        )
+        assert not visible, message or f"Элемент не должен отображаться: {locator}"
     
     def is_element_visible(self, locator: tuple, timeout: int = 3) -> bool:
         """Проверка видимости элемента."""
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self._wait(timeout, locator)
             wait.until(EC.visibility_of_element_located(locator))
             return True
         except TimeoutException:
             return False
     
+    def extract_table(self, spec: dict) -> List[dict]:
+        """
+        Прочитать список строк (таблица, карточки) за один вызов execute_script.
+        
+        spec:
+            rows: локатор строк (CSS или XPath)
+            fields: {имя: описание поля}, где описание:
+                "css"  - текст первого элемента внутри строки
+                int    - текст ячейки td с этим индексом
+                dict   - {"selector": css, "index": n, "cell": i,
+                          "attr": имя атрибута, "has_class": класс (bool),
+                          "optional": поле можно пропустить}
+                         без selector/cell берётся сама строка
+            min_cells: пропускать строки, где ячеек td меньше
+            wait_for: перед чтением дождаться строк (True) или строк либо
+                      одного из локаторов пустого состояния (кортеж локаторов)
+        
+        Строки без обязательного поля пропускаются.
+        """
+        wait_for = spec.get("wait_for")
+        if wait_for:
+            self.wait_for_list(spec["rows"], *(() if wait_for is True else wait_for))
+
+        by, value = spec["rows"]
+        if by == By.XPATH:
+            rows = {"xpath": value}
+        elif by == By.CSS_SELECTOR:
+            rows = {"css": value}
+        elif by == By.ID:
+            rows = {"css": f"#{value}"}
+        elif by == By.CLASS_NAME:
+            rows = {"css": f".{value}"}
+        elif by == By.TAG_NAME:
+            rows = {"css": value}
+        else:
+            raise ValueError(f"Unsupported locator for extract_table: {by}")
+        
+        fields = {}
+        for name, field in spec["fields"].items():
+            if isinstance(field, str):
+                fields[name] = {"selector": field}
+            elif isinstance(field, int):
+                fields[name] = {"cell": field}
+            else:
+                fields[name] = dict(field)
+        
+        try:
+            return self.driver.execute_script(EXTRACT_TABLE_JS, {
+                "rows": rows,
+                "fields": fields,
+                "minCells": spec.get("min_cells", 0)
+            }) or []
+        except JavascriptException:
+            # Невалидный селектор или страница перезагрузилась
+            return []
+    
     def scroll_to_element(self, locator: tuple) -> None:
         """Прокрутка к элементу."""
         element = self.find_element(locator)
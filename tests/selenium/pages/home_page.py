@@ -66,12 +66,12 @@ class HomePage(BasePage):
     
     def get_feature_cards_count(self) -> int:
         """Получить количество feature карточек."""
-        cards = self.find_elements(self.FEATURE_CARDS)
+        cards = self.find_elements(self.FEATURE_CARDS, timeout=self.DEFAULT_TIMEOUT)
         return len(cards)
     
     def get_feature_cards_titles(self) -> list:
         """Получить заголовки всех feature карточек."""
-        cards = self.find_elements(self.FEATURE_CARDS)
+        cards = self.find_elements(self.FEATURE_CARDS, timeout=self.DEFAULT_TIMEOUT)
         return [card.find_element(By.TAG_NAME, "h3").text for card in cards]
     
     def is_stats_section_visible(self) -> bool:
@@ -80,17 +80,17 @@ class HomePage(BasePage):
     
     def get_stats_count(self) -> int:
         """Получить количество stat элементов."""
-        stats = self.find_elements(self.STAT_ITEMS)
+        stats = self.find_elements(self.STAT_ITEMS, timeout=self.DEFAULT_TIMEOUT)
         return len(stats)
     
     def get_stats_values(self) -> list:
         """Получить значения статистики."""
-        numbers = self.find_elements(self.STAT_NUMBERS)
+        numbers = self.find_elements(self.STAT_NUMBERS, timeout=self.DEFAULT_TIMEOUT)
         return [num.text for num in numbers]
     
     def get_floating_cards_count(self) -> int:
         """Получить количество плавающих карточек."""
-        cards = self.find_elements(self.FLOATING_CARDS)
+        cards = self.find_elements(self.FLOATING_CARDS, timeout=self.DEFAULT_TIMEOUT)
         return len(cards)
     
     def is_login_buttons_visible(self) -> bool:
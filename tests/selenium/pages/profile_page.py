@@ -2,8 +2,9 @@
 Page Object для страницы профиля пользователя.
 """
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
 from pages.base_page import BasePage
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 
 class ProfilePage(BasePage):
@@ -55,9 +56,9 @@ class ProfilePage(BasePage):
         self.path = "/profile"
     
     def open(self) -> "ProfilePage":
-        """Открыть страницу профиля."""
+        """Открыть страницу профиля и дождаться истории транзакций (или пустого состояния)."""
         super().open(self.path)
-        self.wait_for_spinner_disappear()
+        self.wait_for_list(self.TRANSACTION_ROWS, self.TRANSACTIONS_EMPTY)
         return self
     
     def get_page_title(self) -> str:
@@ -91,7 +92,7 @@ class ProfilePage(BasePage):
     
     def get_balance_cards_count(self) -> int:
         """Получить количество карточек баланса."""
-        return len(self.find_elements(self.BALANCE_CARDS))
+        return len(self.find_elements(self.BALANCE_CARDS, timeout=self.DEFAULT_TIMEOUT))
     
     # Методы работы с депозитом
     def select_deposit_currency(self, currency: str) -> "ProfilePage":
@@ -124,6 +125,16 @@ class ProfilePage(BasePage):
         """Получить ссылку на оплату депозита."""
         return self.get_attribute(self.DEPOSIT_LINK, "href")
     
+    def wait_for_deposit_result(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Ожидание результата депозита.
+        Возвращает 'success' (ссылка на оплату), 'alert' (ошибка) или None по таймауту.
+        """
+        return self.wait_for_any({
+            "alert": EC.alert_is_present(),
+            "success": self.DEPOSIT_SUCCESS
+        }, timeout)
+    
     def is_deposit_button_disabled(self) -> bool:
         """Проверить, заблокирована ли кнопка депозита."""
         button = self.find_element(self.DEPOSIT_BUTTON)
@@ -162,6 +173,13 @@ class ProfilePage(BasePage):
         self.enter_withdraw_address(address)
         self.click_withdraw()
     
+    def wait_for_withdraw_result(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Ожидание результата вывода.
+        Frontend сообщает и успех, и ошибку через alert: возвращает 'alert' или None.
+        """
+        return self.wait_for_any({"alert": EC.alert_is_present()}, timeout)
+    
     def is_withdraw_button_disabled(self) -> bool:
         """Проверить, заблокирована ли кнопка вывода."""
         button = self.find_element(self.WITHDRAW_BUTTON)
@@ -192,23 +210,11 @@ class ProfilePage(BasePage):
         """
         Получить список транзакций.
         """
-        transactions = []
-        try:
-            rows = self.find_elements(self.TRANSACTION_ROWS)
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if len(cells) >= 5:
-                    tx = {
-                        "type": cells[0].text,
-                        "currency": cells[1].text,
-                        "amount": cells[2].text,
-                        "status": cells[3].text,
-                        "date": cells[4].text
-                    }
-                    transactions.append(tx)
-        except:
-            pass
-        return transactions
+        return self.extract_table({
+            "rows": self.TRANSACTION_ROWS,
+            "min_cells": 5,
+            "fields": {"type": 0, "currency": 1, "amount": 2, "status": 3, "date": 4}
+        })
     
     def get_latest_transaction(self) -> Dict:
         """Получить последнюю транзакцию."""
@@ -2,7 +2,9 @@
 Page Object для страницы регистрации.
 """
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
 from pages.base_page import BasePage
+from typing import Optional
 
 
 class RegisterPage(BasePage):
@@ -95,16 +97,24 @@ class RegisterPage(BasePage):
         self.enter_password(password)
         self.click_submit()
     
+    def wait_for_registration_result(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Ожидание результата регистрации.
+        Возвращает 'success' (сообщение), 'redirect' (переход к аукционам),
+        'error' или None по таймауту.
+        """
+        return self.wait_for_any({
+            "error": self.ERROR_MESSAGE,
+            "success": self.SUCCESS_MESSAGE,
+            "redirect": EC.url_contains("/auctions")
+        }, timeout)
+    
     def register_and_wait_success(self, username: str, password: str) -> bool:
         """
         Выполнить регистрацию и дождаться успеха.
         """
         self.register(username, password)
-        try:
-            self.wait_for_element_visible(self.SUCCESS_MESSAGE, timeout=5)
-            return True
-        except:
-            return False
+        return self.wait_for_registration_result(timeout=5) in ("success", "redirect")
     
     def get_error_message(self) -> str:
         """Получить текст ошибки."""
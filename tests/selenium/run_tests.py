@@ -84,6 +84,16 @@ def main():
         action="store_true",
         help="Не создавать тестовых пользователей"
     )
+    parser.add_argument(
+        "--stack-profile",
+        choices=["fast", "prod-like"],
+        help="Профиль стека: prod-like (как в продакшене) или fast (tmpfs, без AOF)"
+    )
+    parser.add_argument(
+        "--isolated-stacks",
+        action="store_true",
+        help="Отдельный docker compose стек на каждый воркер (вместе с -n)"
+    )
     parser.add_argument(
         "--keep-containers",
         action="store_true",
@@ -94,6 +104,54 @@ def main():
         action="store_true",
         help="Переиспользовать браузер между тестами (быстрее)"
     )
+    parser.add_argument(
+        "--browser-max-uses",
+        type=int,
+        help="Перезапускать браузер после N тестов (с --reuse-browser)"
+    )
+    parser.add_argument(
+        "--wait-timeout",
+        type=float,
+        help="Бюджет явного ожидания в Page Object, секунд"
+    )
+    parser.add_argument(
+        "--no-prewarm",
+        action="store_true",
+        help="Не запускать следующий браузер заранее"
+    )
+    parser.add_argument(
+        "--perf-capture",
+        action="store_true",
+        help="Сохранять замеры производительности страниц в artifacts/perf/"
+    )
+    parser.add_argument(
+        "--perf-baseline",
+        help="Файл базы производительности: сравнивать замеры с медианой прошлых запусков"
+    )
+    parser.add_argument(
+        "--perf-tolerance",
+        help="Допустимое замедление относительно базы (например, 15%%)"
+    )
+    parser.add_argument(
+        "--perf-gate",
+        choices=["fail", "warn"],
+        help="Реакция на регрессию: падение теста или предупреждение"
+    )
+    parser.add_argument(
+        "--perf-update-baseline",
+        action="store_true",
+        help="Добавить замеры запуска в базу производительности"
+    )
+    parser.add_argument(
+        "--trace-actions",
+        action="store_true",
+        help="Трассировка действий теста (Chrome trace + flamegraph) в artifacts/traces/"
+    )
+    parser.add_argument(
+        "--wait-stats",
+        action="store_true",
+        help="Вывести самые дорогие ожидания и локаторы"
+    )
     
     # Опции pytest
     parser.add_argument(
@@ -115,6 +173,16 @@ def main():
         type=int,
         help="Количество параллельных процессов"
     )
+    parser.add_argument(
+        "--duration-sharding",
+        action="store_true",
+        help="С -n: раздавать классы тестов воркерам по длительности прошлых запусков"
+    )
+    parser.add_argument(
+        "--isolated-users",
+        action="store_true",
+        help="Свои пополненные пользователи для каждого воркера (с -n включено всегда)"
+    )
     parser.add_argument(
         "--file", "-f",
         help="Запустить тесты из конкретного файла"
@@ -163,10 +231,36 @@ def main():
         cmd.append("--no-docker")
     if args.no_auto_users:
         cmd.append("--no-auto-users")
+    if args.stack_profile:
+        cmd.append(f"--stack-profile={args.stack_profile}")
+    if args.isolated_stacks:
+        cmd.append("--isolated-stacks")
     if args.keep_containers:
         cmd.append("--keep-containers")
+    if args.isolated_users:
+        cmd.append("--isolated-users")
     if args.reuse_browser:
         cmd.append("--reuse-browser")
+    if args.browser_max_uses:
+        cmd.append(f"--browser-max-uses={args.browser_max_uses}")
+    if args.no_prewarm:
+        cmd.append("--no-prewarm")
+    if args.wait_timeout:
+        cmd.append(f"--wait-timeout={args.wait_timeout}")
+    if args.perf_capture:
+        cmd.append("--perf-capture")
+    if args.perf_baseline:
+        cmd.append(f"--perf-baseline={args.perf_baseline}")
+    if args.perf_tolerance:
+        cmd.append(f"--perf-tolerance={args.perf_tolerance}")
+    if args.perf_gate:
+        cmd.append(f"--perf-gate={args.perf_gate}")
+    if args.perf_update_baseline:
+        cmd.append("--perf-update-baseline")
+    if args.trace_actions:
+        cmd.append("--trace-actions")
+    if args.wait_stats:
+        cmd.append("--wait-stats")
     
     # Фильтр
     if args.keyword:
@@ -183,6 +277,8 @@ def main():
     # Параллельный запуск
     if args.parallel:
         cmd.extend(["-n", str(args.parallel)])
+        if args.duration_sharding:
+            cmd.append("--duration-sharding")
     
     # Collect only
     if args.collect_only:
@@ -4,13 +4,11 @@
 import pytest
 import sys
 import os
-import time
 from datetime import datetime, timedelta
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from pages.admin_page import AdminPage
-from pages.login_page import LoginPage
 from pages.auctions_page import AuctionsPage
 
 
@@ -31,36 +29,16 @@ class TestAdminAccess:
             # Возможно, перенаправляет на главную
             pass
     
-    def test_admin_not_accessible_for_regular_user(self, driver, base_url, test_user):
+    def test_admin_not_accessible_for_regular_user(self, driver, base_url, logged_in_driver):
         """Админка недоступна для обычного пользователя."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(test_user["username"], test_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Тестовый пользователь не существует")
-        
         from pages.base_page import BasePage
         page = BasePage(driver, base_url)
         
         # Для обычного пользователя ссылка на админку не должна быть видна
-        assert not page.is_admin_link_visible(), "Ссылка на админку видна для обычного пользователя"
+        page.assert_absent(page.NAV_ADMIN, "Ссылка на админку видна для обычного пользователя")
     
-    def test_admin_accessible_for_admin_user(self, driver, base_url, admin_user):
+    def test_admin_accessible_for_admin_user(self, driver, base_url, admin_logged_in_driver):
         """Админка доступна для администратора."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(admin_user["username"], admin_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Админ пользователь не существует")
-        
         # Проверяем видимость ссылки на админку
         from pages.base_page import BasePage
         page = BasePage(driver, base_url)
@@ -76,23 +54,8 @@ class TestAdminPageTabs:
     """Тесты табов админ панели."""
     
     @pytest.fixture(autouse=True)
-    def login_as_admin(self, driver, base_url, admin_user):
+    def login_as_admin(self, admin_logged_in_driver):
         """Авторизация под админом перед каждым тестом."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(admin_user["username"], admin_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Админ пользователь не существует")
-        
-        # Проверяем, есть ли доступ к админке
-        from pages.base_page import BasePage
-        page = BasePage(driver, base_url)
-        if not page.is_admin_link_visible():
-            pytest.skip("Пользователь не имеет прав администратора")
     
     def test_admin_page_loads(self, driver, base_url):
         """Проверка загрузки админ панели."""
@@ -124,7 +87,7 @@ class TestAdminPageTabs:
         page.open()
         
         page.click_stats_tab()
-        time.sleep(0.5)
+        page.wait_for_page_settled()
         
         # Проверяем, что статистика видна
         assert page.is_stats_grid_visible()
@@ -135,7 +98,7 @@ class TestAdminPageTabs:
         page.open()
         
         page.click_auctions_tab()
-        time.sleep(0.5)
+        page.wait_for_page_settled()
         
         # Таблица аукционов должна быть видна
         auctions = page.get_auctions_list()
@@ -147,7 +110,7 @@ class TestAdminPageTabs:
         page.open()
         
         page.click_transactions_tab()
-        time.sleep(0.5)
+        page.wait_for_page_settled()
         
         # Таблица транзакций должна быть доступна
         transactions = page.get_transactions_list()
@@ -158,7 +121,7 @@ class TestAdminPageTabs:
         page.open()
         
         page.click_events_tab()
-        time.sleep(0.5)
+        page.wait_for_page_settled()
         
         # Таблица событий должна быть доступна
         events = page.get_events_list()
@@ -169,7 +132,7 @@ class TestAdminPageTabs:
         page.open()
         
         page.click_create_tab()
-        time.sleep(0.5)
+        page.wait_for_page_settled()
         
         # Кнопка создания должна быть видна
         button_text = page.get_create_button_text()
@@ -180,22 +143,8 @@ class TestAdminStats:
     """Тесты статистики в админ панели."""
     
     @pytest.fixture(autouse=True)
-    def login_as_admin(self, driver, base_url, admin_user):
+    def login_as_admin(self, admin_logged_in_driver):
         """Авторизация под админом перед каждым тестом."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(admin_user["username"], admin_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Админ пользователь не существует")
-        
-        from pages.base_page import BasePage
-        page = BasePage(driver, base_url)
-        if not page.is_admin_link_visible():
-            pytest.skip("Пользователь не имеет прав администратора")
     
     def test_stats_cards_visible(self, driver, base_url):
         """Проверка видимости карточек статистики."""
@@ -252,22 +201,8 @@ class TestAdminAuctions:
     """Тесты управления аукционами в админ панели."""
     
     @pytest.fixture(autouse=True)
-    def login_as_admin(self, driver, base_url, admin_user):
+    def login_as_admin(self, admin_logged_in_driver):
         """Авторизация под админом перед каждым тестом."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(admin_user["username"], admin_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Админ пользователь не существует")
-        
-        from pages.base_page import BasePage
-        page = BasePage(driver, base_url)
-        if not page.is_admin_link_visible():
-            pytest.skip("Пользователь не имеет прав администратора")
     
     def test_auctions_list_loads(self, driver, base_url):
         """Проверка загрузки списка аукционов."""
@@ -275,7 +210,7 @@ class TestAdminAuctions:
         page.open()
         
         page.click_auctions_tab()
-        time.sleep(1)
+        page.wait_for_page_settled()
         
         # Список должен загрузиться (может быть пустым)
         auctions = page.get_auctions_list()
@@ -287,10 +222,10 @@ class TestAdminAuctions:
         page.open()
         
         page.click_auctions_tab()
-        time.sleep(1)
+        page.wait_for_page_settled()
         
         page.click_refresh_auctions()
-        time.sleep(1)
+        page.wait_for_page_settled()
         
         # После обновления не должно быть ошибок
         auctions = page.get_auctions_list()
@@ -302,7 +237,7 @@ class TestAdminAuctions:
         page.open()
         
         page.click_auctions_tab()
-        time.sleep(1)
+        page.wait_for_page_settled()
         
         auctions = page.get_auctions_list()
         
@@ -319,22 +254,8 @@ class TestCreateAuction:
     """Тесты создания аукциона."""
     
     @pytest.fixture(autouse=True)
-    def login_as_admin(self, driver, base_url, admin_user):
+    def login_as_admin(self, admin_logged_in_driver):
         """Авторизация под админом перед каждым тестом."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(admin_user["username"], admin_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Админ пользователь не существует")
-        
-        from pages.base_page import BasePage
-        page = BasePage(driver, base_url)
-        if not page.is_admin_link_visible():
-            pytest.skip("Пользователь не имеет прав администратора")
     
     def test_create_form_loads(self, driver, base_url):
         """Проверка загрузки формы создания."""
@@ -342,7 +263,7 @@ class TestCreateAuction:
         page.open()
         
         page.click_create_tab()
-        time.sleep(0.5)
+        page.wait_for_page_settled()
         
         button_text = page.get_create_button_text()
         assert "Создать" in button_text
@@ -353,7 +274,7 @@ class TestCreateAuction:
         page.open()
         
         page.click_create_tab()
-        time.sleep(0.5)
+        page.wait_for_page_settled()
         
         # Заполняем форму без названия
         start_time = (datetime.now() + timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M")
@@ -371,7 +292,7 @@ class TestCreateAuction:
         )
         
         page.click_create_auction()
-        time.sleep(2)
+        page.wait_for_page_settled()
         
         # Должна быть ошибка
         assert page.is_create_error_displayed() or not page.is_create_success_displayed()
@@ -382,7 +303,7 @@ class TestCreateAuction:
         page.open()
         
         page.click_create_tab()
-        time.sleep(0.5)
+        page.wait_for_page_settled()
         
         # Заполняем форму без даты
         page.fill_auction_form(
@@ -398,7 +319,7 @@ class TestCreateAuction:
         )
         
         page.click_create_auction()
-        time.sleep(2)
+        page.wait_for_page_settled()
         
         # Должна быть ошибка
         assert page.is_create_error_displayed() or not page.is_create_success_displayed()
@@ -409,7 +330,7 @@ class TestCreateAuction:
         page.open()
         
         page.click_create_tab()
-        time.sleep(0.5)
+        page.wait_for_page_settled()
         
         # Генерируем уникальное название
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
@@ -444,7 +365,7 @@ class TestCreateAuction:
         
         # Проверяем, что аукцион появился в списке
         page.click_auctions_tab()
-        time.sleep(1)
+        page.wait_for_page_settled()
         
         auctions = page.get_auctions_list()
         auction_titles = [a["title"] for a in auctions]
@@ -456,7 +377,7 @@ class TestCreateAuction:
         page.open()
         
         page.click_create_tab()
-        time.sleep(0.5)
+        page.wait_for_page_settled()
         
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
         title = f"Full Auction {timestamp}"
@@ -477,7 +398,7 @@ class TestCreateAuction:
         )
         
         page.click_create_auction()
-        time.sleep(3)
+        page.wait_for_page_settled()
         
         # Проверяем результат - ошибка должна приводить к падению теста
         if page.is_create_error_displayed():
@@ -491,22 +412,8 @@ class TestAdminTransactions:
     """Тесты просмотра транзакций в админ панели."""
     
     @pytest.fixture(autouse=True)
-    def login_as_admin(self, driver, base_url, admin_user):
+    def login_as_admin(self, admin_logged_in_driver):
         """Авторизация под админом перед каждым тестом."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(admin_user["username"], admin_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Админ пользователь не существует")
-        
-        from pages.base_page import BasePage
-        page = BasePage(driver, base_url)
-        if not page.is_admin_link_visible():
-            pytest.skip("Пользователь не имеет прав администратора")
     
     def test_transactions_list_loads(self, driver, base_url):
         """Проверка загрузки списка транзакций."""
@@ -514,7 +421,7 @@ class TestAdminTransactions:
         page.open()
         
         page.click_transactions_tab()
-        time.sleep(1)
+        page.wait_for_page_settled()
         
         transactions = page.get_transactions_list()
         assert isinstance(transactions, list)
@@ -525,7 +432,7 @@ class TestAdminTransactions:
         page.open()
         
         page.click_transactions_tab()
-        time.sleep(1)
+        page.wait_for_page_settled()
         
         transactions = page.get_transactions_list()
         
@@ -543,22 +450,8 @@ class TestAdminEvents:
     """Тесты просмотра событий в админ панели."""
     
     @pytest.fixture(autouse=True)
-    def login_as_admin(self, driver, base_url, admin_user):
+    def login_as_admin(self, admin_logged_in_driver):
         """Авторизация под админом перед каждым тестом."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(admin_user["username"], admin_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Админ пользователь не существует")
-        
-        from pages.base_page import BasePage
-        page = BasePage(driver, base_url)
-        if not page.is_admin_link_visible():
-            pytest.skip("Пользователь не имеет прав администратора")
     
     def test_events_list_loads(self, driver, base_url):
         """Проверка загрузки списка событий."""
@@ -566,7 +459,7 @@ class TestAdminEvents:
         page.open()
         
         page.click_events_tab()
-        time.sleep(1)
+        page.wait_for_page_settled()
         
         events = page.get_events_list()
         assert isinstance(events, list)
@@ -577,7 +470,7 @@ class TestAdminEvents:
         page.open()
         
         page.click_events_tab()
-        time.sleep(1)
+        page.wait_for_page_settled()
         
         events = page.get_events_list()
         
@@ -593,22 +486,8 @@ class TestAdminNavigation:
     """Тесты навигации в админ панели."""
     
     @pytest.fixture(autouse=True)
-    def login_as_admin(self, driver, base_url, admin_user):
+    def login_as_admin(self, admin_logged_in_driver):
         """Авторизация под админом перед каждым тестом."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(admin_user["username"], admin_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Админ пользователь не существует")
-        
-        from pages.base_page import BasePage
-        page = BasePage(driver, base_url)
-        if not page.is_admin_link_visible():
-            pytest.skip("Пользователь не имеет прав администратора")
     
     def test_navigate_to_admin_from_nav(self, driver, base_url):
         """Переход в админку через навигацию."""
@@ -628,14 +507,14 @@ class TestAdminNavigation:
         page.open()
         
         page.click_auctions_tab()
-        time.sleep(1)
+        page.wait_for_page_settled()
         
         auctions = page.get_auctions_list()
         
         if auctions:
             page.view_auction_by_index(0)
             
-            time.sleep(1)
+            page.wait_for_url_contains("/auctions/")
             
             # Должны перейти на страницу аукциона
             assert "/auctions/" in page.get_current_url()
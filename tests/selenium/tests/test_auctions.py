@@ -4,30 +4,19 @@
 import pytest
 import sys
 import os
-import time
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from pages.auctions_page import AuctionsPage
 from pages.auction_detail_page import AuctionDetailPage
-from pages.login_page import LoginPage
 
 
 class TestAuctionsPage:
     """Тесты страницы списка аукционов."""
     
     @pytest.fixture(autouse=True)
-    def login_before_tests(self, driver, base_url, test_user):
+    def login_before_tests(self, logged_in_driver):
         """Авторизация перед каждым тестом."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(test_user["username"], test_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Тестовый пользователь не существует")
     
     def test_auctions_page_loads(self, driver, base_url):
         """Проверка загрузки страницы аукционов."""
@@ -55,7 +44,7 @@ class TestAuctionsPage:
         driver.get(f"{base_url}/auctions")
         
         # Должен отображаться либо спиннер, либо контент
-        time.sleep(0.5)  # Даём время для начала загрузки
+        page.wait_for_render()
         
         # Ждём окончания загрузки
         page.wait_for_auctions_loaded()
@@ -141,28 +130,20 @@ class TestAuctionsPage:
         new_count = page.get_auctions_count()
         assert new_count >= 0
     
-    def test_create_button_visible_for_admin(self, driver, base_url, admin_user):
+    def test_create_button_visible_for_admin(self, driver, base_url, admin_user, session_auth):
         """Кнопка создания видна для админа."""
-        # Выходим из текущего аккаунта
-        from pages.base_page import BasePage
-        base = BasePage(driver, base_url)
-        if base.is_logged_in():
-            base.logout()
-        
-        # Входим под админом
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(admin_user["username"], admin_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
+        # Переключаемся на сессию админа (токен через API)
+        user = session_auth.login(driver, base_url, admin_user)
+        if user is None:
             pytest.skip("Админ пользователь не существует")
         
         # Проверяем, что это действительно админ
-        if not base.is_admin_link_visible():
+        if user.get("role") != "admin":
             pytest.skip("Пользователь не имеет прав администратора")
         
+        from pages.base_page import BasePage
+        base = BasePage(driver, base_url)
+        
         page = AuctionsPage(driver, base_url)
         page.open()
         
@@ -174,81 +155,37 @@ class TestAuctionDetailPage:
     """Тесты детальной страницы аукциона."""
     
     @pytest.fixture(autouse=True)
-    def login_before_tests(self, driver, base_url, test_user):
+    def login_before_tests(self, logged_in_driver):
         """Авторизация перед каждым тестом."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(test_user["username"], test_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Тестовый пользователь не существует")
-    
-    def get_first_auction_id(self, driver, base_url):
-        """Получить ID первого аукциона."""
-        page = AuctionsPage(driver, base_url)
-        page.open()
-        
-        if page.is_empty() or page.get_auctions_count() == 0:
-            return None
-        
-        page.click_first_auction()
-        page.wait_for_url_contains("/auctions/")
-        
-        # Извлекаем ID из URL
-        url = page.get_current_url()
-        auction_id = url.split("/auctions/")[-1].rstrip("/")
-        return auction_id
     
-    def test_auction_detail_page_loads(self, driver, base_url):
+    def test_auction_detail_page_loads(self, driver, base_url, active_auction):
         """Проверка загрузки детальной страницы аукциона."""
-        auction_id = self.get_first_auction_id(driver, base_url)
-        
-        if not auction_id:
-            pytest.skip("Нет доступных аукционов для теста")
-        
-        page = AuctionDetailPage(driver, base_url)
-        page.open(auction_id)
+        page = AuctionDetailPage(driver, base_url).open(active_auction)
         
         # Ждём загрузки
-        assert not page.is_loading(), "Страница всё ещё загружается"
+        page.assert_absent(page.LOADING_STATE, "Страница всё ещё загружается")
         
         # Проверяем заголовок
         title = page.get_auction_title()
         assert len(title) > 0
     
-    def test_auction_detail_header_elements(self, driver, base_url):
+    def test_auction_detail_header_elements(self, driver, base_url, active_auction):
         """Проверка элементов заголовка аукциона."""
-        auction_id = self.get_first_auction_id(driver, base_url)
-        
-        if not auction_id:
-            pytest.skip("Нет доступных аукционов для теста")
-        
-        page = AuctionDetailPage(driver, base_url)
-        page.open(auction_id)
+        page = AuctionDetailPage(driver, base_url).open(active_auction)
         
         # Заголовок
         assert len(page.get_auction_title()) > 0
         
         # Статус (проверяем без учёта регистра)
-        status = page.get_auction_status().lower()
-        assert status in ["активен", "запланирован", "завершён", "отменён"]
+        assert page.get_auction_status().lower() == "активен"
         
         # Валюта
         currency = page.get_auction_currency()
         assert currency in ["TON", "USDT"]
     
-    def test_auction_detail_stats_grid(self, driver, base_url):
+    def test_auction_detail_stats_grid(self, driver, base_url, active_auction):
         """Проверка статистики аукциона."""
-        auction_id = self.get_first_auction_id(driver, base_url)
-        
-        if not auction_id:
-            pytest.skip("Нет доступных аукционов для теста")
-        
-        page = AuctionDetailPage(driver, base_url)
-        page.open(auction_id)
+        page = AuctionDetailPage(driver, base_url).open(active_auction)
         
         # Раунд
         round_info = page.get_current_round()
@@ -258,92 +195,40 @@ class TestAuctionDetailPage:
         items_info = page.get_items_sold()
         assert "/" in items_info  # Формат "X / Y"
     
-    def test_bid_form_visible_for_active_auction(self, driver, base_url):
+    def test_bid_form_visible_for_active_auction(self, driver, base_url, active_auction):
         """Форма ставки видна для активного аукциона."""
-        auctions_page = AuctionsPage(driver, base_url)
-        auctions_page.open()
-        
-        if auctions_page.get_active_auctions_count() == 0:
-            pytest.skip("Нет активных аукционов для теста")
-        
-        auctions_page.click_first_active_auction()
-        auctions_page.wait_for_url_contains("/auctions/")
-        
-        page = AuctionDetailPage(driver, base_url)
-        # Страница уже открыта
+        page = AuctionDetailPage(driver, base_url).open(active_auction)
         
         # Для активного аукциона должна быть видна форма ставки
         assert page.is_bid_card_visible(), "Форма ставки не видна для активного аукциона"
     
-    def test_min_bid_displayed_for_active_auction(self, driver, base_url):
+    def test_min_bid_displayed_for_active_auction(self, driver, base_url, active_auction):
         """Минимальная ставка отображается для активного аукциона."""
-        auctions_page = AuctionsPage(driver, base_url)
-        auctions_page.open()
-        
-        if auctions_page.get_active_auctions_count() == 0:
-            pytest.skip("Нет активных аукционов для теста")
-        
-        auctions_page.click_first_active_auction()
-        auctions_page.wait_for_url_contains("/auctions/")
+        page = AuctionDetailPage(driver, base_url).open(active_auction)
         
-        page = AuctionDetailPage(driver, base_url)
-        
-        if page.is_min_bid_visible():
-            min_bid = page.get_min_bid()
-            assert len(min_bid) > 0
+        assert page.is_min_bid_visible(), "Минимальная ставка не отображается"
+        assert len(page.get_min_bid()) > 0
     
-    def test_top_bids_section(self, driver, base_url):
+    @pytest.mark.needs(active_auction=1, bids=5)
+    def test_top_bids_section(self, driver, base_url, seed):
         """Проверка секции топ ставок."""
-        auction_id = self.get_first_auction_id(driver, base_url)
-        
-        if not auction_id:
-            pytest.skip("Нет доступных аукционов для теста")
+        page = AuctionDetailPage(driver, base_url).open(seed.active_auction)
+        page.wait_for_elements(page.BID_ROWS)
         
-        page = AuctionDetailPage(driver, base_url)
-        page.open(auction_id)
-        
-        # Либо есть ставки, либо пустое состояние
-        bids_count = page.get_top_bids_count()
-        is_empty = page.is_bids_empty()
-        
-        assert bids_count >= 0 or is_empty
+        # Все ставки помещаются в раунд и попадают в топ
+        assert page.get_top_bids_count() == len(seed.bids)
 
 
 class TestBidding:
     """Тесты размещения ставок."""
     
     @pytest.fixture(autouse=True)
-    def login_before_tests(self, driver, base_url, test_user):
+    def login_before_tests(self, logged_in_driver):
         """Авторизация перед каждым тестом."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(test_user["username"], test_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Тестовый пользователь не существует")
     
-    def get_active_auction_page(self, driver, base_url):
-        """Открыть активный аукцион и вернуть страницу."""
-        auctions_page = AuctionsPage(driver, base_url)
-        auctions_page.open()
-        
-        if auctions_page.get_active_auctions_count() == 0:
-            return None
-        
-        auctions_page.click_first_active_auction()
-        auctions_page.wait_for_url_contains("/auctions/")
-        
-        return AuctionDetailPage(driver, base_url)
-    
-    def test_place_bid_validation_min_amount(self, driver, base_url):
+    def test_place_bid_validation_min_amount(self, driver, base_url, active_auction):
         """Валидация минимальной суммы ставки."""
-        page = self.get_active_auction_page(driver, base_url)
-        
-        if not page:
-            pytest.skip("Нет активных аукционов для теста")
+        page = AuctionDetailPage(driver, base_url).open(active_auction)
         
         # Вводим слишком маленькую ставку
         page.place_bid("0.0001")
@@ -354,12 +239,9 @@ class TestBidding:
             error_msg = page.get_bid_error_message()
             assert "Минимальная" in error_msg or len(error_msg) > 0
     
-    def test_place_bid_empty_amount(self, driver, base_url):
+    def test_place_bid_empty_amount(self, driver, base_url, active_auction):
         """Попытка ставки с пустой суммой."""
-        page = self.get_active_auction_page(driver, base_url)
-        
-        if not page:
-            pytest.skip("Нет активных аукционов для теста")
+        page = AuctionDetailPage(driver, base_url).open(active_auction)
         
         # Очищаем поле и пытаемся сделать ставку
         page.clear_bid_input()
@@ -370,22 +252,16 @@ class TestBidding:
         # Либо ошибка, либо timeout (форма не отправится)
         assert result in ["error", "timeout"]
     
-    def test_bid_input_placeholder(self, driver, base_url):
+    def test_bid_input_placeholder(self, driver, base_url, active_auction):
         """Проверка placeholder поля ввода ставки."""
-        page = self.get_active_auction_page(driver, base_url)
-        
-        if not page:
-            pytest.skip("Нет активных аукционов для теста")
+        page = AuctionDetailPage(driver, base_url).open(active_auction)
         
         placeholder = page.get_bid_input_placeholder()
         assert "Минимум" in placeholder or len(placeholder) > 0
     
-    def test_place_valid_bid(self, driver, base_url):
+    def test_place_valid_bid(self, driver, base_url, active_auction):
         """Успешное размещение ставки."""
-        page = self.get_active_auction_page(driver, base_url)
-        
-        if not page:
-            pytest.skip("Нет активных аукционов для теста")
+        page = AuctionDetailPage(driver, base_url).open(active_auction)
         
         # Получаем минимальную ставку из placeholder или текста
         min_bid_text = page.get_min_bid() if page.is_min_bid_visible() else "1"
@@ -413,12 +289,9 @@ class TestBidding:
             # Не должно быть критических ошибок
             assert len(error_msg) > 0
     
-    def test_bid_updates_your_bid_section(self, driver, base_url):
+    def test_bid_updates_your_bid_section(self, driver, base_url, active_auction):
         """После ставки обновляется секция 'Ваша ставка'."""
-        page = self.get_active_auction_page(driver, base_url)
-        
-        if not page:
-            pytest.skip("Нет активных аукционов для теста")
+        page = AuctionDetailPage(driver, base_url).open(active_auction)
         
         # Если уже есть ставка - проверяем её отображение
         if page.has_existing_bid():
@@ -428,12 +301,9 @@ class TestBidding:
             rank = page.get_your_bid_rank()
             assert len(rank) > 0
     
-    def test_bid_button_disabled_during_submission(self, driver, base_url):
+    def test_bid_button_disabled_during_submission(self, driver, base_url, active_auction):
         """Кнопка ставки блокируется во время отправки."""
-        page = self.get_active_auction_page(driver, base_url)
-        
-        if not page:
-            pytest.skip("Нет активных аукционов для теста")
+        page = AuctionDetailPage(driver, base_url).open(active_auction)
         
         # Получаем минимальную ставку
         min_bid_text = page.get_min_bid() if page.is_min_bid_visible() else "1"
@@ -452,7 +322,7 @@ class TestBidding:
         
         # Сразу проверяем (может измениться на "Отправка...")
         # Это зависит от скорости соединения
-        time.sleep(0.3)
+        page.wait_for_render()
         
         # Ждём результата
         page.wait_for_bid_result(timeout=10)
@@ -462,17 +332,8 @@ class TestAuctionNavigation:
     """Тесты навигации по аукционам."""
     
     @pytest.fixture(autouse=True)
-    def login_before_tests(self, driver, base_url, test_user):
+    def login_before_tests(self, logged_in_driver):
         """Авторизация перед каждым тестом."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(test_user["username"], test_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Тестовый пользователь не существует")
     
     def test_navigate_to_auctions_from_nav(self, driver, base_url):
         """Переход на аукционы через навигацию."""
@@ -502,6 +363,6 @@ class TestAuctionNavigation:
         auctions_page.go_back()
         
         # Должны вернуться к списку
-        time.sleep(1)
+        auctions_page.wait_for_page_settled()
         assert "/auctions/" not in auctions_page.get_current_url() or \
                auctions_page.get_current_url().endswith("/auctions")
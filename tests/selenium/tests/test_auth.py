@@ -51,18 +51,17 @@ class TestRegistration:
         # Регистрация
         page.register(unique_user["username"], unique_user["password"])
         
-        # Ожидаем успешного сообщения или перенаправления
-        try:
-            if page.is_success_displayed():
-                assert "Регистрация успешна" in page.get_success_message()
-            else:
-                # Проверяем переход на страницу аукционов
-                page.wait_for_url_contains("/auctions", timeout=5)
-                assert "/auctions" in page.get_current_url()
-        except:
-            # Если ошибка - выводим сообщение
-            if page.is_error_displayed():
-                pytest.fail(f"Ошибка регистрации: {page.get_error_message()}")
+        # Ожидаем успешного сообщения, перенаправления или ошибки
+        outcome = page.wait_for_registration_result()
+        
+        if outcome == "error":
+            pytest.fail(f"Ошибка регистрации: {page.get_error_message()}")
+        elif outcome == "success":
+            assert "Регистрация успешна" in page.get_success_message()
+        else:
+            # Проверяем переход на страницу аукционов
+            assert outcome == "redirect", "Регистрация не завершилась"
+            assert "/auctions" in page.get_current_url()
     
     def test_register_short_username(self, driver, base_url):
         """Регистрация с коротким именем пользователя (менее 3 символов)."""
@@ -220,43 +219,27 @@ class TestLogin:
 class TestLogout:
     """Тесты выхода из системы."""
     
-    def test_logout_redirects_to_home(self, driver, base_url, test_user):
+    def test_logout_redirects_to_home(self, driver, base_url, logged_in_driver):
         """Проверка выхода из системы."""
-        # Сначала входим
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(test_user["username"], test_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Тестовый пользователь не существует")
-            raise
+        from pages.base_page import BasePage
+        page = BasePage(driver, base_url)
         
         # Проверяем, что мы авторизованы
-        assert login_page.is_logged_in(), "Не удалось авторизоваться"
+        assert page.is_logged_in(), "Не удалось авторизоваться"
         
         # Выходим
-        login_page.logout()
+        page.logout()
         
         # Проверяем, что кнопка входа снова доступна
-        assert not login_page.is_logged_in(), "Пользователь всё ещё авторизован после выхода"
+        page.assert_absent(page.LOGOUT_BUTTON, "Пользователь всё ещё авторизован после выхода")
     
-    def test_logout_shows_login_buttons(self, driver, base_url, test_user):
+    def test_logout_shows_login_buttons(self, driver, base_url, logged_in_driver):
         """После выхода отображаются кнопки входа."""
-        # Входим
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(test_user["username"], test_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            pytest.skip("Тестовый пользователь не существует")
+        from pages.base_page import BasePage
+        page = BasePage(driver, base_url)
         
         # Выходим
-        login_page.logout()
+        page.logout()
         
         # Переходим на главную
         home_page = HomePage(driver, base_url)
@@ -84,11 +84,9 @@ class TestUserRegistrationFlow:
         register.register(unique_user["username"], unique_user["password"])
         
         # 4. Ожидание успешной регистрации
-        try:
-            register.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if register.is_error_displayed():
-                pytest.fail(f"Ошибка регистрации: {register.get_error_message()}")
+        if register.wait_for_registration_result(timeout=10) == "error":
+            pytest.fail(f"Ошибка регистрации: {register.get_error_message()}")
+        register.wait_for_url_contains("/auctions", timeout=10)
         
         # 5. Проверяем, что пользователь авторизован
         assert register.is_logged_in()
@@ -106,17 +104,8 @@ class TestAuctionParticipationFlow:
     """E2E: Полный сценарий участия в аукционе."""
     
     @pytest.fixture(autouse=True)
-    def login_before_tests(self, driver, base_url, test_user):
+    def login_before_tests(self, logged_in_driver):
         """Авторизация перед тестом."""
-        login = LoginPage(driver, base_url)
-        login.open()
-        login.login(test_user["username"], test_user["password"])
-        
-        try:
-            login.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login.is_error_displayed():
-                pytest.skip("Тестовый пользователь не существует")
     
     def test_view_auctions_and_details(self, driver, base_url):
         """
@@ -153,7 +142,7 @@ class TestAuctionParticipationFlow:
         
         # 4. Возвращаемся
         detail.go_back()
-        time.sleep(1)
+        detail.wait_for_page_settled()
     
     def test_place_bid_flow(self, driver, base_url):
         """
@@ -206,17 +195,8 @@ class TestProfileManagementFlow:
     """E2E: Полный сценарий управления профилем."""
     
     @pytest.fixture(autouse=True)
-    def login_before_tests(self, driver, base_url, test_user):
+    def login_before_tests(self, logged_in_driver):
         """Авторизация перед тестом."""
-        login = LoginPage(driver, base_url)
-        login.open()
-        login.login(test_user["username"], test_user["password"])
-        
-        try:
-            login.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login.is_error_displayed():
-                pytest.skip("Тестовый пользователь не существует")
     
     def test_view_profile_and_balances(self, driver, base_url):
         """
@@ -266,21 +246,18 @@ class TestProfileManagementFlow:
         # Создаём депозит
         profile.create_deposit("TON", "1")
         
-        time.sleep(3)
+        # Ожидаем ссылку на оплату или alert (ошибка CryptoBot)
+        outcome = profile.wait_for_deposit_result()
         
-        # Проверяем наличие alert (ошибка CryptoBot)
-        try:
-            alert = driver.switch_to.alert
-            alert_text = alert.text
-            alert.accept()
+        if outcome == "alert":
+            alert_text = profile.get_alert_text()
+            profile.accept_alert()
             if "CryptoBot" in alert_text or "token" in alert_text.lower():
                 pytest.skip("CryptoBot не настроен в тестовой среде")
             pytest.skip(f"Депозит не создан: {alert_text}")
-        except:
-            pass
         
         # Проверяем результат
-        if profile.is_deposit_success_displayed():
+        if outcome == "success":
             link = profile.get_deposit_payment_link()
             assert len(link) > 0
             assert "http" in link
@@ -291,22 +268,8 @@ class TestAdminFlow:
     """E2E: Полный сценарий администрирования."""
     
     @pytest.fixture(autouse=True)
-    def login_as_admin(self, driver, base_url, admin_user):
+    def login_as_admin(self, admin_logged_in_driver):
         """Авторизация под админом."""
-        login = LoginPage(driver, base_url)
-        login.open()
-        login.login(admin_user["username"], admin_user["password"])
-        
-        try:
-            login.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login.is_error_displayed():
-                pytest.skip("Админ пользователь не существует")
-        
-        from pages.base_page import BasePage
-        page = BasePage(driver, base_url)
-        if not page.is_admin_link_visible():
-            pytest.skip("Пользователь не имеет прав администратора")
     
     def test_admin_dashboard_overview(self, driver, base_url):
         """
@@ -327,19 +290,19 @@ class TestAdminFlow:
         
         # 2. Проверяем аукционы
         admin.click_auctions_tab()
-        time.sleep(0.5)
+        admin.wait_for_page_settled()
         auctions = admin.get_auctions_list()
         assert isinstance(auctions, list)
         
         # 3. Проверяем транзакции
         admin.click_transactions_tab()
-        time.sleep(0.5)
+        admin.wait_for_page_settled()
         transactions = admin.get_transactions_list()
         assert isinstance(transactions, list)
         
         # 4. Проверяем события
         admin.click_events_tab()
-        time.sleep(0.5)
+        admin.wait_for_page_settled()
         events = admin.get_events_list()
         assert isinstance(events, list)
     
@@ -356,7 +319,7 @@ class TestAdminFlow:
         
         # 1. Переходим на таб создания
         admin.click_create_tab()
-        time.sleep(0.5)
+        admin.wait_for_page_settled()
         
         # 2. Заполняем форму
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
@@ -379,7 +342,7 @@ class TestAdminFlow:
         if result:
             # 3. Проверяем появление в списке
             admin.click_auctions_tab()
-            time.sleep(1)
+            admin.wait_for_page_settled()
             
             auctions = admin.get_auctions_list()
             auction_titles = [a["title"] for a in auctions]
@@ -410,11 +373,9 @@ class TestFullUserJourney:
         register.wait_for_url_contains("/register")
         register.register(unique_user["username"], unique_user["password"])
         
-        try:
-            register.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if register.is_error_displayed():
-                pytest.fail(f"Ошибка регистрации: {register.get_error_message()}")
+        if register.wait_for_registration_result(timeout=10) == "error":
+            pytest.fail(f"Ошибка регистрации: {register.get_error_message()}")
+        register.wait_for_url_contains("/auctions", timeout=10)
         
         assert register.is_logged_in(), "Пользователь не авторизован после регистрации"
         
@@ -430,16 +391,9 @@ class TestFullUserJourney:
         
         # 3. ДЕПОЗИТ
         profile.create_deposit("TON", "5")
-        time.sleep(2)
-        
-        # Закрываем alert если есть (CryptoBot не настроен)
-        try:
-            alert = driver.switch_to.alert
-            alert.accept()
-        except:
-            pass
-        
-        # Должна быть ссылка или ошибка API
+        # Должна быть ссылка или ошибка API (alert, если CryptoBot не настроен)
+        if profile.wait_for_deposit_result() == "alert":
+            profile.accept_alert()
         
         # 4. АУКЦИОНЫ
         profile.navigate_to_auctions()
@@ -461,32 +415,30 @@ class TestFullUserJourney:
         detail_or_auctions = AuctionDetailPage(driver, base_url) if "/auctions/" in driver.current_url else auctions
         detail_or_auctions.logout()
         
-        time.sleep(1)
-        assert not detail_or_auctions.is_logged_in(), "Пользователь всё ещё авторизован после выхода"
+        detail_or_auctions.assert_absent(
+            detail_or_auctions.LOGOUT_BUTTON,
+            "Пользователь всё ещё авторизован после выхода"
+        )
 
 
 @pytest.mark.slow
 class TestPerformance:
     """Тесты производительности."""
     
-    def test_page_load_times(self, driver, base_url, test_user):
-        """Проверка времени загрузки страниц."""
+    def test_page_load_times(self, driver, base_url, logged_in_driver, perf_recorder):
+        """
+        Проверка времени загрузки страниц.
+        Метрики каждой страницы (Navigation Timing, paint, LCP, long tasks, CDP)
+        сохраняются в артефакт теста - см. utils/perf.py.
+        """
         import time
+        from pages.base_page import BasePage
         
-        # Входим
-        login = LoginPage(driver, base_url)
-        login.open()
-        login.login(test_user["username"], test_user["password"])
-        
-        try:
-            login.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            pytest.skip("Тестовый пользователь не существует")
-        
+        # Имена Page Object - те же, что у замеров BasePage.open: одна история на маршрут
         pages = [
-            ("/", "Home"),
-            ("/auctions", "Auctions"),
-            ("/profile", "Profile"),
+            ("/", "HomePage"),
+            ("/auctions", "AuctionsPage"),
+            ("/profile", "ProfilePage"),
         ]
         
         for path, name in pages:
@@ -494,11 +446,15 @@ class TestPerformance:
             driver.get(f"{base_url}{path}")
             
             # Ждём загрузки страницы
-            from pages.base_page import BasePage
             page = BasePage(driver, base_url)
             page.wait_for_spinner_disappear()
             
             load_time = time.time() - start
             
+            page.wait_for_page_settled()
+            sample = perf_recorder.capture(route=path, page=name)
+            
             # Страница должна загрузиться менее чем за 15 секунд (учитывая холодный старт Docker)
             assert load_time < 15, f"Страница {name} загружалась слишком долго: {load_time:.2f}s"
+            assert sample is not None, f"Не удалось снять замер страницы {name}"
+            assert sample["navigation"] is not None, f"Нет Navigation Timing для страницы {name}"
@@ -1,14 +1,12 @@
 """
 Тесты главной страницы.
 """
-import pytest
 import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from pages.home_page import HomePage
-from pages.login_page import LoginPage
 
 
 class TestHomePage:
@@ -75,21 +73,10 @@ class TestHomePage:
         assert page.is_login_buttons_visible()
         
         # Проверяем, что кнопка перехода к аукционам не видна
-        assert not page.is_go_to_auctions_visible()
+        page.assert_absent(page.BTN_GO_TO_AUCTIONS)
     
-    def test_home_page_authenticated_buttons(self, driver, base_url, test_user):
+    def test_home_page_authenticated_buttons(self, driver, base_url, logged_in_driver):
         """Проверка кнопок для авторизованных пользователей."""
-        # Сначала входим
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(test_user["username"], test_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Тестовый пользователь не существует")
-        
         # Переходим на главную
         page = HomePage(driver, base_url)
         page.open()
@@ -98,7 +85,8 @@ class TestHomePage:
         assert page.is_go_to_auctions_visible()
         
         # Проверяем, что кнопки входа/регистрации не видны
-        assert not page.is_login_buttons_visible()
+        # (BTN_START_TRADING совпадает с кнопкой перехода к аукционам, проверяем вход)
+        page.assert_absent(page.BTN_LOGIN)
     
     def test_click_start_trading_goes_to_register(self, driver, base_url):
         """Клик по 'Начать торговать' ведёт на регистрацию."""
@@ -146,49 +134,22 @@ class TestNavigation:
         
         assert page.is_element_visible(page.NAV_LOGIN) or page.is_element_visible(page.NAV_REGISTER)
     
-    def test_nav_auctions_visible_when_authenticated(self, driver, base_url, test_user):
+    def test_nav_auctions_visible_when_authenticated(self, driver, base_url, logged_in_driver):
         """Ссылка на аукционы видна для авторизованных."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(test_user["username"], test_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            pytest.skip("Тестовый пользователь не существует")
-        
         page = HomePage(driver, base_url)
         page.open()
         
         assert page.is_element_visible(page.NAV_AUCTIONS)
     
-    def test_nav_profile_visible_when_authenticated(self, driver, base_url, test_user):
+    def test_nav_profile_visible_when_authenticated(self, driver, base_url, logged_in_driver):
         """Ссылка на профиль видна для авторизованных."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(test_user["username"], test_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            pytest.skip("Тестовый пользователь не существует")
-        
         page = HomePage(driver, base_url)
         page.open()
         
         assert page.is_element_visible(page.NAV_PROFILE)
     
-    def test_balance_displayed_when_authenticated(self, driver, base_url, test_user):
+    def test_balance_displayed_when_authenticated(self, driver, base_url, logged_in_driver):
         """Баланс отображается для авторизованных."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(test_user["username"], test_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            pytest.skip("Тестовый пользователь не существует")
-        
         page = HomePage(driver, base_url)
         page.open()
         
@@ -4,29 +4,18 @@
 import pytest
 import sys
 import os
-import time
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from pages.profile_page import ProfilePage
-from pages.login_page import LoginPage
 
 
 class TestProfilePage:
     """Тесты страницы профиля."""
     
     @pytest.fixture(autouse=True)
-    def login_before_tests(self, driver, base_url, test_user):
+    def login_before_tests(self, logged_in_driver):
         """Авторизация перед каждым тестом."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(test_user["username"], test_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Тестовый пользователь не существует")
     
     def test_profile_page_loads(self, driver, base_url):
         """Проверка загрузки страницы профиля."""
@@ -82,17 +71,8 @@ class TestDeposit:
     """Тесты депозита."""
     
     @pytest.fixture(autouse=True)
-    def login_before_tests(self, driver, base_url, test_user):
+    def login_before_tests(self, logged_in_driver):
         """Авторизация перед каждым тестом."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(test_user["username"], test_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Тестовый пользователь не существует")
     
     def test_deposit_form_elements(self, driver, base_url):
         """Проверка элементов формы депозита."""
@@ -121,22 +101,17 @@ class TestDeposit:
         
         page.create_deposit("TON", "1")
         
-        # Ожидаем результат
-        time.sleep(3)
+        # Ожидаем результат: ссылка на оплату или alert (ошибка CryptoBot или валидации)
+        outcome = page.wait_for_deposit_result()
         
-        # Проверяем наличие alert (ошибка CryptoBot или валидации)
-        try:
-            alert = driver.switch_to.alert
-            alert_text = alert.text
-            alert.accept()
+        if outcome == "alert":
+            alert_text = page.get_alert_text()
+            page.accept_alert()
             if "CryptoBot" in alert_text or "token" in alert_text.lower():
                 pytest.skip("CryptoBot не настроен в тестовой среде")
-            # Другие ошибки - пропускаем
             pytest.skip(f"Депозит не создан: {alert_text}")
-        except:
-            pass  # Нет alert
         
-        if page.is_deposit_success_displayed():
+        if outcome == "success":
             # Должна быть ссылка на оплату
             link = page.get_deposit_payment_link()
             assert len(link) > 0 and "http" in link
@@ -148,21 +123,17 @@ class TestDeposit:
         
         page.create_deposit("USDT", "10")
         
-        # Ожидаем результат
-        time.sleep(3)
+        # Ожидаем результат: ссылка на оплату или alert (ошибка CryptoBot или валидации)
+        outcome = page.wait_for_deposit_result()
         
-        # Проверяем наличие alert (ошибка CryptoBot или валидации)
-        try:
-            alert = driver.switch_to.alert
-            alert_text = alert.text
-            alert.accept()
+        if outcome == "alert":
+            alert_text = page.get_alert_text()
+            page.accept_alert()
             if "CryptoBot" in alert_text or "token" in alert_text.lower():
                 pytest.skip("CryptoBot не настроен в тестовой среде")
             pytest.skip(f"Депозит не создан: {alert_text}")
-        except:
-            pass  # Нет alert
         
-        if page.is_deposit_success_displayed():
+        if outcome == "success":
             # Должна быть ссылка на оплату
             link = page.get_deposit_payment_link()
             assert len(link) > 0 and "http" in link
@@ -176,7 +147,7 @@ class TestDeposit:
         page.click_create_deposit()
         
         # Форма не должна отправиться или должна быть ошибка
-        time.sleep(1)
+        page.wait_for_page_settled()
         # Кнопка не должна стать disabled без суммы
     
     def test_deposit_button_disabled_during_loading(self, driver, base_url):
@@ -190,40 +161,29 @@ class TestDeposit:
         page.click_create_deposit()
         
         # Сразу проверяем текст кнопки
-        time.sleep(0.3)
+        page.wait_for_render()
         
         # Закрываем alert если есть
-        try:
-            alert = driver.switch_to.alert
-            alert_text = alert.text
-            alert.accept()
+        if page.is_alert_present():
+            alert_text = page.get_alert_text()
+            page.accept_alert()
             if "CryptoBot" in alert_text or "token" in alert_text.lower():
                 pytest.skip("CryptoBot не настроен в тестовой среде")
-        except:
-            pass
         
         button_text = page.get_deposit_button_text()
         
         # Может быть "Создание..." или заблокирована
         # В любом случае ждём завершения
-        time.sleep(1)
+        if page.wait_for_deposit_result() == "alert":
+            page.accept_alert()
 
 
 class TestWithdraw:
     """Тесты вывода средств."""
     
     @pytest.fixture(autouse=True)
-    def login_before_tests(self, driver, base_url, test_user):
+    def login_before_tests(self, logged_in_driver):
         """Авторизация перед каждым тестом."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(test_user["username"], test_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Тестовый пользователь не существует")
     
     def test_withdraw_form_elements(self, driver, base_url):
         """Проверка элементов формы вывода."""
@@ -255,14 +215,10 @@ class TestWithdraw:
         page.click_withdraw()
         
         # Должен быть alert с ошибкой
-        time.sleep(1)
-        try:
+        if page.wait_for_withdraw_result() == "alert":
             alert_text = page.get_alert_text()
             page.accept_alert()
             assert "Заполните все поля" in alert_text
-        except:
-            # Alert может не появиться в некоторых случаях
-            pass
     
     def test_withdraw_without_address(self, driver, base_url):
         """Попытка вывода без адреса."""
@@ -274,13 +230,10 @@ class TestWithdraw:
         page.click_withdraw()
         
         # Должен быть alert с ошибкой
-        time.sleep(1)
-        try:
+        if page.wait_for_withdraw_result() == "alert":
             alert_text = page.get_alert_text()
             page.accept_alert()
             assert "Заполните все поля" in alert_text
-        except:
-            pass
     
     def test_withdraw_with_insufficient_balance(self, driver, base_url):
         """Попытка вывода при недостаточном балансе."""
@@ -290,31 +243,17 @@ class TestWithdraw:
         # Пытаемся вывести очень большую сумму
         page.create_withdraw("TON", "999999999", "test_wallet_address")
         
-        # Ожидаем alert с ошибкой
-        time.sleep(2)
-        try:
-            alert_text = page.get_alert_text()
+        # Ожидаем alert с ошибкой о недостаточном балансе
+        if page.wait_for_withdraw_result() == "alert":
             page.accept_alert()
-            # Должна быть ошибка о недостаточном балансе
-        except:
-            pass
 
 
 class TestTransactions:
     """Тесты истории транзакций."""
     
     @pytest.fixture(autouse=True)
-    def login_before_tests(self, driver, base_url, test_user):
+    def login_before_tests(self, logged_in_driver):
         """Авторизация перед каждым тестом."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(test_user["username"], test_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Тестовый пользователь не существует")
     
     def test_transactions_section_loads(self, driver, base_url):
         """Проверка загрузки секции транзакций."""
@@ -399,9 +338,7 @@ class TestTransactions:
         register_page.open()
         register_page.register(unique_user["username"], unique_user["password"])
         
-        try:
-            register_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
+        if register_page.wait_for_registration_result(timeout=10) not in ("success", "redirect"):
             pytest.skip("Не удалось зарегистрировать нового пользователя")
         
         # Переходим в профиль
@@ -421,17 +358,8 @@ class TestProfileNavigation:
     """Тесты навигации в профиле."""
     
     @pytest.fixture(autouse=True)
-    def login_before_tests(self, driver, base_url, test_user):
+    def login_before_tests(self, logged_in_driver):
         """Авторизация перед каждым тестом."""
-        login_page = LoginPage(driver, base_url)
-        login_page.open()
-        login_page.login(test_user["username"], test_user["password"])
-        
-        try:
-            login_page.wait_for_url_contains("/auctions", timeout=10)
-        except:
-            if login_page.is_error_displayed():
-                pytest.skip("Тестовый пользователь не существует")
     
     def test_navigate_to_profile_from_nav(self, driver, base_url):
         """Переход в профиль через навигацию."""
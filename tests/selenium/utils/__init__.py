@@ -7,6 +7,13 @@ from utils.environment import (
     get_environment_manager,
     setup_environment
 )
+from utils.session_auth import SessionAuth
+from utils.identities import IdentityPool
+from utils.data_factory import DataFactory
+from utils.network_tracker import install_network_tracker, wait_for_network_idle
+from utils.driver_pool import DriverPool
+from utils.driver_resolver import DriverResolver, get_driver_resolver
+from utils.perf import PerfRecorder
 
 __all__ = [
     # Helpers
@@ -16,5 +23,20 @@ __all__ = [
     # Environment
     "EnvironmentManager",
     "get_environment_manager",
-    "setup_environment"
+    "setup_environment",
+    # Session auth
+    "SessionAuth",
+    "IdentityPool",
+    # Test data
+    "DataFactory",
+    # Network tracker
+    "install_network_tracker",
+    "wait_for_network_idle",
+    # Driver pool
+    "DriverPool",
+    # Driver resolver
+    "DriverResolver",
+    "get_driver_resolver",
+    # Performance
+    "PerfRecorder"
 ]
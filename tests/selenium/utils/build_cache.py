@@ -0,0 +1,184 @@
+"""
+Кэш сборки образов docker compose по содержимому build context.
+
+`docker compose up -d --build` пересобирает бэкенд и фронтенд на каждом
+запуске, даже если в src/, frontend/ и Dockerfile ничего не менялось.
+BuildCache считает хэш файлов каждого build context (с учётом его
+.dockerignore - то же, что docker отправляет на сборку) и хранит хэш
+последней успешной сборки. Пересобираются только сервисы, чей хэш изменился.
+
+Пример:
+    cache = BuildCache(project_root, compose=manager._compose)
+    stale = cache.stale_services()        # ["frontend"]
+    ... docker compose build frontend ...
+    cache.mark_built(stale)
+"""
+import os
+import json
+import fnmatch
+import hashlib
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from utils.cache import CACHE_DIR, write_json_atomic
+
+
+logger = logging.getLogger(__name__)
+
+
+# Сервисы со сборкой, если `docker compose config` недоступен
+DEFAULT_BUILD_CONTEXTS = {
+    "backend": (".", "Dockerfile"),
+    "frontend": ("frontend", "Dockerfile"),
+}
+
+
+def read_dockerignore(context: Path) -> List[Tuple[bool, str]]:
+    """Правила .dockerignore: [(исключение через '!', шаблон)]."""
+    path = context / ".dockerignore"
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return []
+    rules = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        pattern = line[1:].strip() if negate else line
+        pattern = os.path.normpath(pattern.lstrip("/")).replace(os.sep, "/")
+        rules.append((negate, pattern))
+    return rules
+
+
+def is_ignored(rel_path: str, rules: List[Tuple[bool, str]]) -> bool:
+    """
+    Путь исключён правилами .dockerignore. Как и в docker, побеждает
+    последнее подходящее правило, а шаблон каталога исключает всё внутри.
+    """
+    parts = rel_path.split("/")
+    prefixes = ["/".join(parts[:i]) for i in range(1, len(parts) + 1)]
+    ignored = False
+    for negate, pattern in rules:
+        if any(fnmatch.fnmatchcase(prefix, pattern) for prefix in prefixes):
+            ignored = not negate
+    return ignored
+
+
+def hash_context(context: Path, dockerfile: str = "Dockerfile") -> str:
+    """Хэш содержимого build context без файлов из .dockerignore."""
+    context = Path(context)
+    rules = read_dockerignore(context)
+    digest = hashlib.sha256()
+    files = []
+    for root, dirs, names in os.walk(context):
+        rel_root = os.path.relpath(root, context).replace(os.sep, "/")
+        rel_root = "" if rel_root == "." else rel_root + "/"
+        # Исключённые каталоги не обходим (node_modules), если нет правил-исключений внутри
+        if not any(negate for negate, _ in rules):
+            dirs[:] = [d for d in dirs if not is_ignored(rel_root + d, rules)]
+        for name in names:
+            rel_path = rel_root + name
+            # Dockerfile и .dockerignore docker получает всегда
+            if rel_path in (dockerfile, ".dockerignore") or not is_ignored(rel_path, rules):
+                files.append(rel_path)
+    for rel_path in sorted(files):
+        digest.update(rel_path.encode("utf-8") + b"\0")
+        try:
+            with open(context / rel_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 16), b""):
+                    digest.update(chunk)
+        except OSError:
+            # Битые ссылки и файлы без доступа docker тоже не прочитает
+            digest.update(b"<unreadable>")
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class BuildCache:
+    """Хэши build context сервисов и хэши последней успешной сборки."""
+
+    def __init__(
+        self,
+        project_root: str,
+        compose: Optional[Callable] = None,
+        cache_dir: Path = CACHE_DIR,
+        namespace: Optional[str] = None
+    ):
+        self.project_root = Path(project_root).resolve()
+        # Образы с другими именами (изолированные стеки) учитываются отдельно
+        self.key = f"{self.project_root}#{namespace}" if namespace else str(self.project_root)
+        self.compose = compose
+        self.cache_file = Path(cache_dir) / "build-cache.json"
+        self._hashes: Optional[Dict[str, str]] = None
+
+    def build_contexts(self) -> Dict[str, Tuple[Path, str]]:
+        """Сервисы со сборкой: {service: (context, dockerfile)} из `docker compose config`."""
+        if self.compose is not None:
+            code, stdout, _ = self.compose("config --format json", timeout=30)
+            if code == 0:
+                try:
+                    services = json.loads(stdout).get("services", {})
+                except ValueError:
+                    services = None
+                if services is not None:
+                    return {
+                        name: (
+                            Path(service["build"]["context"]),
+                            service["build"].get("dockerfile", "Dockerfile")
+                        )
+                        for name, service in services.items()
+                        if service.get("build")
+                    }
+        return {
+            name: (self.project_root / context, dockerfile)
+            for name, (context, dockerfile) in DEFAULT_BUILD_CONTEXTS.items()
+        }
+
+    def current_hashes(self) -> Dict[str, str]:
+        """Хэш каждого сервиса: build context + Dockerfile + docker-compose.yml."""
+        if self._hashes is None:
+            compose_file = self.project_root / "docker-compose.yml"
+            try:
+                compose_hash = hashlib.sha256(compose_file.read_bytes()).hexdigest()
+            except OSError:
+                compose_hash = ""
+            self._hashes = {}
+            for service, (context, dockerfile) in self.build_contexts().items():
+                digest = hashlib.sha256()
+                digest.update(hash_context(context, dockerfile).encode())
+                digest.update(compose_hash.encode())
+                self._hashes[service] = digest.hexdigest()
+        return self._hashes
+
+    def _read(self) -> dict:
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data.get(self.key, {})
+
+    def stale_services(self) -> List[str]:
+        """Сервисы, чей хэш отличается от последней успешной сборки."""
+        built = self._read()
+        return [
+            service for service, value in self.current_hashes().items()
+            if built.get(service) != value
+        ]
+
+    def mark_built(self, services: List[str]) -> None:
+        """Запомнить хэши успешно собранных сервисов."""
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        entry = data.setdefault(self.key, {})
+        hashes = self.current_hashes()
+        for service in services:
+            entry[service] = hashes[service]
+        try:
+            write_json_atomic(self.cache_file, data)
+        except OSError as e:
+            logger.warning("Не удалось сохранить кэш сборки: %s", e)
+
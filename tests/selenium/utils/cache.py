@@ -0,0 +1,40 @@
+"""
+Файловый кэш тестовой инфраструктуры.
+
+Кэши переживают запуск и делятся между воркерами xdist, поэтому пишутся
+атомарно: читатель видит либо старую, либо новую версию файла целиком.
+
+CACHE_DIR (TEST_CACHE_DIR) - общий каталог: хэши сборки образов,
+сгенерированные compose override, пул пользователей (если его каталог
+не задан отдельно через IDENTITY_CACHE_DIR).
+"""
+import os
+import json
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+CACHE_DIR = Path(os.getenv("TEST_CACHE_DIR", Path.home() / ".cache" / "telegram-auc"))
+
+
+def write_json_atomic(path: Path, data: Any, **dump_kwargs) -> None:
+    """
+    Записать JSON атомарно: временный файл в том же каталоге + os.replace.
+    dump_kwargs передаются в json.dump (по умолчанию indent=2).
+    OSError пробрасывается, временный файл удаляется.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    dump_kwargs.setdefault("indent", 2)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, **dump_kwargs)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,295 @@
+"""
+Подготовка тестовых данных через API вместо UI.
+
+DataFactory создаёт пользователей, пополняет их, создаёт аукционы в нужном
+состоянии и делает стартовые ставки - параллельно, через общий пул
+соединений requests.Session и ThreadPoolExecutor.
+
+В тестах используется декларативно:
+
+    @pytest.mark.needs(active_auction=1, bids=20)
+    def test_top_bids(self, driver, base_url, seed):
+        page = AuctionDetailPage(driver, base_url).open(seed.active_auction)
+
+Ключи needs:
+    users=N              - пополненные пользователи
+    active_auction=N     - активные аукционы (startTime в прошлом)
+    scheduled_auction=N  - запланированные (startTime через час)
+    cancelled_auction=N  - отменённые
+    bids=N               - ставки N разных пользователей в первый активный аукцион
+    currency="TON"       - валюта аукционов
+
+Созданные фабрикой активные и запланированные аукционы отменяются в close(),
+чтобы они не копились в /auctions между прогонами.
+"""
+import time
+import secrets
+import logging
+import threading
+import requests
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+
+
+logger = logging.getLogger(__name__)
+
+AUCTION_STATES = ("active", "scheduled", "cancelled")
+
+DEFAULT_FUNDING = {"TON": "1000", "USDT": "1000"}
+
+
+class DataFactoryError(Exception):
+    """API не смог подготовить данные."""
+
+
+@dataclass
+class Seed:
+    """Данные, подготовленные для теста по маркеру needs."""
+
+    users: List[dict] = field(default_factory=list)
+    auctions: Dict[str, List[str]] = field(default_factory=dict)
+    bids: List[dict] = field(default_factory=list)
+
+    @property
+    def active_auction(self) -> Optional[str]:
+        """ID первого активного аукциона."""
+        return (self.auctions.get("active") or [None])[0]
+
+    @property
+    def scheduled_auction(self) -> Optional[str]:
+        return (self.auctions.get("scheduled") or [None])[0]
+
+
+def _iso(moment: datetime) -> str:
+    return moment.astimezone(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+class DataFactory:
+    """
+    Фабрика данных одного воркера.
+
+    Пример:
+        factory = DataFactory(api_url, admin_token)
+        users = factory.create_users(5)
+        auction_id = factory.create_auction("active")
+        factory.place_bids(auction_id, users)
+    """
+
+    def __init__(self, api_url: str, admin_token: str, max_workers: int = 8, timeout: int = 10):
+        self.api_url = api_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.admin_headers = {"Authorization": f"Bearer {admin_token}"}
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="data-factory")
+        # Аукционы, которые нужно отменить при закрытии
+        self._auctions: List[str] = []
+        self._auctions_lock = threading.Lock()
+
+    def cancel_created_auctions(self) -> None:
+        """Отменить созданные фабрикой аукционы (ставки возвращаются участникам)."""
+        with self._auctions_lock:
+            auction_ids, self._auctions = self._auctions, []
+
+        def cancel(auction_id: str) -> None:
+            try:
+                self._request("POST", f"/api/auctions/{auction_id}/cancel")
+            except DataFactoryError as e:
+                # Аукцион уже завершён или отменён в тесте
+                logger.debug("Аукцион %s не отменён: %s", auction_id, e)
+
+        self._map(cancel, auction_ids)
+
+    def close(self) -> None:
+        self.cancel_created_auctions()
+        self.executor.shutdown(wait=False)
+        self.session.close()
+
+    def _request(self, method: str, path: str, token: Optional[str] = None, **kwargs) -> dict:
+        headers = {"Authorization": f"Bearer {token}"} if token else self.admin_headers
+        try:
+            response = self.session.request(
+                method, f"{self.api_url}{path}", headers=headers, timeout=self.timeout, **kwargs
+            )
+        except requests.exceptions.RequestException as e:
+            raise DataFactoryError(f"{method} {path}: {e}")
+        if response.status_code not in (200, 201):
+            raise DataFactoryError(f"{method} {path}: {response.status_code} {response.text[:200]}")
+        return response.json()
+
+    def _map(self, func, items) -> list:
+        """Выполнить func для всех items параллельно, сохранив порядок."""
+        return list(self.executor.map(func, items))
+
+    # Пользователи
+    def create_user(self, funding: Optional[Dict[str, str]] = None) -> dict:
+        """Зарегистрировать и пополнить пользователя."""
+        username = f"df_{secrets.token_hex(5)}"
+        password = secrets.token_urlsafe(12)
+        data = self._request("POST", "/api/register", json={"username": username, "password": password})
+        user = {
+            "username": username,
+            "password": password,
+            "id": data["user"]["id"],
+            "token": data["token"],
+        }
+        self.fund(user, funding)
+        return user
+
+    def create_users(self, count: int, funding: Optional[Dict[str, str]] = None) -> List[dict]:
+        """Создать count пополненных пользователей параллельно."""
+        return self._map(lambda _: self.create_user(funding), range(count))
+
+    def fund(self, user: dict, funding: Optional[Dict[str, str]] = None) -> None:
+        """Выставить баланс пользователя (admin endpoint)."""
+        for currency, amount in (DEFAULT_FUNDING if funding is None else funding).items():
+            self._request(
+                "POST", f"/api/admin/users/{user['id']}/balance",
+                json={"currency": currency, "amount": amount}
+            )
+
+    # Аукционы
+    def auction_payload(self, state: str = "active", **overrides) -> dict:
+        """Параметры POST /api/auctions для состояния state."""
+        now = datetime.now(timezone.utc)
+        # Активный: startTime в прошлом, планировщик запустит на ближайшем тике
+        start = now - timedelta(seconds=1) if state == "active" else now + timedelta(hours=1)
+        items_per_round = overrides.pop("itemsPerRound", 10)
+        rounds = overrides.pop("roundsCount", 3)
+        payload = {
+            "title": f"E2E {state} {secrets.token_hex(3)}",
+            "description": "Создан тестовой фабрикой данных",
+            "currency": "TON",
+            "totalItems": items_per_round * rounds,
+            "roundsCount": rounds,
+            "itemsPerRound": items_per_round,
+            "startTime": _iso(start),
+            "firstRoundDurationSec": 3600,
+            "roundDurationSec": 600,
+            "minIncrement": "0.1",
+            "startingPrice": "1",
+        }
+        payload.update(overrides)
+        return payload
+
+    def get_auction(self, auction_id: str) -> dict:
+        return self._request("GET", f"/api/auctions/{auction_id}")
+
+    def wait_for_status(self, auction_id: str, status: str, timeout: float = 15) -> dict:
+        """
+        Дождаться статуса аукциона (планировщик тикает раз в секунду).
+        Опрос с нарастающим интервалом от 50 мс.
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        while True:
+            auction = self.get_auction(auction_id)
+            if auction.get("status") == status:
+                return auction
+            if time.monotonic() + delay > deadline:
+                raise DataFactoryError(
+                    f"Аукцион {auction_id}: статус {auction.get('status')!r} вместо {status!r} за {timeout} с"
+                )
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+    def create_auction(self, state: str = "active", wait: bool = True, **overrides) -> str:
+        """
+        Создать аукцион в состоянии state (active, scheduled, cancelled).
+
+        Returns:
+            ID аукциона
+        """
+        if state not in AUCTION_STATES:
+            raise ValueError(f"Unknown auction state: {state}")
+        auction_id = self._request("POST", "/api/auctions", json=self.auction_payload(state, **overrides))["id"]
+        if state != "cancelled":
+            with self._auctions_lock:
+                self._auctions.append(auction_id)
+        if state == "cancelled":
+            self._request("POST", f"/api/auctions/{auction_id}/cancel")
+        elif state == "active" and wait:
+            self.wait_for_status(auction_id, "active")
+        return auction_id
+
+    def create_auctions(self, counts: Dict[str, int], **overrides) -> Dict[str, List[str]]:
+        """Создать аукционы по состояниям параллельно: {"active": 1, "scheduled": 2}."""
+        states = [state for state, count in counts.items() for _ in range(count)]
+        ids = self._map(lambda state: self.create_auction(state, **overrides), states)
+        result: Dict[str, List[str]] = {}
+        for state, auction_id in zip(states, ids):
+            result.setdefault(state, []).append(auction_id)
+        return result
+
+    # Ставки
+    def place_bid(self, auction_id: str, user: dict, amount: str) -> dict:
+        """Поставить ставку от имени пользователя (ставка ставится в очередь)."""
+        data = self._request("POST", f"/api/auctions/{auction_id}/bid", token=user["token"], json={"amount": amount})
+        return {"user": user["username"], "amount": amount, "jobId": data.get("jobId")}
+
+    def place_bids(self, auction_id: str, users: List[dict], wait: bool = True, timeout: float = 15) -> List[dict]:
+        """
+        Ставки всех users параллельно, суммы растут с шагом minIncrement.
+        С wait - дождаться, пока очередь обработает все ставки.
+        """
+        auction = self.get_auction(auction_id)
+        base = Decimal(str(auction.get("currentMinBid") or "1"))
+        step = Decimal(str(auction.get("minIncrement") or "0.1"))
+        amounts = [str(base + step * i) for i in range(len(users))]
+        bids = self._map(lambda pair: self.place_bid(auction_id, *pair), list(zip(users, amounts)))
+        if wait:
+            self.wait_for_bids(auction_id, len(bids), timeout)
+        return bids
+
+    def wait_for_bids(self, auction_id: str, count: int, timeout: float = 15) -> None:
+        """Дождаться count активных ставок аукциона (admin endpoint)."""
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        while True:
+            bids = self._request("GET", f"/api/auctions/{auction_id}/bids")
+            active = sum(1 for bid in bids if bid.get("status") == "active")
+            if active >= count:
+                return
+            if time.monotonic() + delay > deadline:
+                raise DataFactoryError(f"Аукцион {auction_id}: {active} из {count} ставок за {timeout} с")
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+    # Маркер needs
+    def build(self, needs: dict) -> Seed:
+        """Подготовить данные по ключам маркера needs."""
+        needs = dict(needs)
+        currency = needs.pop("currency", "TON")
+        users_count = needs.pop("users", 0)
+        bids_count = needs.pop("bids", 0)
+        counts = {
+            state: needs.pop(f"{state}_auction", 0)
+            for state in AUCTION_STATES
+        }
+        if needs:
+            raise ValueError(f"Unknown needs keys: {', '.join(needs)}")
+        if bids_count and not counts["active"]:
+            counts["active"] = 1
+
+        # Пользователи и аукционы независимы - готовим одновременно. Задачи
+        # пользователей ставятся в пул сразу, аукционы создаются из этого потока:
+        # задача пула не должна ждать другие задачи того же пула (deadlock при max_workers=1).
+        # Раунд вмещает все стартовые ставки, чтобы ни одна не оказалась ниже минимума
+        user_futures = [self.executor.submit(self.create_user) for _ in range(users_count + bids_count)]
+        auctions = self.create_auctions(
+            {state: count for state, count in counts.items() if count},
+            currency=currency,
+            itemsPerRound=max(10, bids_count)
+        )
+        users = [future.result() for future in user_futures]
+        seed = Seed(users=users[:users_count], auctions=auctions)
+
+        if bids_count:
+            seed.bids = self.place_bids(seed.active_auction, users[users_count:])
+        return seed
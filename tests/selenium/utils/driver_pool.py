@@ -0,0 +1,206 @@
+"""
+Пул заранее запущенных браузеров для Selenium тестов.
+
+Пул живёт в пределах одного процесса, поэтому при запуске через pytest-xdist
+у каждого воркера свой независимый пул. Пока идёт текущий тест, следующий
+браузер запускается в фоне, и fixture получает его уже готовым.
+"""
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+logger = logging.getLogger(__name__)
+
+# Сброс storage и service workers на текущем origin (асинхронный скрипт)
+_RESET_ORIGIN_JS = """
+const done = arguments[arguments.length - 1];
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+if (navigator.serviceWorker && navigator.serviceWorker.getRegistrations) {
+    navigator.serviceWorker.getRegistrations()
+        .then(regs => Promise.all(regs.map(r => r.unregister())))
+        .then(() => done(true), () => done(true));
+} else {
+    done(true);
+}
+"""
+
+
+@dataclass
+class PooledDriver:
+    """Браузер из пула и счётчик его использований."""
+    driver: WebDriver
+    uses: int = 0
+
+
+class DriverPool:
+    """
+    Пул WebDriver с прогревом в фоне.
+
+    - health-check перед выдачей (health_check)
+    - сброс состояния между арендами: cookies, storage, service workers, лишние вкладки
+    - пересоздание после max_uses использований или после падения браузера
+    - фоновый запуск следующего браузера, пока выполняется текущий тест
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], WebDriver],
+        health_check: Callable[[WebDriver], bool],
+        max_uses: int = 1,
+        prewarm: bool = True,
+        origins: Optional[List[str]] = None
+    ):
+        self._factory = factory
+        self._health_check = health_check
+        self.max_uses = max(1, max_uses)
+        self.prewarm = prewarm
+        self.origins = [self._origin(url) for url in (origins or [])]
+
+        self._lock = threading.Lock()
+        self._idle: List[PooledDriver] = []
+        self._leased: Dict[int, PooledDriver] = {}
+        self._warming: Optional[Future] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="driver-pool")
+        self._closed = False
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    def _spawn(self) -> PooledDriver:
+        return PooledDriver(driver=self._factory())
+
+    def _schedule_warmup(self) -> None:
+        """Запустить создание следующего браузера в фоне (если ещё не запущено)."""
+        with self._lock:
+            if self._closed or not self.prewarm or self._idle or self._warming is not None:
+                return
+            self._warming = self._executor.submit(self._spawn)
+
+    def _take_warm(self) -> Optional[PooledDriver]:
+        """Забрать готовый браузер: из простаивающих или из фонового прогрева."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+            warming, self._warming = self._warming, None
+
+        if warming is None:
+            return None
+        try:
+            return warming.result()
+        except Exception as e:
+            logger.warning("Фоновый запуск браузера не удался: %s", e)
+            return None
+
+    def acquire(self) -> WebDriver:
+        """Выдать живой браузер из пула."""
+        while True:
+            pooled = self._take_warm() or self._spawn()
+            if self._health_check(pooled.driver):
+                break
+            self._quit(pooled)
+
+        pooled.uses += 1
+        with self._lock:
+            self._leased[id(pooled.driver)] = pooled
+
+        # Этот браузер не вернётся в пул - готовим замену, пока идёт тест
+        if pooled.uses >= self.max_uses:
+            self._schedule_warmup()
+
+        return pooled.driver
+
+    def release(self, driver: WebDriver) -> None:
+        """Вернуть браузер в пул (или закрыть, если он отслужил своё/упал)."""
+        with self._lock:
+            pooled = self._leased.pop(id(driver), None)
+        if pooled is None:
+            return
+
+        if self._closed or pooled.uses >= self.max_uses or not self._health_check(driver):
+            self._retire(pooled)
+            return
+
+        if not self._reset(driver):
+            self._retire(pooled)
+            return
+
+        with self._lock:
+            self._idle.append(pooled)
+
+    def _reset(self, driver: WebDriver) -> bool:
+        """Сбросить состояние браузера между тестами."""
+        try:
+            # Закрываем открытые alert
+            try:
+                driver.switch_to.alert.dismiss()
+            except Exception:
+                pass
+
+            # Лишние вкладки и окна
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # Storage и service workers текущего origin
+            try:
+                driver.execute_async_script(_RESET_ORIGIN_JS)
+            except Exception:
+                pass
+
+            # В Chromium чистим данные origin приложения целиком
+            if hasattr(driver, "execute_cdp_cmd"):
+                for origin in self.origins:
+                    driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                        "origin": origin,
+                        "storageTypes": "all"
+                    })
+
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.warning("Не удалось сбросить браузер, он будет пересоздан: %s", e)
+            return False
+
+    def _quit(self, pooled: PooledDriver) -> None:
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+
+    def _retire(self, pooled: PooledDriver) -> None:
+        """Закрыть браузер в фоне и подготовить замену."""
+        if self._closed:
+            self._quit(pooled)
+            return
+        self._executor.submit(self._quit, pooled)
+        self._schedule_warmup()
+
+    def close(self) -> None:
+        """Закрыть все браузеры пула."""
+        with self._lock:
+            self._closed = True
+            drivers = self._idle + list(self._leased.values())
+            self._idle = []
+            self._leased = {}
+            warming, self._warming = self._warming, None
+
+        if warming is not None:
+            try:
+                drivers.append(warming.result())
+            except Exception:
+                pass
+
+        self._executor.shutdown(wait=True)
+        for pooled in drivers:
+            self._quit(pooled)
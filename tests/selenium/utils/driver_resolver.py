@@ -0,0 +1,188 @@
+"""
+Однократное определение путей к драйверам браузеров через Selenium Manager.
+
+Без явного пути Service каждый раз вызывает Selenium Manager (а тот иногда
+качает драйвер заново). Здесь пути определяются один раз на браузер и
+сохраняются в файловый кэш, привязанный к версии браузера, чтобы воркеры
+xdist и следующие запуски брали готовый путь.
+"""
+import os
+import json
+import time
+import logging
+import threading
+import subprocess
+from pathlib import Path
+from typing import Dict, Optional
+from selenium.webdriver.common.selenium_manager import SeleniumManager
+from utils.cache import write_json_atomic
+
+
+logger = logging.getLogger(__name__)
+
+# Имена браузеров в терминах Selenium Manager
+SELENIUM_MANAGER_BROWSERS = {
+    "chrome": "chrome",
+    "firefox": "firefox",
+    "edge": "MicrosoftEdge",
+}
+
+DEFAULT_CACHE_DIR = Path(os.getenv("DRIVER_CACHE_DIR", Path.home() / ".cache" / "selenium"))
+
+
+def _browser_fingerprint(browser_path: str) -> Optional[dict]:
+    """
+    Версия установленного браузера.
+    На Windows `--version` запускает сам браузер, поэтому там версия
+    заменяется размером и временем изменения бинарника.
+    """
+    try:
+        stat = os.stat(browser_path)
+    except OSError:
+        return None
+
+    version = None
+    if os.name != "nt":
+        try:
+            result = subprocess.run(
+                [browser_path, "--version"],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+            lines = result.stdout.strip().splitlines()
+            version = lines[0] if lines else None
+        except (OSError, subprocess.SubprocessError):
+            pass
+
+    if version is not None:
+        return {"version": version}
+    return {"size": stat.st_size, "mtime": int(stat.st_mtime)}
+
+
+class DriverResolver:
+    """
+    Кэш путей {driver_path, browser_path} по браузерам.
+
+    Порядок поиска: память процесса -> файл кэша (если версия браузера
+    не изменилась и файлы на месте) -> Selenium Manager.
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, lock_timeout: int = 120):
+        self.cache_file = Path(cache_dir) / "driver-paths.json"
+        self.lock_file = self.cache_file.with_suffix(".lock")
+        self.lock_timeout = lock_timeout
+        self._resolved: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def _read_cache(self) -> dict:
+        try:
+            return json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _write_cache(self, data: dict) -> None:
+        write_json_atomic(self.cache_file, data)
+
+    def _acquire_file_lock(self) -> bool:
+        """Межпроцессная блокировка через O_EXCL (работает и на Windows)."""
+        self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+        deadline = time.time() + self.lock_timeout
+        while True:
+            try:
+                fd = os.open(self.lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                return True
+            except FileExistsError:
+                # Блокировка осталась от упавшего процесса
+                try:
+                    if time.time() - self.lock_file.stat().st_mtime > self.lock_timeout:
+                        os.unlink(self.lock_file)
+                        continue
+                except OSError:
+                    continue
+                if time.time() > deadline:
+                    return False
+                time.sleep(0.1)
+
+    def _release_file_lock(self) -> None:
+        try:
+            os.unlink(self.lock_file)
+        except OSError:
+            pass
+
+    def _cached_entry(self, browser: str) -> Optional[dict]:
+        """Запись из файла кэша, если она ещё действительна."""
+        entry = self._read_cache().get(browser)
+        if not entry:
+            return None
+        if not Path(entry.get("driver_path", "")).is_file():
+            return None
+        browser_path = entry.get("browser_path")
+        if browser_path and _browser_fingerprint(browser_path) != entry.get("fingerprint"):
+            return None
+        return entry
+
+    def _run_selenium_manager(self, browser: str) -> dict:
+        output = SeleniumManager().binary_paths(["--browser", SELENIUM_MANAGER_BROWSERS[browser]])
+        browser_path = output.get("browser_path") or None
+        return {
+            "driver_path": output["driver_path"],
+            "browser_path": browser_path,
+            "fingerprint": _browser_fingerprint(browser_path) if browser_path else None,
+        }
+
+    def resolve(self, browser: str) -> dict:
+        """
+        Получить пути для браузера.
+
+        Returns:
+            {"driver_path": ..., "browser_path": ... или None, "fingerprint": ...}
+        """
+        browser = browser.lower()
+        if browser not in SELENIUM_MANAGER_BROWSERS:
+            raise ValueError(f"Unsupported browser: {browser}")
+
+        with self._lock:
+            if browser in self._resolved:
+                return self._resolved[browser]
+
+            entry = self._cached_entry(browser)
+            if entry is None:
+                locked = self._acquire_file_lock()
+                try:
+                    # Пока ждали блокировку, другой воркер мог уже всё определить
+                    entry = self._cached_entry(browser)
+                    if entry is None:
+                        started = time.time()
+                        entry = self._run_selenium_manager(browser)
+                        logger.info(
+                            "Selenium Manager: %s -> %s (%.1fs)",
+                            browser, entry["driver_path"], time.time() - started
+                        )
+                        if locked:
+                            data = self._read_cache()
+                            data[browser] = entry
+                            try:
+                                self._write_cache(data)
+                            except OSError as e:
+                                logger.warning("Не удалось сохранить кэш драйверов: %s", e)
+                finally:
+                    if locked:
+                        self._release_file_lock()
+
+            self._resolved[browser] = entry
+            return entry
+
+
+# Глобальный экземпляр для процесса
+_resolver: Optional[DriverResolver] = None
+
+
+def get_driver_resolver() -> DriverResolver:
+    """Получить глобальный резолвер драйверов."""
+    global _resolver
+    if _resolver is None:
+        _resolver = DriverResolver()
+    return _resolver
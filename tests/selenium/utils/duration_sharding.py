@@ -0,0 +1,102 @@
+"""
+Распределение тестов по воркерам xdist с учётом длительности прошлых запусков.
+
+Стандартная раздача xdist не знает, что TestFullUserJourney или
+TestCreateAuction идут минутами: долгие классы скапливаются на нескольких
+воркерах, остальные простаивают в конце запуска.
+
+- TestDurations хранит длительность каждого теста (setup + call + teardown)
+  в кэше pytest (.pytest_cache), сглаживая шум между запусками.
+- DurationScheduling - LoadScopeScheduling (тесты одного класса/модуля
+  остаются на одном воркере и делят class-level fixtures), который отдаёт
+  освободившемуся воркеру самую долгую из оставшихся групп:
+  longest-processing-time-first.
+"""
+import statistics
+import pytest
+from collections import OrderedDict
+from typing import Dict, Optional
+from xdist.scheduler import LoadScopeScheduling
+
+
+CACHE_KEY = "telegram-auc/test-durations"
+
+# Вес нового замера при сглаживании
+SMOOTHING = 0.5
+
+# Оценка для теста без истории, если истории нет совсем
+DEFAULT_DURATION = 10.0
+
+
+class TestDurations:
+    """Длительности тестов из прошлых запусков (config.cache)."""
+
+    # Не тестовый класс, хоть и начинается с Test
+    __test__ = False
+
+    def __init__(self, config):
+        self.cache = config.cache
+        self.durations: Dict[str, float] = dict(self.cache.get(CACHE_KEY, {}))
+        self._current: Dict[str, float] = {}
+        self._skipped = set()
+
+    def estimate(self, nodeid: str) -> float:
+        """Ожидаемая длительность теста; для новых - медиана известных."""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        if self.durations:
+            return statistics.median(self.durations.values())
+        return DEFAULT_DURATION
+
+    def pytest_runtest_logreport(self, report) -> None:
+        # Пропущенные тесты ничего не говорят о длительности
+        if report.skipped:
+            self._skipped.add(report.nodeid)
+            return
+        self._current[report.nodeid] = self._current.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session) -> None:
+        if not self._current:
+            return
+        for nodeid, duration in self._current.items():
+            if nodeid in self._skipped:
+                continue
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = round(
+                duration if previous is None else previous + SMOOTHING * (duration - previous), 3
+            )
+        self.cache.set(CACHE_KEY, self.durations)
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """LoadScopeScheduling с очередью групп по убыванию ожидаемой длительности."""
+
+    def __init__(self, config, log=None, durations: Optional[TestDurations] = None):
+        super().__init__(config, log)
+        self.durations = durations or TestDurations(config)
+
+    def _scope_duration(self, work_unit: Dict[str, bool]) -> float:
+        return sum(
+            self.durations.estimate(nodeid)
+            for nodeid, completed in work_unit.items()
+            if not completed
+        )
+
+    def _assign_work_unit(self, node) -> None:
+        # Очередь пересобирается перед каждой выдачей: после падения воркера
+        # его группы возвращаются в конец очереди
+        ordered = sorted(self.workqueue.items(), key=lambda item: -self._scope_duration(item[1]))
+        self.workqueue = OrderedDict(ordered)
+        super()._assign_work_unit(node)
+
+
+class DurationShardingPlugin:
+    """Подключает DurationScheduling вместо стандартного планировщика xdist."""
+
+    def __init__(self, durations: TestDurations):
+        self.durations = durations
+
+    # Раньше стандартной реализации xdist (она trylast)
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        return DurationScheduling(config, log, self.durations)
@@ -10,8 +10,15 @@ import subprocess
 import requests
 import atexit
 from pathlib import Path
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 from urllib.parse import urlparse
+from utils.readiness import (
+    ReadinessChecker, Component, http_probe,
+    DEFAULT_MONGO_CONTAINER, DEFAULT_REDIS_CONTAINER
+)
+from utils.build_cache import BuildCache
+from utils.stack_profile import DEFAULT_STACK_PROFILE, compose_files
 
 
 class EnvironmentManager:
@@ -24,12 +31,26 @@ class EnvironmentManager:
         self,
         base_url: str = "http://localhost:8080",  # Фронтенд в docker на 8080
         api_url: str = "http://localhost:3000",
-        project_root: Optional[str] = None
+        project_root: Optional[str] = None,
+        stack_profile: str = DEFAULT_STACK_PROFILE,
+        project_name: Optional[str] = None,
+        override_files: Optional[List[str]] = None,
+        mongo_container: str = DEFAULT_MONGO_CONTAINER,
+        redis_container: str = DEFAULT_REDIS_CONTAINER
     ):
         self.base_url = base_url
         self.api_url = api_url
         self.project_root = project_root or self._find_project_root()
         
+        # Профиль стека: prod-like или fast (tmpfs, utils/stack_profile.py)
+        self.stack_profile = stack_profile
+        self.compose_files = compose_files(self.project_root, stack_profile) + list(override_files or [])
+        
+        # Имя compose-проекта и контейнеры для изолированных стеков (utils/isolated_stacks.py)
+        self.project_name = project_name
+        self.mongo_container = mongo_container
+        self.redis_container = redis_container
+        
         # Флаг, что мы запустили docker-compose
         self._compose_started_by_us = False
         
@@ -84,6 +105,20 @@ class EnvironmentManager:
         except Exception as e:
             return -1, "", str(e)
     
+    def _compose_args(self) -> str:
+        """Общие аргументы compose: имя проекта и файлы."""
+        args = [f'-p "{self.project_name}"'] if self.project_name else []
+        args.extend(f'-f "{path}"' for path in self.compose_files)
+        return " ".join(args)
+    
+    def _compose(self, args: str, timeout: int = 300) -> Tuple[int, str, str]:
+        """Команда docker compose; при ошибке - старый формат docker-compose."""
+        common = self._compose_args()
+        code, stdout, stderr = self._run_command(f"docker compose {common} {args}", timeout=timeout)
+        if code != 0:
+            code, stdout, stderr = self._run_command(f"docker-compose {common} {args}", timeout=timeout)
+        return code, stdout, stderr
+    
     def is_docker_available(self) -> bool:
         """Проверить, доступен ли Docker."""
         code, _, _ = self._run_command("docker info", timeout=10)
@@ -91,10 +126,11 @@ class EnvironmentManager:
     
     def is_compose_running(self) -> bool:
         """Проверить, запущен ли docker-compose."""
-        code, stdout, _ = self._run_command("docker compose ps --format json", timeout=10)
+        args = self._compose_args()
+        code, stdout, _ = self._run_command(f"docker compose {args} ps --format json", timeout=10)
         if code != 0:
             # Попробуем старый формат docker-compose
-            code, stdout, _ = self._run_command("docker-compose ps", timeout=10)
+            code, stdout, _ = self._run_command(f"docker-compose {args} ps", timeout=10)
         
         # Проверяем что контейнеры запущены
         return code == 0 and ("auction-backend" in stdout or "running" in stdout.lower())
@@ -111,6 +147,15 @@ class EnvironmentManager:
         host, port = self._parse_url(self.api_url)
         return self._is_port_open(host, port)
     
+    def is_backend_ready(self, timeout: float = 5) -> bool:
+        """
+        Бэкенд отвечает на /health. В отличие от is_backend_running не
+        довольствуется открытым портом: docker-proxy принимает соединения
+        ещё до старта сервера.
+        """
+        checker = ReadinessChecker([Component("бэкенд", http_probe(f"{self.api_url}/health"))])
+        return checker.wait(timeout=timeout).ok
+    
     def is_frontend_running(self) -> bool:
         """Проверить, запущен ли фронтенд."""
         try:
@@ -122,8 +167,31 @@ class EnvironmentManager:
         host, port = self._parse_url(self.base_url)
         return self._is_port_open(host, port)
     
-    def start_compose(self) -> bool:
-        """Запустить docker-compose."""
+    def build_images(self, cache_namespace: Optional[str] = None) -> bool:
+        """Собрать образы сервисов, чей build context изменился с последней сборки."""
+        build_cache = BuildCache(self.project_root, compose=self._compose, namespace=cache_namespace)
+        stale = build_cache.stale_services()
+        if not stale:
+            print("   ✓ Образы актуальны, сборка пропущена")
+            return True
+        print(f"   Сборка: {', '.join(stale)}")
+        build_start = time.monotonic()
+        code, stdout, stderr = self._compose(f"build {' '.join(stale)}", timeout=600)  # 10 минут на билд
+        if code != 0:
+            print(f"✗ Ошибка сборки образов:")
+            print(f"   {stderr}")
+            return False
+        build_cache.mark_built(stale)
+        print(f"   ✓ Образы собраны ({time.monotonic() - build_start:.1f}s)")
+        return True
+    
+    def start_compose(self, build: bool = True) -> bool:
+        """
+        Запустить docker-compose.
+        
+        Args:
+            build: Собрать изменившиеся образы (False - образы уже собраны)
+        """
         # Проверяем Docker
         if not self.is_docker_available():
             print("✗ Docker не доступен. Убедитесь, что Docker Desktop запущен.")
@@ -136,20 +204,14 @@ class EnvironmentManager:
         
         print("⏳ Запуск Docker Compose...")
         print(f"   Папка: {self.project_root}")
+        print(f"   Профиль: {self.stack_profile}")
         
-        # Запускаем docker-compose
-        # Сначала пробуем новый формат (docker compose), потом старый (docker-compose)
-        code, stdout, stderr = self._run_command(
-            "docker compose up -d --build",
-            timeout=600  # 10 минут на билд
-        )
+        # Пересобираем только сервисы, у которых изменился build context
+        if build and not self.build_images():
+            return False
         
-        if code != 0:
-            # Пробуем старый формат
-            code, stdout, stderr = self._run_command(
-                "docker-compose up -d --build",
-                timeout=600
-            )
+        up_start = time.monotonic()
+        code, stdout, stderr = self._compose("up -d", timeout=300)
         
         if code != 0:
             print(f"✗ Ошибка запуска docker-compose:")
@@ -164,48 +226,31 @@ class EnvironmentManager:
             self._show_compose_logs()
             return False
         
-        print("✓ Docker Compose запущен")
+        print(f"✓ Docker Compose запущен ({time.monotonic() - up_start:.1f}s)")
         self._compose_started_by_us = True
         return True
     
     def _wait_for_services(self, timeout: int = 180) -> bool:
-        """Ожидание готовности всех сервисов."""
-        start_time = time.time()
-        backend_ready = False
-        frontend_ready = False
-        
-        while time.time() - start_time < timeout:
-            if not backend_ready and self.is_backend_running():
-                print("   ✓ Бэкенд готов")
-                backend_ready = True
-            
-            if not frontend_ready and self.is_frontend_running():
-                print("   ✓ Фронтенд готов")
-                frontend_ready = True
-            
-            if backend_ready and frontend_ready:
-                return True
-            
-            # Показываем прогресс
-            elapsed = int(time.time() - start_time)
-            if elapsed % 10 == 0 and elapsed > 0:
-                status = []
-                if not backend_ready:
-                    status.append("бэкенд")
-                if not frontend_ready:
-                    status.append("фронтенд")
-                print(f"   ⏳ Ожидание: {', '.join(status)} ({elapsed}s)")
-            
-            time.sleep(2)
-        
-        return False
+        """
+        Ожидание готовности всех сервисов: бэкенд, фронтенд, MongoDB и Redis
+        опрашиваются параллельно (utils/readiness.py).
+        """
+        checker = ReadinessChecker.for_stack(
+            self.api_url,
+            self.base_url,
+            mongo_container=self.mongo_container,
+            redis_container=self.redis_container,
+            on_ready=lambda name, seconds: print(f"   ✓ {name} готов ({seconds:.2f}s)")
+        )
+        report = checker.wait(timeout=timeout)
+        if not report.ok:
+            print(f"   ✗ Не готовы за {report.elapsed:.0f}s: {', '.join(report.pending)}")
+        return report.ok
     
     def _show_compose_logs(self) -> None:
         """Показать логи docker-compose для диагностики."""
         print("\n   Логи контейнеров:")
-        code, stdout, _ = self._run_command("docker compose logs --tail=20", timeout=30)
-        if code != 0:
-            code, stdout, _ = self._run_command("docker-compose logs --tail=20", timeout=30)
+        code, stdout, _ = self._compose("logs --tail=20", timeout=30)
         
         if stdout:
             for line in stdout.split('\n')[-15:]:
@@ -215,9 +260,11 @@ class EnvironmentManager:
         """Остановить docker-compose."""
         print("⏳ Остановка Docker Compose...")
         
-        code, _, _ = self._run_command("docker compose down", timeout=60)
-        if code != 0:
-            self._run_command("docker-compose down", timeout=60)
+        # fast: данные в tmpfs, анонимные тома не нужны - чистый стек за секунды
+        if self.stack_profile == "fast":
+            self._compose("down --volumes --timeout 2", timeout=60)
+        else:
+            self._compose("down", timeout=60)
         
         print("✓ Docker Compose остановлен")
     
@@ -264,17 +311,15 @@ class EnvironmentManager:
                 "password": os.getenv("ADMIN_PASSWORD", "admin123")
             }
         
-        success = True
-        
-        # Создаём обычного пользователя
-        if not self.create_user(test_user["username"], test_user["password"]):
-            success = False
+        # Пользователи независимы - создаём параллельно
+        users = [test_user, admin_user]
+        with ThreadPoolExecutor(max_workers=len(users)) as executor:
+            results = list(executor.map(
+                lambda user: self.create_user(user["username"], user["password"]),
+                users
+            ))
         
-        # Создаём админа
-        if not self.create_user(admin_user["username"], admin_user["password"]):
-            success = False
-        
-        return success
+        return all(results)
     
     def setup(
         self,
@@ -308,10 +353,9 @@ class EnvironmentManager:
                 print("   Попробуйте запустить вручную: docker compose up -d")
                 success = False
         
-        # Создаём пользователей (только если бэкенд работает)
-        if create_users and self.is_backend_running():
-            # Даём бэкенду время инициализироваться
-            time.sleep(2)
+        # Создаём пользователей (только если бэкенд работает).
+        # /health отвечает только после подключения к MongoDB - отдельная пауза не нужна
+        if create_users and self.is_backend_ready():
             if not self.ensure_test_users(test_user, admin_user):
                 print("⚠ Некоторые пользователи не были созданы")
         
@@ -330,6 +374,7 @@ class EnvironmentManager:
         """Остановить запущенные нами сервисы."""
         if self._compose_started_by_us:
             self.stop_compose()
+            self._compose_started_by_us = False
 
 
 # Глобальный экземпляр
@@ -346,7 +391,8 @@ def get_environment_manager(
     if _environment_manager is None:
         _environment_manager = EnvironmentManager(
             base_url=base_url or os.getenv("BASE_URL", "http://localhost:8080"),
-            api_url=api_url or os.getenv("API_URL", "http://localhost:3000")
+            api_url=api_url or os.getenv("API_URL", "http://localhost:3000"),
+            stack_profile=os.getenv("STACK_PROFILE", DEFAULT_STACK_PROFILE)
         )
     
     return _environment_manager
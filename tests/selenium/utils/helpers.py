@@ -6,50 +6,22 @@ from functools import wraps
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.common.exceptions import StaleElementReferenceException
+from utils.network_tracker import wait_for_network_idle
 
 
-def wait_for_ajax(driver: WebDriver, timeout: int = 30) -> bool:
+def wait_for_ajax(driver: WebDriver, timeout: int = 30, quiet_ms: int = 300) -> bool:
     """
-    Ожидание завершения всех AJAX запросов.
+    Ожидание завершения всех AJAX запросов (fetch/XHR из axios и WebSocket-подключений).
     
     Args:
         driver: WebDriver instance
         timeout: максимальное время ожидания в секундах
+        quiet_ms: сколько миллисекунд сеть должна простаивать
         
     Returns:
         True если все запросы завершены, False при таймауте
     """
-    start_time = time.time()
-    
-    while time.time() - start_time < timeout:
-        # Проверяем jQuery (если используется)
-        try:
-            jquery_active = driver.execute_script(
-                "return typeof jQuery !== 'undefined' && jQuery.active === 0"
-            )
-            if jquery_active:
-                return True
-        except:
-            pass
-        
-        # Проверяем XMLHttpRequest
-        try:
-            xhr_complete = driver.execute_script(
-                """
-                return document.readyState === 'complete' &&
-                       (typeof window.XMLHttpRequest === 'undefined' ||
-                        new window.XMLHttpRequest().readyState === 0 ||
-                        new window.XMLHttpRequest().readyState === 4);
-                """
-            )
-            if xhr_complete:
-                return True
-        except:
-            pass
-        
-        time.sleep(0.5)
-    
-    return False
+    return wait_for_network_idle(driver, quiet_ms=quiet_ms, timeout=timeout)
 
 
 def scroll_into_view(driver: WebDriver, element: WebElement) -> None:
@@ -60,11 +32,11 @@ def scroll_into_view(driver: WebDriver, element: WebElement) -> None:
         driver: WebDriver instance
         element: элемент для прокрутки
     """
+    # Без плавной прокрутки элемент на месте сразу, ждать анимацию не нужно
     driver.execute_script(
-        "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});",
+        "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});",
         element
     )
-    time.sleep(0.5)  # Даём время на плавную прокрутку
 
 
 def retry_on_stale(max_retries: int = 3, delay: float = 0.5):
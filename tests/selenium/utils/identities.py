@@ -0,0 +1,204 @@
+"""
+Пул изолированных тестовых пользователей для параллельного запуска.
+
+Все воркеры xdist раньше работали под одним testuser: ставки параллельных
+тестов конфликтовали по индексу "одна активная ставка пользователя на
+аукцион" и по блокировкам баланса. Здесь у каждого воркера свои
+пользователи (e2e_<worker>_<n>), созданные через /api/register и
+пополненные через /api/admin/users/:id/balance.
+
+Пользователи переживают запуск: логины, пароли и id хранятся в файловом
+кэше воркера (отдельно для каждого API), при следующем запуске создаются
+только недостающие.
+"""
+import os
+import json
+import time
+import secrets
+import logging
+import threading
+import requests
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+from utils.cache import CACHE_DIR, write_json_atomic
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(os.getenv("IDENTITY_CACHE_DIR", CACHE_DIR))
+
+# Баланс, который выставляется пользователю при каждой выдаче
+DEFAULT_FUNDING = {
+    "TON": os.getenv("IDENTITY_BALANCE_TON", "1000"),
+    "USDT": os.getenv("IDENTITY_BALANCE_USDT", "1000"),
+}
+
+
+class IdentityPool:
+    """
+    Пользователи одного воркера.
+
+    Выдача - по кругу, начиная с давно не использованного, так что соседние
+    тесты воркера не попадают на пользователя с только что сделанной ставкой.
+
+    Пример:
+        pool = IdentityPool(api_url, admin_session_token, worker_id="gw0")
+        with pool.lease() as user:
+            session_auth.login(driver, base_url, user)
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        admin_token: str,
+        worker_id: str = "main",
+        size: int = 3,
+        funding: Optional[Dict[str, str]] = None,
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+        timeout: int = 10
+    ):
+        self.api_url = api_url.rstrip("/")
+        self.worker_id = worker_id
+        self.size = size
+        self.funding = DEFAULT_FUNDING if funding is None else funding
+        self.cache_file = Path(cache_dir) / f"identities-{worker_id}.json"
+        self.timeout = timeout
+        self._session = requests.Session()
+        self._session.headers["Authorization"] = f"Bearer {admin_token}"
+        self._identities: List[dict] = []
+        self._last_used: Dict[str, float] = {}
+        self._leased: set = set()
+        self._lock = threading.Lock()
+
+    # Файловый кэш: {api_url: {username: {"username", "password", "id"}}}
+    def _read_cache(self) -> dict:
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data.get(self.api_url, {})
+
+    def _write_cache(self, identities: Dict[str, dict]) -> None:
+        """Сохранить пользователей этого API, не трогая записи других API."""
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        data[self.api_url] = identities
+        try:
+            write_json_atomic(self.cache_file, data)
+        except OSError as e:
+            logger.warning("Не удалось сохранить кэш пользователей: %s", e)
+
+    def _login(self, identity: dict) -> Optional[dict]:
+        """Проверить пользователя из кэша: вернуть данные /api/login или None."""
+        try:
+            response = requests.post(
+                f"{self.api_url}/api/login",
+                json={"username": identity["username"], "password": identity["password"]},
+                timeout=self.timeout
+            )
+        except requests.exceptions.RequestException:
+            return None
+        return response.json().get("user") if response.status_code == 200 else None
+
+    def _register(self, base_name: str) -> Optional[dict]:
+        """
+        Создать пользователя. Если имя занято (кэш потерян, пароль неизвестен),
+        пробуем имя с суффиксом.
+        """
+        password = secrets.token_urlsafe(12)
+        for attempt in range(5):
+            username = base_name if attempt == 0 else f"{base_name}_{secrets.token_hex(2)}"
+            try:
+                response = requests.post(
+                    f"{self.api_url}/api/register",
+                    json={"username": username, "password": password},
+                    timeout=self.timeout
+                )
+            except requests.exceptions.RequestException as e:
+                logger.warning("Не удалось создать '%s': %s", username, e)
+                return None
+            if response.status_code == 200:
+                user = response.json()["user"]
+                return {"username": username, "password": password, "id": user["id"]}
+            if "already taken" not in response.text:
+                logger.warning("Не удалось создать '%s': %s", username, response.text[:100])
+                return None
+        return None
+
+    def provision(self) -> List[dict]:
+        """Создать недостающих пользователей воркера (идемпотентно)."""
+        with self._lock:
+            if self._identities:
+                return self._identities
+
+            cached = self._read_cache()
+            identities: Dict[str, dict] = {}
+            for slot in range(self.size):
+                base_name = f"e2e_{self.worker_id}_{slot}"
+                identity = next(
+                    (i for i in cached.values() if i.get("slot") == slot),
+                    None
+                )
+                if identity is not None and self._login(identity) is None:
+                    identity = None
+                if identity is None:
+                    identity = self._register(base_name)
+                    if identity is None:
+                        continue
+                    identity["slot"] = slot
+                identities[identity["username"]] = identity
+
+            self._write_cache(identities)
+            self._identities = list(identities.values())
+            logger.info("Пул пользователей %s: %d", self.worker_id, len(self._identities))
+            return self._identities
+
+    def fund(self, identity: dict) -> bool:
+        """Выставить пользователю баланс пула (перезаписывает total)."""
+        ok = True
+        for currency, amount in self.funding.items():
+            try:
+                response = self._session.post(
+                    f"{self.api_url}/api/admin/users/{identity['id']}/balance",
+                    json={"currency": currency, "amount": amount},
+                    timeout=self.timeout
+                )
+                ok = ok and response.status_code == 200
+            except requests.exceptions.RequestException as e:
+                logger.warning("Не удалось пополнить '%s': %s", identity["username"], e)
+                ok = False
+        return ok
+
+    def acquire(self) -> Optional[dict]:
+        """
+        Выдать свободного пользователя (давно не использованного) с балансом пула.
+
+        Returns:
+            {"username", "password", "id"} или None, если пул пуст
+        """
+        identities = self.provision()
+        with self._lock:
+            free = [i for i in identities if i["username"] not in self._leased]
+            if not free:
+                return None
+            identity = min(free, key=lambda i: self._last_used.get(i["username"], 0.0))
+            self._leased.add(identity["username"])
+        self.fund(identity)
+        return {key: identity[key] for key in ("username", "password", "id")}
+
+    def release(self, identity: dict) -> None:
+        with self._lock:
+            self._leased.discard(identity["username"])
+            self._last_used[identity["username"]] = time.monotonic()
+
+    @contextmanager
+    def lease(self):
+        identity = self.acquire()
+        try:
+            yield identity
+        finally:
+            if identity is not None:
+                self.release(identity)
@@ -0,0 +1,189 @@
+"""
+Изолированные стеки docker compose: свой стек на каждый воркер xdist.
+
+Общий стек - узкое место тяжёлых параллельных запусков (один бэкенд,
+одна очередь ставок) и источник взаимного влияния тестов. Здесь каждый
+стек - отдельный compose-проект (auction-e2e-<n>) со своими контейнерами,
+сетью, свободными портами фронтенда и бэкенда и своей базой MongoDB.
+
+Стек описывается сгенерированным override поверх docker-compose.yml:
+имена контейнеров и проброс портов заменяются (`!override` требует
+Docker Compose 2.24.4+), образы общие - собираются один раз на все стеки.
+
+Пример:
+    stacks = IsolatedStacks(project_root, count=4)
+    if stacks.start():
+        stacks.stacks[0].base_url   # http://localhost:49213
+    ...
+    stacks.stop()
+"""
+import socket
+from pathlib import Path
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+from utils.cache import CACHE_DIR
+from utils.environment import EnvironmentManager
+from utils.stack_profile import DEFAULT_STACK_PROFILE
+
+
+PROJECT_PREFIX = "auction-e2e"
+
+# Общие образы для всех изолированных стеков
+IMAGE_PREFIX = "auction-e2e"
+
+OVERRIDE_TEMPLATE = """\
+# Сгенерировано utils/isolated_stacks.py для {project}, не редактировать
+services:
+  frontend:
+    image: {image_prefix}-frontend:latest
+    container_name: {project}-frontend
+    ports: !override
+      - "{frontend_port}:8080"
+
+  backend:
+    image: {image_prefix}-backend:latest
+    container_name: {project}-backend
+    ports: !override
+      - "{backend_port}:3000"
+    environment:
+      - MONGO_URI=mongodb://mongo:27017/{database}?replicaSet=rs0
+      - FRONTEND_URL={base_url}
+
+  mongo:
+    container_name: {project}-mongo
+
+  redis:
+    container_name: {project}-redis
+"""
+
+
+def find_free_ports(count: int) -> List[int]:
+    """
+    Свободные TCP-порты: все сокеты открываются одновременно, поэтому
+    порты различаются. Между закрытием и запуском docker порт может занять
+    другой процесс - тогда `up` упадёт с ошибкой bind.
+    """
+    sockets = []
+    try:
+        for _ in range(count):
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.bind(("127.0.0.1", 0))
+            sockets.append(sock)
+        return [sock.getsockname()[1] for sock in sockets]
+    finally:
+        for sock in sockets:
+            sock.close()
+
+
+@dataclass
+class StackInstance:
+    """Один изолированный стек."""
+
+    index: int
+    project: str
+    frontend_port: int
+    backend_port: int
+    override_file: Path
+
+    @property
+    def base_url(self) -> str:
+        return f"http://localhost:{self.frontend_port}"
+
+    @property
+    def api_url(self) -> str:
+        return f"http://localhost:{self.backend_port}"
+
+    @property
+    def database(self) -> str:
+        return f"auction_{self.index}"
+
+
+class IsolatedStacks:
+    """N изолированных стеков: общая сборка образов, параллельный запуск."""
+
+    def __init__(
+        self,
+        project_root: str,
+        count: int,
+        stack_profile: str = DEFAULT_STACK_PROFILE,
+        override_dir: Path = CACHE_DIR
+    ):
+        self.project_root = project_root
+        self.count = count
+        self.stack_profile = stack_profile
+        self.override_dir = Path(override_dir)
+        self.stacks: List[StackInstance] = []
+        self.managers = []
+
+    def _create_stack(self, index: int, ports: List[int]):
+        project = f"{PROJECT_PREFIX}-{index}"
+        stack = StackInstance(
+            index=index,
+            project=project,
+            frontend_port=ports[0],
+            backend_port=ports[1],
+            override_file=self.override_dir / f"compose.{project}.yml"
+        )
+        stack.override_file.parent.mkdir(parents=True, exist_ok=True)
+        stack.override_file.write_text(OVERRIDE_TEMPLATE.format(
+            project=project,
+            image_prefix=IMAGE_PREFIX,
+            frontend_port=stack.frontend_port,
+            backend_port=stack.backend_port,
+            database=stack.database,
+            base_url=stack.base_url,
+        ), encoding="utf-8")
+        manager = EnvironmentManager(
+            base_url=stack.base_url,
+            api_url=stack.api_url,
+            project_root=self.project_root,
+            stack_profile=self.stack_profile,
+            project_name=project,
+            override_files=[str(stack.override_file)],
+            mongo_container=f"{project}-mongo",
+            redis_container=f"{project}-redis"
+        )
+        return stack, manager
+
+    def start(self, create_users: bool = True) -> bool:
+        """
+        Собрать образы (один раз) и запустить все стеки параллельно.
+
+        Returns:
+            True если все стеки готовы
+        """
+        ports = find_free_ports(2 * self.count)
+        for index in range(self.count):
+            stack, manager = self._create_stack(index, ports[2 * index:2 * index + 2])
+            self.stacks.append(stack)
+            self.managers.append(manager)
+
+        print(f"⏳ Изолированные стеки: {self.count}")
+        if not self.managers[0].build_images(cache_namespace=IMAGE_PREFIX):
+            return False
+
+        def start_one(manager) -> bool:
+            if not manager.start_compose(build=False):
+                return False
+            return not create_users or manager.ensure_test_users()
+
+        with ThreadPoolExecutor(max_workers=self.count) as executor:
+            results = list(executor.map(start_one, self.managers))
+
+        for stack, ok in zip(self.stacks, results):
+            mark = "✓" if ok else "✗"
+            print(f"   {mark} {stack.project}: {stack.base_url} (API {stack.api_url})")
+        return all(results)
+
+    def stack_for(self, worker_id: Optional[str]) -> Optional[StackInstance]:
+        """Стек воркера: gw0 -> 0, gw1 -> 1, ... (перезапущенный воркер - по модулю)."""
+        if not self.stacks:
+            return None
+        index = int(worker_id[2:]) if worker_id and worker_id[2:].isdigit() else 0
+        return self.stacks[index % len(self.stacks)]
+
+    def stop(self) -> None:
+        """Остановить стеки, запущенные нами."""
+        with ThreadPoolExecutor(max_workers=max(1, len(self.managers))) as executor:
+            list(executor.map(lambda manager: manager.cleanup(), self.managers))
@@ -0,0 +1,180 @@
+"""
+Отслеживание незавершённых сетевых операций страницы.
+
+Трекер оборачивает fetch, XMLHttpRequest и WebSocket до запуска скриптов
+приложения: в Chromium через CDP Page.addScriptToEvaluateOnNewDocument
+(действует на каждый новый документ), в остальных браузерах - внедрением
+в текущий документ после загрузки (запросы, начатые до этого, не видны).
+
+window.__auctionNet:
+    pending       - число незавершённых fetch/XHR и подключающихся WebSocket
+    byType        - то же по типам: {fetch, xhr, ws}
+    lastActivity  - performance.now() последнего начала/завершения операции
+    whenIdle(quietMs, timeoutMs, cb) - вызвать cb(true), когда pending == 0
+                    в течение quietMs, или cb(false) по таймауту
+"""
+import time
+from typing import Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import (
+    JavascriptException,
+    TimeoutException,
+    UnexpectedAlertPresentException,
+    WebDriverException
+)
+
+
+TRACKER_JS = """
+(function () {
+    if (window.__auctionNet) return;
+    const net = window.__auctionNet = {
+        pending: 0,
+        byType: { fetch: 0, xhr: 0, ws: 0 },
+        lastActivity: performance.now(),
+        listeners: new Set()
+    };
+    const notify = () => net.listeners.forEach(fn => fn());
+    const start = (type) => {
+        net.pending++;
+        net.byType[type]++;
+        net.lastActivity = performance.now();
+        notify();
+    };
+    const end = (type) => {
+        net.pending = Math.max(0, net.pending - 1);
+        net.byType[type] = Math.max(0, net.byType[type] - 1);
+        net.lastActivity = performance.now();
+        notify();
+    };
+
+    if (window.fetch) {
+        const origFetch = window.fetch;
+        window.fetch = function () {
+            start('fetch');
+            return origFetch.apply(this, arguments).finally(() => end('fetch'));
+        };
+    }
+
+    const origSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        start('xhr');
+        this.addEventListener('loadend', () => end('xhr'), { once: true });
+        return origSend.apply(this, arguments);
+    };
+
+    // WebSocket считается незавершённым, пока идёт подключение
+    if (window.WebSocket) {
+        const OrigWebSocket = window.WebSocket;
+        const TrackedWebSocket = function (url, protocols) {
+            const ws = protocols === undefined
+                ? new OrigWebSocket(url)
+                : new OrigWebSocket(url, protocols);
+            start('ws');
+            let settled = false;
+            const settle = () => { if (!settled) { settled = true; end('ws'); } };
+            ws.addEventListener('open', settle);
+            ws.addEventListener('error', settle);
+            ws.addEventListener('close', settle);
+            return ws;
+        };
+        TrackedWebSocket.prototype = OrigWebSocket.prototype;
+        ['CONNECTING', 'OPEN', 'CLOSING', 'CLOSED'].forEach(k => { TrackedWebSocket[k] = OrigWebSocket[k]; });
+        window.WebSocket = TrackedWebSocket;
+    }
+
+    net.whenIdle = function (quietMs, timeoutMs, cb) {
+        let quietTimer = null;
+        let finished = false;
+        const finish = (result) => {
+            if (finished) return;
+            finished = true;
+            clearTimeout(quietTimer);
+            clearTimeout(hardTimer);
+            net.listeners.delete(check);
+            cb(result);
+        };
+        const check = () => {
+            clearTimeout(quietTimer);
+            if (net.pending > 0) return;
+            const rest = quietMs - (performance.now() - net.lastActivity);
+            if (rest <= 0) finish(true);
+            else quietTimer = setTimeout(check, rest);
+        };
+        const hardTimer = setTimeout(() => finish(false), timeoutMs);
+        net.listeners.add(check);
+        check();
+    };
+})();
+"""
+
+WHEN_IDLE_JS = """
+const done = arguments[arguments.length - 1];
+if (!window.__auctionNet) { done(null); return; }
+window.__auctionNet.whenIdle(arguments[0], arguments[1], done);
+"""
+
+PENDING_JS = """
+const net = window.__auctionNet;
+return net ? Object.assign({ total: net.pending }, net.byType) : null;
+"""
+
+# Атрибут драйвера: скрипт уже зарегистрирован через CDP
+_CDP_MARK = "_network_tracker_cdp"
+
+
+def install_network_tracker(driver: WebDriver) -> None:
+    """
+    Установить трекер: для всех будущих документов (CDP) и для текущего.
+    Повторные вызовы безопасны.
+    """
+    if hasattr(driver, "execute_cdp_cmd") and not getattr(driver, _CDP_MARK, False):
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": TRACKER_JS})
+            setattr(driver, _CDP_MARK, True)
+        except WebDriverException:
+            pass
+    try:
+        driver.execute_script(TRACKER_JS)
+    except WebDriverException:
+        pass
+
+
+def get_pending_requests(driver: WebDriver) -> Optional[dict]:
+    """Незавершённые операции: {"total", "fetch", "xhr", "ws"} или None без трекера."""
+    try:
+        return driver.execute_script(PENDING_JS)
+    except WebDriverException:
+        return None
+
+
+def wait_for_network_idle(driver: WebDriver, quiet_ms: int = 300, timeout: float = 10) -> bool:
+    """
+    Дождаться, пока на странице нет незавершённых fetch/XHR/WebSocket-подключений
+    в течение quiet_ms. Ожидание идёт внутри страницы по событиям трекера,
+    без опроса из Python, и заканчивается, как только сеть успокоилась.
+
+    Открытый alert считается концом ожидания: страница уже отреагировала.
+
+    Returns:
+        True если сеть простаивает (или открыт alert), False по таймауту
+    """
+    deadline = time.monotonic() + timeout
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        try:
+            result = driver.execute_async_script(WHEN_IDLE_JS, quiet_ms, int(remaining * 1000))
+        except UnexpectedAlertPresentException:
+            return True
+        except (JavascriptException, TimeoutException):
+            # Документ сменился во время ожидания - ждём на новом
+            result = None
+
+        if result is not None:
+            return bool(result)
+
+        # Трекера нет (не Chromium или документ только что загрузился)
+        install_network_tracker(driver)
+        time.sleep(0.05)
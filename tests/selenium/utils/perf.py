@@ -0,0 +1,260 @@
+"""
+Сбор метрик производительности страниц фронтенда.
+
+Для каждой открытой страницы (маршрут + Page Object) записывается:
+- Navigation Timing (только если с прошлого замера был полный переход)
+- Paint: first-paint, first-contentful-paint
+- LCP: последний largest-contentful-paint документа
+- long tasks (> 50 мс) с момента прошлого замера
+- CDP Performance.getMetrics (Chromium): JS heap, число layout/recalc style,
+  время скриптов; для накопительных счётчиков - ещё и прирост с прошлого замера
+
+Наблюдатели LCP и long tasks регистрируются через CDP до запуска скриптов
+приложения (как трекер сети), иначе ранние long tasks не видны.
+
+Результаты одного теста пишутся в JSON: artifacts/perf/<test>.json.
+"""
+import re
+import json
+import time
+import logging
+from pathlib import Path
+from typing import List, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import WebDriverException
+
+
+logger = logging.getLogger(__name__)
+
+# Версия формата артефакта
+SCHEMA_VERSION = 1
+
+OBSERVER_JS = """
+(function () {
+    if (window.__auctionPerf || !window.PerformanceObserver) return;
+    const perf = window.__auctionPerf = { lcp: null, longTasks: [] };
+    const observe = (type, cb) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(cb))
+                .observe({ type: type, buffered: true });
+        } catch (e) { /* тип не поддерживается браузером */ }
+    };
+    observe('largest-contentful-paint', e => {
+        perf.lcp = { startTime: e.startTime, size: e.size, element: e.element ? e.element.tagName : null };
+    });
+    observe('longtask', e => {
+        // Ограничиваем буфер, чтобы долгий тест не раздувал память страницы
+        if (perf.longTasks.length < 500) perf.longTasks.push({ startTime: e.startTime, duration: e.duration });
+    });
+})();
+"""
+
+# arguments[0] - performance.now() прошлого замера в этом документе (или 0)
+COLLECT_JS = """
+const since = arguments[0];
+const round = v => Math.round(v * 10) / 10;
+const nav = performance.getEntriesByType('navigation')[0];
+const paint = {};
+performance.getEntriesByType('paint').forEach(e => { paint[e.name] = round(e.startTime); });
+const perf = window.__auctionPerf || null;
+const tasks = perf ? perf.longTasks.filter(t => t.startTime >= since) : [];
+return {
+    url: location.href,
+    timeOrigin: performance.timeOrigin,
+    now: performance.now(),
+    navigation: nav ? {
+        type: nav.type,
+        redirect: round(nav.redirectEnd - nav.redirectStart),
+        dns: round(nav.domainLookupEnd - nav.domainLookupStart),
+        connect: round(nav.connectEnd - nav.connectStart),
+        ttfb: round(nav.responseStart - nav.requestStart),
+        response: round(nav.responseEnd - nav.responseStart),
+        domInteractive: round(nav.domInteractive),
+        domContentLoaded: round(nav.domContentLoadedEventEnd),
+        load: round(nav.loadEventEnd),
+        duration: round(nav.duration),
+        transferSize: nav.transferSize,
+        decodedBodySize: nav.decodedBodySize
+    } : null,
+    paint: paint,
+    lcp: perf && perf.lcp ? { startTime: round(perf.lcp.startTime), size: perf.lcp.size, element: perf.lcp.element } : null,
+    longTasks: {
+        observed: !!perf,
+        count: tasks.length,
+        total: round(tasks.reduce((s, t) => s + t.duration, 0)),
+        max: round(tasks.reduce((m, t) => Math.max(m, t.duration), 0))
+    }
+};
+"""
+
+# Метрики CDP Performance.getMetrics, которые попадают в артефакт
+CDP_METRICS = (
+    "JSHeapUsedSize",
+    "JSHeapTotalSize",
+    "Nodes",
+    "JSEventListeners",
+    "Documents",
+    "LayoutCount",
+    "RecalcStyleCount",
+    "LayoutDuration",
+    "RecalcStyleDuration",
+    "ScriptDuration",
+    "TaskDuration",
+)
+
+# Накопительные за жизнь вкладки - для них считается прирост между замерами
+CDP_CUMULATIVE = {
+    "LayoutCount",
+    "RecalcStyleCount",
+    "LayoutDuration",
+    "RecalcStyleDuration",
+    "ScriptDuration",
+    "TaskDuration",
+}
+
+DEFAULT_ARTIFACTS_DIR = Path(__file__).resolve().parent.parent / "artifacts" / "perf"
+
+# Атрибуты драйвера
+_CDP_MARK = "_perf_observer_cdp"
+_RECORDER_ATTR = "_perf_recorder"
+
+
+def _safe_filename(name: str) -> str:
+    """Имя файла из nodeid теста."""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_")[:200] or "test"
+
+
+class PerfRecorder:
+    """
+    Замеры производительности в рамках одного теста.
+
+    Пример:
+        recorder = PerfRecorder(driver, request.node.nodeid)
+        recorder.install()
+        ...
+        recorder.capture(route="/auctions", page="AuctionsPage")
+        recorder.write()
+    """
+
+    def __init__(self, driver: WebDriver, test_id: str):
+        self.driver = driver
+        self.test_id = test_id
+        self.samples: List[dict] = []
+        self._cdp_enabled = False
+        self._last_cdp: dict = {}
+        # (timeOrigin, performance.now()) прошлого замера
+        self._last_mark: Optional[tuple] = None
+
+    def install(self) -> None:
+        """Зарегистрировать наблюдатели и включить домен CDP Performance."""
+        driver = self.driver
+        if hasattr(driver, "execute_cdp_cmd"):
+            if not getattr(driver, _CDP_MARK, False):
+                try:
+                    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": OBSERVER_JS})
+                    setattr(driver, _CDP_MARK, True)
+                except WebDriverException:
+                    pass
+            try:
+                driver.execute_cdp_cmd("Performance.enable", {"timeDomain": "timeTicks"})
+                self._cdp_enabled = True
+            except WebDriverException:
+                self._cdp_enabled = False
+        try:
+            driver.execute_script(OBSERVER_JS)
+        except WebDriverException:
+            pass
+        # Отсчёт приростов CDP - от момента начала теста
+        self._last_cdp = self._cdp_metrics() or {}
+
+    def _cdp_metrics(self) -> Optional[dict]:
+        if not self._cdp_enabled:
+            return None
+        try:
+            result = self.driver.execute_cdp_cmd("Performance.getMetrics", {})
+        except WebDriverException:
+            return None
+        metrics = {m["name"]: m["value"] for m in result.get("metrics", [])}
+        return {name: metrics[name] for name in CDP_METRICS if name in metrics}
+
+    def capture(self, route: Optional[str] = None, page: Optional[str] = None,
+                label: Optional[str] = None) -> Optional[dict]:
+        """
+        Снять замер текущей страницы. Вызывать, когда страница уже загрузилась.
+
+        Args:
+            route: маршрут фронтенда ("/auctions")
+            page: имя Page Object
+            label: произвольная метка действия
+
+        Returns:
+            Замер или None, если страница недоступна (alert, закрытый браузер)
+        """
+        since = 0
+        try:
+            if self._last_mark is not None:
+                # В том же документе учитываем только long tasks после прошлого замера
+                origin = self.driver.execute_script("return performance.timeOrigin;")
+                if origin == self._last_mark[0]:
+                    since = self._last_mark[1]
+            data = self.driver.execute_script(COLLECT_JS, since)
+        except WebDriverException as e:
+            logger.debug("Замер производительности пропущен: %s", e)
+            return None
+
+        # Переход внутри SPA: Navigation Timing относится к старому документу
+        soft = since > 0
+        self._last_mark = (data.pop("timeOrigin"), data.pop("now"))
+
+        sample = {
+            "route": route,
+            "page": page,
+            "label": label,
+            "timestamp": time.time(),
+            "soft_navigation": soft,
+            **data,
+        }
+        if soft:
+            sample["navigation"] = None
+
+        cdp = self._cdp_metrics()
+        if cdp is not None:
+            sample["cdp"] = cdp
+            sample["cdp_delta"] = {
+                name: round(cdp[name] - self._last_cdp.get(name, 0), 6)
+                for name in CDP_CUMULATIVE if name in cdp
+            }
+            self._last_cdp = cdp
+
+        self.samples.append(sample)
+        return sample
+
+    def to_dict(self) -> dict:
+        capabilities = getattr(self.driver, "capabilities", {}) or {}
+        return {
+            "schema": SCHEMA_VERSION,
+            "test": self.test_id,
+            "browser": capabilities.get("browserName"),
+            "browser_version": capabilities.get("browserVersion"),
+            "samples": self.samples,
+        }
+
+    def write(self, directory: Path = DEFAULT_ARTIFACTS_DIR) -> Optional[Path]:
+        """Записать артефакт теста. Без замеров файл не создаётся."""
+        if not self.samples:
+            return None
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{_safe_filename(self.test_id)}.json"
+        path.write_text(json.dumps(self.to_dict(), indent=2, ensure_ascii=False), encoding="utf-8")
+        return path
+
+
+def attach_perf_recorder(driver: WebDriver, recorder: Optional[PerfRecorder]) -> None:
+    """Привязать рекордер к драйверу (None - отвязать)."""
+    setattr(driver, _RECORDER_ATTR, recorder)
+
+
+def get_perf_recorder(driver: WebDriver) -> Optional[PerfRecorder]:
+    """Рекордер текущего теста или None, если замеры выключены."""
+    return getattr(driver, _RECORDER_ATTR, None)
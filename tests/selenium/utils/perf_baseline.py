@@ -0,0 +1,182 @@
+"""
+Базовые значения производительности и проверка регрессий.
+
+Файл базы (--perf-baseline) хранит для каждого маршрута/действия историю
+последних K значений каждой метрики; базовое значение - медиана истории.
+Замер считается регрессией, если метрика хуже базы больше чем на
+tolerance (и больше чем на MIN_DELTA_MS - иначе короткие метрики шумят).
+
+Формат файла:
+    {
+        "schema": 1,
+        "window": 5,
+        "entries": {
+            "route:/auctions [AuctionsPage]": {"load": [812.0, 790.5, ...], ...}
+        }
+    }
+"""
+import html
+import json
+import statistics
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from utils.cache import write_json_atomic
+
+
+SCHEMA_VERSION = 1
+DEFAULT_WINDOW = 5
+
+# Абсолютный допуск в мс: на метриках в десятки мс 15% - это шум
+MIN_DELTA_MS = 50.0
+
+
+def parse_tolerance(value: str) -> float:
+    """'15%' или '0.15' -> 0.15."""
+    value = str(value).strip()
+    try:
+        if value.endswith("%"):
+            return float(value[:-1]) / 100
+        return float(value)
+    except ValueError:
+        raise ValueError(f"Invalid perf tolerance: {value!r} (expected e.g. 15% or 0.15)")
+
+
+def sample_key(sample: dict) -> Optional[str]:
+    """Ключ замера: маршрут и Page Object, либо метка действия."""
+    if sample.get("label"):
+        return f"action:{sample['label']}"
+    if sample.get("route"):
+        page = f" [{sample['page']}]" if sample.get("page") else ""
+        return f"route:{sample['route']}{page}"
+    return None
+
+
+def sample_metrics(sample: dict) -> Dict[str, float]:
+    """Метрики замера, по которым ведётся база (все в мс)."""
+    metrics = {}
+    nav = sample.get("navigation") or {}
+    for name in ("ttfb", "domContentLoaded", "load"):
+        if nav.get(name):
+            metrics[name] = float(nav[name])
+    paint = sample.get("paint") or {}
+    if paint.get("first-contentful-paint"):
+        metrics["fcp"] = float(paint["first-contentful-paint"])
+    lcp = sample.get("lcp") or {}
+    # У мягкого перехода LCP относится к первой загрузке документа
+    if lcp.get("startTime") and not sample.get("soft_navigation"):
+        metrics["lcp"] = float(lcp["startTime"])
+    long_tasks = sample.get("longTasks") or {}
+    if long_tasks.get("observed"):
+        metrics["longTaskTotal"] = float(long_tasks.get("total", 0))
+    delta = sample.get("cdp_delta") or {}
+    if "ScriptDuration" in delta:
+        metrics["scriptDuration"] = round(delta["ScriptDuration"] * 1000, 1)
+    if "LayoutDuration" in delta:
+        metrics["layoutDuration"] = round(delta["LayoutDuration"] * 1000, 1)
+    return metrics
+
+
+class PerfBaseline:
+    """База значений метрик с медианой по последним window запускам."""
+
+    def __init__(self, path: Path, window: int = DEFAULT_WINDOW):
+        self.path = Path(path)
+        self.window = window
+        self.entries: Dict[str, Dict[str, List[float]]] = {}
+        self.load()
+
+    def load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("schema") == SCHEMA_VERSION:
+            self.entries = data.get("entries", {})
+
+    def save(self) -> None:
+        """Записать базу (ключи отсортированы - дифф в git читаемый)."""
+        data = {"schema": SCHEMA_VERSION, "window": self.window, "entries": self.entries}
+        write_json_atomic(self.path, data, sort_keys=True, ensure_ascii=False)
+
+    def median(self, key: str, metric: str) -> Optional[float]:
+        history = self.entries.get(key, {}).get(metric)
+        return statistics.median(history) if history else None
+
+    def compare(self, samples: Iterable[dict], tolerance: float) -> List[dict]:
+        """
+        Сравнить замеры теста с базой.
+
+        Returns:
+            Строки сравнения: {"key", "metric", "value", "baseline",
+            "change" (доля), "regression" (bool)}. Метрики без истории
+            в базе не сравниваются.
+        """
+        rows = []
+        for sample in samples:
+            key = sample_key(sample)
+            if key is None:
+                continue
+            for metric, value in sample_metrics(sample).items():
+                baseline = self.median(key, metric)
+                if baseline is None:
+                    continue
+                change = (value - baseline) / baseline if baseline > 0 else 0.0
+                rows.append({
+                    "key": key,
+                    "metric": metric,
+                    "value": value,
+                    "baseline": baseline,
+                    "change": change,
+                    "regression": value > baseline * (1 + tolerance) and value - baseline > MIN_DELTA_MS,
+                })
+        return rows
+
+    def record(self, key: str, metrics: Dict[str, float]) -> None:
+        """Добавить значения запуска в историю (хранятся последние window)."""
+        entry = self.entries.setdefault(key, {})
+        for metric, value in metrics.items():
+            history = entry.setdefault(metric, [])
+            history.append(value)
+            del history[:-self.window]
+
+
+def collect_values(samples: Iterable[dict]) -> Dict[str, Dict[str, float]]:
+    """
+    Значения метрик теста по ключам для записи в базу.
+    Если ключ замерен в тесте несколько раз - берётся медиана.
+    """
+    grouped: Dict[str, Dict[str, List[float]]] = {}
+    for sample in samples:
+        key = sample_key(sample)
+        if key is None:
+            continue
+        for metric, value in sample_metrics(sample).items():
+            grouped.setdefault(key, {}).setdefault(metric, []).append(value)
+    return {
+        key: {metric: statistics.median(values) for metric, values in metrics.items()}
+        for key, metrics in grouped.items()
+    }
+
+
+def format_rows_html(rows: List[dict]) -> str:
+    """Таблица сравнения для pytest-html."""
+    lines = [
+        "<table><tr><th>Маршрут/действие</th><th>Метрика</th>"
+        "<th>Значение, мс</th><th>База, мс</th><th>Изменение</th></tr>"
+    ]
+    for row in rows:
+        style = ' style="color:#c00;font-weight:bold"' if row["regression"] else ""
+        lines.append(
+            f"<tr{style}><td>{html.escape(row['key'])}</td><td>{row['metric']}</td>"
+            f"<td>{row['value']:.1f}</td><td>{row['baseline']:.1f}</td>"
+            f"<td>{row['change']:+.0%}</td></tr>"
+        )
+    lines.append("</table>")
+    return "".join(lines)
+
+
+def format_regression(row: dict) -> str:
+    return (
+        f"{row['key']} {row['metric']}: {row['value']:.1f} мс "
+        f"(база {row['baseline']:.1f} мс, {row['change']:+.0%})"
+    )
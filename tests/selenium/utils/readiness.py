@@ -0,0 +1,180 @@
+"""
+Проверка готовности стека: бэкенд, фронтенд, MongoDB и Redis опрашиваются
+одновременно, каждый со своим нарастающим интервалом.
+
+Интервал начинается с 50 мс и растёт до 1 с: быстрый компонент отмечается
+готовым через десятки миллисекунд, медленный (холодный старт mongod) не
+заваливает docker частыми вызовами. Для каждого компонента фиксируется
+время до готовности.
+
+Пример:
+    checker = ReadinessChecker.for_stack(api_url, base_url)
+    report = checker.wait(timeout=180)
+    for line in report.format_lines():
+        print(line)
+"""
+import time
+import subprocess
+import threading
+import requests
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+
+INITIAL_DELAY = 0.05
+MAX_DELAY = 1.0
+BACKOFF_FACTOR = 1.5
+
+# Таймаут одного HTTP-опроса: пока сервис не поднят, ответ либо есть сразу,
+# либо соединение отклоняется
+HTTP_PROBE_TIMEOUT = 1.0
+
+DEFAULT_MONGO_CONTAINER = "auction-mongo"
+DEFAULT_REDIS_CONTAINER = "auction-redis"
+
+
+def http_probe(url: str, timeout: float = HTTP_PROBE_TIMEOUT) -> Callable[[], bool]:
+    """Готов, если url отвечает 200 (порт docker-proxy открыт и до старта сервиса)."""
+    def probe() -> bool:
+        try:
+            return requests.get(url, timeout=timeout).status_code == 200
+        except requests.exceptions.RequestException:
+            return False
+    return probe
+
+
+def docker_exec_probe(container: str, command: List[str], expected: str, timeout: float = 10) -> Callable[[], bool]:
+    """Готов, если команда в контейнере выводит expected."""
+    def probe() -> bool:
+        try:
+            result = subprocess.run(
+                ["docker", "exec", container, *command],
+                capture_output=True, text=True, timeout=timeout,
+                encoding="utf-8", errors="replace"
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return result.returncode == 0 and result.stdout.strip() == expected
+    return probe
+
+
+def mongo_probe(container: str = DEFAULT_MONGO_CONTAINER) -> Callable[[], bool]:
+    """Реплика-сет инициализирован и есть PRIMARY (без него не работают транзакции бэкенда)."""
+    return docker_exec_probe(
+        container,
+        ["mongosh", "--quiet", "--eval", "rs.status().members.some(m => m.stateStr === 'PRIMARY')"],
+        "true"
+    )
+
+
+def redis_probe(container: str = DEFAULT_REDIS_CONTAINER) -> Callable[[], bool]:
+    return docker_exec_probe(container, ["redis-cli", "ping"], "PONG")
+
+
+@dataclass
+class Component:
+    """Компонент стека и функция проверки его готовности."""
+
+    name: str
+    probe: Callable[[], bool]
+
+
+@dataclass
+class ReadinessReport:
+    """Время до готовности каждого компонента (None - не дождались)."""
+
+    ready: Dict[str, Optional[float]]
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        return all(seconds is not None for seconds in self.ready.values())
+
+    @property
+    def pending(self) -> List[str]:
+        return [name for name, seconds in self.ready.items() if seconds is None]
+
+    def format_lines(self) -> List[str]:
+        lines = []
+        for name, seconds in self.ready.items():
+            if seconds is None:
+                lines.append(f"✗ {name}: не готов за {self.elapsed:.1f}s")
+            else:
+                lines.append(f"✓ {name}: готов за {seconds:.2f}s")
+        return lines
+
+
+class ReadinessChecker:
+    """Параллельный опрос компонентов с экспоненциальным интервалом."""
+
+    def __init__(
+        self,
+        components: List[Component],
+        initial_delay: float = INITIAL_DELAY,
+        max_delay: float = MAX_DELAY,
+        factor: float = BACKOFF_FACTOR,
+        on_ready: Optional[Callable[[str, float], None]] = None
+    ):
+        self.components = components
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self.on_ready = on_ready
+
+    @classmethod
+    def for_stack(
+        cls,
+        api_url: str,
+        base_url: str,
+        mongo_container: Optional[str] = DEFAULT_MONGO_CONTAINER,
+        redis_container: Optional[str] = DEFAULT_REDIS_CONTAINER,
+        **kwargs
+    ) -> "ReadinessChecker":
+        """
+        Компоненты docker-compose стека. Контейнер None - не проверять
+        (например, стек не локальный и docker exec недоступен).
+        """
+        components = [
+            Component("бэкенд", http_probe(f"{api_url.rstrip('/')}/health")),
+            Component("фронтенд", http_probe(base_url)),
+        ]
+        if mongo_container:
+            components.append(Component("MongoDB", mongo_probe(mongo_container)))
+        if redis_container:
+            components.append(Component("Redis", redis_probe(redis_container)))
+        return cls(components, **kwargs)
+
+    def _poll(self, component: Component, started: float, deadline: float,
+              ready: Dict[str, Optional[float]]) -> None:
+        delay = self.initial_delay
+        while True:
+            if component.probe():
+                seconds = time.monotonic() - started
+                ready[component.name] = seconds
+                if self.on_ready is not None:
+                    self.on_ready(component.name, seconds)
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(delay, remaining))
+            delay = min(delay * self.factor, self.max_delay)
+
+    def wait(self, timeout: float = 180) -> ReadinessReport:
+        """Ждать готовности всех компонентов, но не дольше timeout."""
+        started = time.monotonic()
+        deadline = started + timeout
+        ready: Dict[str, Optional[float]] = {c.name: None for c in self.components}
+        threads = [
+            threading.Thread(
+                target=self._poll, args=(component, started, deadline, ready),
+                name=f"readiness-{component.name}", daemon=True
+            )
+            for component in self.components
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            # Опрос может завершиться позже deadline на длительность одной пробы
+            thread.join(max(0.0, deadline - time.monotonic()) + 15)
+        return ReadinessReport(ready=dict(ready), elapsed=time.monotonic() - started)
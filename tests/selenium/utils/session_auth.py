@@ -0,0 +1,132 @@
+"""
+Авторизация в браузере через API-токен вместо UI логина.
+
+Токен получается один раз на пользователя в рамках процесса (воркера xdist)
+через /api/login и кладётся напрямую в localStorage в том виде, в котором его
+ожидает frontend/src/stores/auth.js (ключ 'token').
+"""
+import json
+import time
+import base64
+import logging
+import threading
+import requests
+from typing import Dict, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+logger = logging.getLogger(__name__)
+
+# Ключ localStorage, из которого auth store читает JWT при инициализации
+TOKEN_STORAGE_KEY = "token"
+
+
+def _decode_jwt_exp(token: str) -> Optional[float]:
+    """Достать exp из JWT без проверки подписи (нужно только для кэша)."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        data = json.loads(base64.urlsafe_b64decode(payload))
+        return float(data["exp"]) if "exp" in data else None
+    except (IndexError, ValueError, KeyError, TypeError):
+        return None
+
+
+class SessionAuth:
+    """
+    Кэш API-сессий пользователей.
+    Один экземпляр на процесс: повторные логины берут токен из памяти,
+    без bcrypt-проверки на бэкенде и без загрузки страницы входа.
+    """
+
+    def __init__(self, api_url: str, expiry_margin: int = 60, timeout: int = 10):
+        self.api_url = api_url.rstrip("/")
+        self.expiry_margin = expiry_margin
+        self.timeout = timeout
+        self._sessions: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def _is_fresh(self, session: dict) -> bool:
+        """Проверить, что токен не истекает в ближайшее время."""
+        exp = session.get("exp")
+        return exp is None or exp - time.time() > self.expiry_margin
+
+    def get_session(self, username: str, password: str) -> Optional[dict]:
+        """
+        Получить сессию пользователя (token + user) из кэша или через /api/login.
+
+        Returns:
+            {"token": ..., "user": {...}, "exp": ...} или None, если войти не удалось
+        """
+        with self._lock:
+            session = self._sessions.get(username)
+            if session is not None and self._is_fresh(session):
+                return session
+
+            try:
+                response = requests.post(
+                    f"{self.api_url}/api/login",
+                    json={"username": username, "password": password},
+                    timeout=self.timeout
+                )
+            except requests.exceptions.RequestException as e:
+                logger.warning("Не удалось получить токен для '%s': %s", username, e)
+                return None
+
+            if response.status_code != 200:
+                logger.warning(
+                    "Логин '%s' через API отклонён: %s %s",
+                    username, response.status_code, response.text[:100]
+                )
+                return None
+
+            data = response.json()
+            session = {
+                "token": data["token"],
+                "user": data.get("user", {}),
+                "exp": _decode_jwt_exp(data["token"]),
+            }
+            self._sessions[username] = session
+            return session
+
+    def invalidate(self, username: str) -> None:
+        """Сбросить закэшированную сессию пользователя."""
+        with self._lock:
+            self._sessions.pop(username, None)
+
+    def inject(self, driver: WebDriver, base_url: str, token: str, landing_path: str = "/auctions") -> None:
+        """
+        Положить токен в localStorage и открыть страницу уже авторизованным.
+
+        localStorage доступен только на origin приложения, поэтому при
+        необходимости сначала открываем base_url. Затем полная загрузка
+        landing_path, чтобы auth store проинициализировался с токеном.
+        """
+        base_url = base_url.rstrip("/")
+        if not driver.current_url.startswith(base_url):
+            driver.get(base_url)
+        driver.execute_script(
+            "window.localStorage.setItem(arguments[0], arguments[1]);",
+            TOKEN_STORAGE_KEY,
+            token
+        )
+        driver.get(f"{base_url}{landing_path}")
+
+    def login(self, driver: WebDriver, base_url: str, user: dict, landing_path: str = "/auctions") -> Optional[dict]:
+        """
+        Авторизовать браузер под пользователем без UI.
+
+        Args:
+            driver: WebDriver instance
+            base_url: URL фронтенда
+            user: {"username": ..., "password": ...}
+            landing_path: страница, которая откроется после инъекции токена
+
+        Returns:
+            данные пользователя из /api/login или None, если войти не удалось
+        """
+        session = self.get_session(user["username"], user["password"])
+        if session is None:
+            return None
+        self.inject(driver, base_url, session["token"], landing_path)
+        return session["user"]
@@ -0,0 +1,74 @@
+"""
+Профили тестового стека docker compose.
+
+    prod-like - docker-compose.yml как есть: MongoDB и Redis на диске, AOF
+    fast      - поверх docker-compose.yml генерируется override: данные
+                MongoDB и Redis в tmpfs, AOF и RDB-снимки Redis выключены,
+                health checks раз в секунду. После остановки контейнеров
+                данных не остаётся, следующий запуск начинается с чистого стека.
+
+Журнал MongoDB выключить нельзя: начиная с 6.1 mongod не поддерживает
+--nojournal, а реплика-сет (нужен для транзакций бэкенда) требует журнала.
+В fast-профиле журнал пишется в tmpfs, что снимает стоимость fsync.
+"""
+from pathlib import Path
+from typing import List, Optional
+from utils.cache import CACHE_DIR
+
+
+STACK_PROFILES = ("fast", "prod-like")
+DEFAULT_STACK_PROFILE = "prod-like"
+
+FAST_OVERRIDE = """\
+# Сгенерировано utils/stack_profile.py (профиль fast), не редактировать
+services:
+  mongo:
+    command: >-
+      mongod --replSet rs0 --bind_ip_all
+      --wiredTigerCacheSizeGB 0.25
+      --setParameter diagnosticDataCollectionEnabled=false
+    tmpfs:
+      - /data/db
+      - /data/configdb
+    healthcheck:
+      interval: 1s
+      timeout: 5s
+      retries: 60
+      start_period: 0s
+
+  redis:
+    command: redis-server --appendonly no --save "" --maxmemory 512mb --maxmemory-policy noeviction
+    tmpfs:
+      - /data
+    healthcheck:
+      interval: 1s
+      timeout: 2s
+      retries: 30
+"""
+
+
+def write_override(profile: str, directory: Path = CACHE_DIR) -> Optional[Path]:
+    """
+    Записать compose override профиля.
+
+    Returns:
+        Путь к override или None для prod-like (override не нужен)
+    """
+    if profile not in STACK_PROFILES:
+        raise ValueError(f"Unknown stack profile: {profile}")
+    if profile == "prod-like":
+        return None
+    path = Path(directory) / f"compose.{profile}.yml"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists() or path.read_text(encoding="utf-8") != FAST_OVERRIDE:
+        path.write_text(FAST_OVERRIDE, encoding="utf-8")
+    return path
+
+
+def compose_files(project_root: str, profile: str) -> List[str]:
+    """Файлы для `docker compose -f ...` в профиле."""
+    files = [str(Path(project_root) / "docker-compose.yml")]
+    override = write_override(profile)
+    if override is not None:
+        files.append(str(override))
+    return files
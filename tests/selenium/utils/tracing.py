@@ -0,0 +1,262 @@
+"""
+Трассировка действий теста: где тест тратит время.
+
+С --trace-actions каждый тест записывается как дерево вложенных интервалов:
+    test -> методы Page Object -> ожидания WebDriverWait / time.sleep
+         -> команды WebDriver (HTTP-запрос к драйверу) / запросы к API (requests)
+
+Результаты:
+- artifacts/traces/<test>.json - Chrome trace event format
+  (открывается в chrome://tracing или https://ui.perfetto.dev)
+- artifacts/traces/collapsed.txt - собственное время каждого стека по всем
+  тестам в формате collapsed stacks (flamegraph.pl, speedscope)
+
+Инструментирование ставится один раз на процесс и пишет интервалы только
+в потоке, где активен трассировщик теста; без активного трассировщика
+обёртки сразу вызывают исходную функцию.
+"""
+import os
+import re
+import json
+import time
+import threading
+import functools
+from pathlib import Path
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+
+DEFAULT_TRACES_DIR = Path(__file__).resolve().parent.parent / "artifacts" / "traces"
+
+# Атрибут обёрнутой функции / драйвера
+_TRACED = "__traced__"
+_DRIVER_MARK = "_action_tracing"
+
+_active: Optional["ActionTracer"] = None
+_installed = False
+
+# time.sleep до инструментирования
+_original_sleep = time.sleep
+
+
+def _now_us() -> float:
+    return time.perf_counter_ns() / 1000
+
+
+def _stack_name(name: str) -> str:
+    """Имя кадра для collapsed stacks: без ';' и переводов строк."""
+    return re.sub(r"[;\s]+", "_", name)
+
+
+class ActionTracer:
+    """Интервалы одного теста: события Chrome trace и собственное время стеков."""
+
+    def __init__(self, test_id: str):
+        self.test_id = test_id
+        self.events: List[dict] = []
+        self.self_time: Dict[Tuple[str, ...], float] = defaultdict(float)
+        self._thread = threading.get_ident()
+        # Кадры стека: [имя, начало, время вложенных интервалов]
+        self._stack: List[list] = []
+
+    def owns_thread(self) -> bool:
+        return threading.get_ident() == self._thread
+
+    def begin(self, name: str) -> None:
+        self._stack.append([name, _now_us(), 0.0])
+
+    def end(self, category: str, args: Optional[dict] = None) -> None:
+        name, start, children = self._stack.pop()
+        duration = _now_us() - start
+        path = tuple(frame[0] for frame in self._stack) + (name,)
+        self.self_time[path] += max(0.0, duration - children)
+        if self._stack:
+            self._stack[-1][2] += duration
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start,
+            "dur": duration,
+            "pid": os.getpid(),
+            "tid": self._thread,
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def span(self, name: str, category: str, args: Optional[dict] = None) -> "_Span":
+        return _Span(self, name, category, args)
+
+    def write(self, directory: Path = DEFAULT_TRACES_DIR) -> Path:
+        """Записать trace теста в Chrome trace event format."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", self.test_id).strip("_")[:200] or "test"
+        path = directory / f"{name}.json"
+        data = {
+            "traceEvents": sorted(self.events, key=lambda e: e["ts"]),
+            "displayTimeUnit": "ms",
+            "otherData": {"test": self.test_id},
+        }
+        path.write_text(json.dumps(data), encoding="utf-8")
+        return path
+
+
+class _Span:
+    def __init__(self, tracer: ActionTracer, name: str, category: str, args: Optional[dict]):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.tracer.begin(self.name)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        args = dict(self.args or {})
+        if exc_type is not None:
+            args["error"] = exc_type.__name__
+        self.tracer.end(self.category, args)
+        return False
+
+
+def _current() -> Optional[ActionTracer]:
+    tracer = _active
+    if tracer is not None and tracer.owns_thread():
+        return tracer
+    return None
+
+
+def _traced(func, category: str, name_of):
+    """Обернуть функцию: интервал с именем name_of(args, kwargs) при активном трассировщике."""
+    if getattr(func, _TRACED, False):
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        tracer = _current()
+        if tracer is None:
+            return func(*args, **kwargs)
+        with tracer.span(name_of(args, kwargs), category):
+            return func(*args, **kwargs)
+
+    setattr(wrapper, _TRACED, True)
+    return wrapper
+
+
+def _all_subclasses(cls) -> list:
+    result = [cls]
+    for sub in cls.__subclasses__():
+        result.extend(_all_subclasses(sub))
+    return result
+
+
+def instrument_page_objects(base_class) -> None:
+    """Обернуть публичные методы base_class и всех его подклассов."""
+    for cls in _all_subclasses(base_class):
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or not callable(value) or isinstance(value, (staticmethod, classmethod, type)):
+                continue
+            qualname = attr
+            setattr(cls, attr, _traced(
+                value, "page",
+                lambda args, kwargs, qualname=qualname: f"{type(args[0]).__name__}.{qualname}"
+            ))
+
+
+def install_tracing(base_class) -> None:
+    """
+    Поставить инструментирование процесса (один раз): Page Object,
+    WebDriverWait.until/until_not, time.sleep, requests.Session.request.
+    """
+    global _installed
+    if _installed:
+        return
+    _installed = True
+
+    instrument_page_objects(base_class)
+
+    from selenium.webdriver.support.ui import WebDriverWait
+    for method in ("until", "until_not"):
+        setattr(WebDriverWait, method, _traced(
+            getattr(WebDriverWait, method), "wait",
+            lambda args, kwargs, method=method: f"WebDriverWait.{method}"
+        ))
+
+    time.sleep = _traced(_original_sleep, "sleep", lambda args, kwargs: "time.sleep")
+
+    try:
+        import requests
+    except ImportError:
+        return
+    requests.Session.request = _traced(requests.Session.request, "http", _http_span_name)
+
+
+def _http_span_name(args, kwargs) -> str:
+    """Session.request(self, method, url, ...): "HTTP POST /api/login"."""
+    method = kwargs.get("method", args[1] if len(args) > 1 else "?")
+    url = kwargs.get("url", args[2] if len(args) > 2 else "")
+    path = re.sub(r"^https?://[^/]+", "", str(url)).split("?")[0]
+    return f"HTTP {str(method).upper()} {path or '/'}"
+
+
+def instrument_driver(driver) -> None:
+    """Обернуть command_executor.execute драйвера: каждая команда WebDriver - интервал."""
+    if getattr(driver, _DRIVER_MARK, False):
+        return
+    executor = driver.command_executor
+    executor.execute = _traced(executor.execute, "webdriver", lambda args, kwargs: f"wd:{args[0]}")
+    setattr(driver, _DRIVER_MARK, True)
+
+
+def start_trace(test_id: str) -> ActionTracer:
+    """Начать трассировку теста в текущем потоке."""
+    global _active
+    _active = ActionTracer(test_id)
+    _active.begin(_stack_name(test_id))
+    return _active
+
+
+def stop_trace() -> Optional[ActionTracer]:
+    """Закончить трассировку текущего теста."""
+    global _active
+    tracer = _active
+    _active = None
+    if tracer is not None:
+        while tracer._stack:
+            tracer.end("test")
+    return tracer
+
+
+def append_collapsed(tracer: ActionTracer, path: Path) -> None:
+    """Дописать собственное время стеков теста (в мкс) в файл collapsed stacks."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        for stack, value in tracer.self_time.items():
+            if value >= 1:
+                f.write(";".join(_stack_name(frame) for frame in stack) + f" {int(value)}\n")
+
+
+def merge_collapsed(directory: Path, target_name: str = "collapsed.txt") -> Optional[Path]:
+    """
+    Объединить файлы collapsed-*.txt процессов (воркеров xdist) в один,
+    суммируя одинаковые стеки.
+    """
+    directory = Path(directory)
+    parts = sorted(directory.glob("collapsed-*.txt"))
+    if not parts:
+        return None
+    totals: Dict[str, int] = defaultdict(int)
+    for part in parts:
+        for line in part.read_text(encoding="utf-8").splitlines():
+            stack, _, value = line.rpartition(" ")
+            if stack and value.isdigit():
+                totals[stack] += int(value)
+        part.unlink()
+    target = directory / target_name
+    with open(target, "w", encoding="utf-8") as f:
+        for stack, value in sorted(totals.items()):
+            f.write(f"{stack} {value}\n")
+    return target
@@ -0,0 +1,167 @@
+"""
+Статистика явных ожиданий: какие локаторы и ожидания стоят suite больше всего.
+
+Каждый WebDriverWait из BasePage._wait - это RecordedWait: при включённой
+статистике (--wait-stats) until/until_not записывают метод Page Object,
+локатор, исход и затраченное время.
+
+Исходы:
+    hit      - условие выполнилось
+    negative - подтверждено отсутствие (invisibility/staleness, until_not)
+    timeout  - бюджет исчерпан
+
+Ожидание, которое ни разу не выполнилось (все вызовы - timeout), помечается:
+обычно это отрицательная проверка через полный таймаут, например
+is_element_visible(..., timeout=3) там, где элемента быть не должно.
+"""
+import sys
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+
+# Условия EC, успех которых означает отсутствие элемента
+_NEGATIVE_CONDITIONS = ("invisibility_of", "staleness_of")
+
+TOP_N = 50
+
+DEFAULT_STATS_PATH = Path(__file__).resolve().parent.parent / "artifacts" / "wait-stats.json"
+
+
+def _condition_name(method) -> str:
+    """'visibility_of_element_located.<locals>._predicate' -> 'visibility_of_element_located'."""
+    name = getattr(method, "__qualname__", None) or type(method).__name__
+    return name.split(".<locals>")[0]
+
+
+def format_target(locator) -> str:
+    """Локатор (By, value) -> 'css selector=.auction-card'."""
+    if isinstance(locator, tuple) and len(locator) == 2:
+        return f"{locator[0]}={locator[1]}"
+    return str(locator)
+
+
+class WaitStats:
+    """Агрегат ожиданий по ключу (метод, локатор) за сессию процесса."""
+
+    def __init__(self):
+        self.entries: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def record(self, kind: str, target: str, outcome: str, seconds: float) -> None:
+        key = f"{kind} {target}"
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = self.entries[key] = {
+                    "kind": kind, "target": target, "calls": 0,
+                    "hit": 0, "negative": 0, "timeout": 0,
+                    "total": 0.0, "max": 0.0, "timeout_total": 0.0,
+                }
+            entry["calls"] += 1
+            entry[outcome] += 1
+            entry["total"] += seconds
+            entry["max"] = max(entry["max"], seconds)
+            if outcome == "timeout":
+                entry["timeout_total"] += seconds
+
+    def merge(self, entries: Dict[str, dict]) -> None:
+        """Добавить статистику другого процесса (воркера xdist)."""
+        with self._lock:
+            for key, other in entries.items():
+                entry = self.entries.get(key)
+                if entry is None:
+                    self.entries[key] = dict(other)
+                    continue
+                for field in ("calls", "hit", "negative", "timeout", "total", "timeout_total"):
+                    entry[field] += other[field]
+                entry["max"] = max(entry["max"], other["max"])
+
+    def load(self, path: Path) -> None:
+        """Добавить статистику из файла воркера."""
+        self.merge(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def write(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.entries, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    def top(self, n: int = TOP_N) -> List[dict]:
+        """Самые дорогие ожидания по суммарному времени."""
+        return sorted(self.entries.values(), key=lambda e: e["total"], reverse=True)[:n]
+
+    def format_lines(self, n: int = TOP_N) -> List[str]:
+        """Таблица для сводки pytest."""
+        lines = [
+            f"{'всего, с':>9} {'макс, с':>8} {'вызовов':>7} {'hit':>5} {'neg':>5} {'t/o':>5}  ожидание"
+        ]
+        for entry in self.top(n):
+            flag = "  ⚠ всегда таймаут" if entry["timeout"] == entry["calls"] else ""
+            lines.append(
+                f"{entry['total']:9.2f} {entry['max']:8.2f} {entry['calls']:7d} "
+                f"{entry['hit']:5d} {entry['negative']:5d} {entry['timeout']:5d}  "
+                f"{entry['kind']} {entry['target']}{flag}"
+            )
+        return lines
+
+
+_stats: Optional[WaitStats] = None
+
+
+def enable_wait_stats() -> WaitStats:
+    """Включить сбор статистики в процессе."""
+    global _stats
+    if _stats is None:
+        _stats = WaitStats()
+    return _stats
+
+
+def get_wait_stats() -> Optional[WaitStats]:
+    """Статистика процесса или None, если сбор выключен."""
+    return _stats
+
+
+class RecordedWait(WebDriverWait):
+    """
+    WebDriverWait, который записывает ожидание в WaitStats.
+    Метод Page Object берётся из кадра, вызвавшего until/until_not.
+    """
+
+    def __init__(self, driver, timeout: float, poll_frequency: float, locator=None):
+        super().__init__(driver, timeout, poll_frequency=poll_frequency)
+        self.locator = locator
+
+    def _record(self, kind: str, method, outcome: str, started: float) -> None:
+        target = format_target(self.locator) if self.locator is not None else _condition_name(method)
+        _stats.record(kind, target, outcome, time.monotonic() - started)
+
+    def until(self, method, message: str = ""):
+        if _stats is None:
+            return super().until(method, message)
+        kind = sys._getframe(1).f_code.co_name
+        started = time.monotonic()
+        try:
+            value = super().until(method, message)
+        except TimeoutException:
+            self._record(kind, method, "timeout", started)
+            raise
+        negative = _condition_name(method).startswith(_NEGATIVE_CONDITIONS)
+        self._record(kind, method, "negative" if negative else "hit", started)
+        return value
+
+    def until_not(self, method, message: str = ""):
+        if _stats is None:
+            return super().until_not(method, message)
+        kind = sys._getframe(1).f_code.co_name
+        started = time.monotonic()
+        try:
+            value = super().until_not(method, message)
+        except TimeoutException:
+            self._record(kind, method, "timeout", started)
+            raise
+        self._record(kind, method, "negative", started)
+        return value
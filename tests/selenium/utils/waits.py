@@ -0,0 +1,94 @@
+"""
+Ожидание реальных состояний страницы вместо фиксированных time.sleep.
+
+- сеть: трекер незавершённых fetch/XHR/WebSocket (utils/network_tracker.py)
+- рендер: два requestAnimationFrame (Vue успевает применить изменения и отрисовать кадр)
+- DOM: MutationObserver, ждём паузу без мутаций
+
+Все функции возвращают False по таймауту вместо исключения - они заменяют
+sleep, а проверку результата делает сам тест.
+"""
+import time
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import (
+    NoAlertPresentException,
+    TimeoutException,
+    UnexpectedAlertPresentException
+)
+from utils.network_tracker import install_network_tracker, wait_for_network_idle
+
+
+# Два кадра: изменения реактивного состояния применены и отрисованы
+RENDER_TICK_JS = """
+const done = arguments[arguments.length - 1];
+requestAnimationFrame(() => requestAnimationFrame(() => done(true)));
+// Во вкладке в фоне rAF не вызывается
+setTimeout(() => done(true), 1000);
+"""
+
+# Пауза в мутациях DOM длиной quietMs (или false по таймауту)
+DOM_STABLE_JS = """
+const quietMs = arguments[0];
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+let quietTimer = null;
+let hardTimer = null;
+const observer = new MutationObserver(() => {
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(() => finish(true), quietMs);
+});
+function finish(result) {
+    observer.disconnect();
+    clearTimeout(quietTimer);
+    clearTimeout(hardTimer);
+    done(result);
+}
+observer.observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+quietTimer = setTimeout(() => finish(true), quietMs);
+hardTimer = setTimeout(() => finish(false), timeoutMs);
+"""
+
+
+def is_alert_present(driver: WebDriver) -> bool:
+    """Проверить, открыт ли alert (не закрывая его)."""
+    try:
+        driver.switch_to.alert
+        return True
+    except NoAlertPresentException:
+        return False
+
+
+def wait_for_render(driver: WebDriver) -> bool:
+    """Дождаться отрисовки двух кадров (не дольше секунды)."""
+    if is_alert_present(driver):
+        return True
+    try:
+        return bool(driver.execute_async_script(RENDER_TICK_JS))
+    except (TimeoutException, UnexpectedAlertPresentException):
+        return False
+
+
+def wait_for_dom_stable(driver: WebDriver, quiet_ms: int = 200, timeout: float = 10) -> bool:
+    """Дождаться, пока DOM не меняется в течение quiet_ms."""
+    if is_alert_present(driver):
+        return True
+    try:
+        # Скрипт сам завершится по timeout (script timeout драйвера - 30 с)
+        return bool(driver.execute_async_script(DOM_STABLE_JS, quiet_ms, int(timeout * 1000)))
+    except (TimeoutException, UnexpectedAlertPresentException):
+        return False
+
+
+def wait_for_page_settled(driver: WebDriver, timeout: float = 10) -> bool:
+    """
+    Дождаться, пока страница успокоится: сеть простаивает, DOM не меняется,
+    кадр отрисован. Общий бюджет - timeout секунд.
+    """
+    deadline = time.monotonic() + timeout
+
+    def remaining() -> float:
+        return max(0.1, deadline - time.monotonic())
+
+    settled = wait_for_network_idle(driver, timeout=remaining())
+    settled = wait_for_dom_stable(driver, timeout=remaining()) and settled
+    return wait_for_render(driver) and settled